@@ -8,7 +8,6 @@ aaajiao 作品集抓取工具 - Streamlit GUI
 - 图片整合工具
 """
 
-import json
 import os
 import time
 
@@ -16,6 +15,7 @@ import pandas as pd
 import streamlit as st
 
 from scraper import AaajiaoScraper, is_artwork
+from scraper.core import json_loads
 from scraper.paths import OUTPUT_DIR, PORTFOLIO_MARKDOWN_PATH, REPORTS_DIR, WORKS_JSON_PATH
 
 # 页面配置
@@ -35,10 +35,9 @@ st.markdown("自动从 eventstructure.com 抓取作品详情")
 def load_existing_works() -> list:
     """从 JSON 文件加载已有作品。"""
     try:
-        with WORKS_JSON_PATH.open("r", encoding="utf-8") as f:
-            works = json.load(f)
-            # 过滤掉展览（以防旧数据包含）
-            return [w for w in works if is_artwork(w)]
+        works = json_loads(WORKS_JSON_PATH.read_bytes())
+        # 过滤掉展览（以防旧数据包含）
+        return [w for w in works if is_artwork(w)]
     except FileNotFoundError:
         return []
 
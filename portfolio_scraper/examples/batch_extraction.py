@@ -29,14 +29,17 @@ def main():
     
     # 2. 批量提取（使用 agent_search）
     # 这比逐个调用 extract_work_details 更高效
+    # use_async=True: 安装 aiohttp 时在单个事件循环中并发提交，否则回退到线程池
     print("🔄 批量提取中...")
     print("   提取级别：Quick（快速模式）")
-    print("   启用缓存：是\n")
+    print("   启用缓存：是")
+    print(f"   并发：{scraper.max_workers}（asyncio + aiohttp）\n")
     
     result = scraper.agent_search(
         prompt="提取所有作品的基本信息：标题、年份、类型",
         urls=work_urls[:10],  # 先处理前10个作为示例
-        extraction_level="quick"
+        extraction_level="quick",
+        use_async=True,
     )
     
     # 3. 查看结果
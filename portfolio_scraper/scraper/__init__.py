@@ -1,21 +1,20 @@
-import json
 import concurrent.futures
 from typing import Any, Callable, Dict, List, Optional
 
-from .core import CoreScraper, RateLimiter, deduplicate_works
 from .basic import (
+    EXCLUDED_TYPES,
     BasicScraperMixin,
     is_artwork,
+    is_extraction_complete,
     normalize_year,
     parse_size_duration,
-    is_extraction_complete,
-    EXCLUDED_TYPES,
 )
-from .firecrawl import FirecrawlMixin
 from .cache import CacheMixin
-from .report import ReportMixin
-from .constants import CACHE_DIR, PROMPT_TEMPLATES, QUICK_SCHEMA, FULL_SCHEMA
+from .constants import BATCH_SCRAPE_SIZE, CACHE_DIR, FULL_SCHEMA, PROMPT_TEMPLATES, QUICK_SCHEMA
+from .core import CoreScraper, RateLimiter, deduplicate_works, intern_categorical_fields
+from .firecrawl import FirecrawlMixin
 from .paths import PORTFOLIO_MARKDOWN_PATH, WORKS_JSON_PATH
+from .report import ReportMixin
 
 
 def _clean_cross_contamination(works: List[Dict[str, Any]]) -> int:
@@ -160,14 +159,27 @@ class AaajiaoScraper(CoreScraper, BasicScraperMixin, FirecrawlMixin, CacheMixin,
     QUICK_SCHEMA = QUICK_SCHEMA
     FULL_SCHEMA = FULL_SCHEMA
 
-    def __init__(self, use_cache: bool = True):
-        super().__init__(use_cache=use_cache)
+    def __init__(
+        self,
+        use_cache: bool = True,
+        max_workers: Optional[int] = None,
+        calls_per_minute: Optional[int] = None,
+        cache_ttl_hours: Optional[float] = None,
+    ):
+        super().__init__(
+            use_cache=use_cache,
+            max_workers=max_workers,
+            calls_per_minute=calls_per_minute,
+            cache_ttl_hours=cache_ttl_hours,
+        )
 
     def run_full_pipeline(
         self,
         incremental: bool = True,
-        max_workers: int = 4,
+        max_workers: Optional[int] = None,
         progress_callback: Optional[Callable[[str, float], None]] = None,
+        use_batch: bool = False,
+        batch_size: int = BATCH_SCRAPE_SIZE,
     ) -> Dict[str, Any]:
         """Run the complete scraping pipeline: fetch → extract → filter → save.
 
@@ -181,9 +193,15 @@ class AaajiaoScraper(CoreScraper, BasicScraperMixin, FirecrawlMixin, CacheMixin,
             incremental: If True, only process new/updated URLs based on sitemap lastmod.
                 Defaults to True.
             max_workers: Number of concurrent workers for extraction.
-                Defaults to 4.
+                Defaults to ``self.max_workers``.
             progress_callback: Optional callback function(message: str, progress: float).
                 Progress is a float from 0.0 to 1.0.
+            use_batch: If True, extract cache misses with one batch-scrape job
+                per chunk (as ``extract_works_batch`` does) instead of one request per
+                URL. Fewer round-trips, but skips the BS4 cross-check.
+                Defaults to False.
+            batch_size: URLs per batch-scrape job when ``use_batch`` is set.
+                Defaults to ``BATCH_SCRAPE_SIZE``.
 
         Returns:
             Dictionary with:
@@ -205,6 +223,8 @@ class AaajiaoScraper(CoreScraper, BasicScraperMixin, FirecrawlMixin, CacheMixin,
             if progress_callback:
                 progress_callback(msg, pct)
 
+        max_workers = max_workers or self.max_workers
+
         stats = {
             "urls_found": 0,
             "extracted": 0,
@@ -216,7 +236,12 @@ class AaajiaoScraper(CoreScraper, BasicScraperMixin, FirecrawlMixin, CacheMixin,
 
         # ===== Step 1: Get URLs =====
         _progress("Fetching sitemap...", 0.0)
-        urls = self.get_all_work_links(incremental=incremental)
+        # The sitemap fetch is pure network I/O; open the cache store meanwhile
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as prefetch:
+            links_future = prefetch.submit(self.get_all_work_links, incremental=incremental)
+            if self.use_cache:
+                self._cache_db()
+            urls = links_future.result()
         stats["urls_found"] = len(urls)
 
         if not urls:
@@ -224,10 +249,9 @@ class AaajiaoScraper(CoreScraper, BasicScraperMixin, FirecrawlMixin, CacheMixin,
             # Load existing works if incremental mode found nothing new
             if incremental:
                 try:
-                    with WORKS_JSON_PATH.open("r", encoding="utf-8") as f:
-                        self.works = json.load(f)
-                        stats["total"] = len(self.works)
-                        stats["from_cache"] = len(self.works)
+                    self.works = self.load_from_json()
+                    stats["total"] = len(self.works)
+                    stats["from_cache"] = len(self.works)
                 except FileNotFoundError:
                     pass
 
@@ -246,53 +270,96 @@ class AaajiaoScraper(CoreScraper, BasicScraperMixin, FirecrawlMixin, CacheMixin,
         _progress(f"Found {len(urls)} URLs to process", 0.1)
 
         # ===== Step 2: Concurrent Extraction =====
+        # Workers only return values; results and stats are mutated solely on
+        # this thread (inline cache hits + as_completed), so no lock is needed.
+        # Keep it that way if collection ever moves into the worker.
         extracted_works: List[Dict[str, Any]] = []
-
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all jobs and build mapping
-            future_to_url = {}
+        completed = 0
+
+        def _record(url: str, data: Optional[Dict[str, Any]]) -> None:
+            """Record one finished URL. Must run on the pipeline thread."""
+            nonlocal completed
+            completed += 1
+            progress = 0.1 + 0.7 * (completed / len(urls))
+            if data:
+                extracted_works.append(data)
+                stats["extracted"] += 1
+                _progress(f"[{completed}/{len(urls)}] ✅ {data.get('title', 'Unknown')[:30]}", progress)
+            else:
+                # None means exhibition/catalog or failed
+                stats["skipped_exhibitions"] += 1
+                _progress(f"[{completed}/{len(urls)}] ⏭️ Skipped: {url.split('/')[-1][:30]}", progress)
+
+        def _record_failure(url: str) -> None:
+            """Record one failed URL. Must run on the pipeline thread."""
+            nonlocal completed
+            completed += 1
+            progress = 0.1 + 0.7 * (completed / len(urls))
+            stats["failed"] += 1
+            _progress(f"[{completed}/{len(urls)}] ❌ Failed: {url.split('/')[-1][:30]}", progress)
+
+        # One bulk cache read decides which URLs need the network
+        cached_works = self._load_cache_many(urls) if self.use_cache else {}
+        pending = [url for url in urls if not cached_works.get(url)]
+
+        if use_batch:
+            # One batch-scrape job per chunk of misses instead of one request per URL;
+            # the misses go straight to the network since the cache was read above
+            batch_results = self._extract_uncached_batch(pending, batch_size=batch_size)
             for url in urls:
-                future = executor.submit(self.extract_work_details_v2, url)
-                future_to_url[future] = url
-
-            completed = 0
-            for future in concurrent.futures.as_completed(future_to_url):
-                url = future_to_url[future]
-                completed += 1
-                progress = 0.1 + 0.7 * (completed / len(urls))
-
-                try:
-                    data = future.result()
-                    if data:
-                        extracted_works.append(data)
-                        stats["extracted"] += 1
-                        _progress(f"[{completed}/{len(urls)}] ✅ {data.get('title', 'Unknown')[:30]}", progress)
-                    else:
-                        # None means exhibition/catalog or failed
-                        stats["skipped_exhibitions"] += 1
-                        _progress(f"[{completed}/{len(urls)}] ⏭️ Skipped: {url.split('/')[-1][:30]}", progress)
-                except Exception as e:
-                    stats["failed"] += 1
-                    logger.error(f"Error extracting {url}: {e}")
-                    _progress(f"[{completed}/{len(urls)}] ❌ Failed: {url.split('/')[-1][:30]}", progress)
+                cached = cached_works.get(url)
+                if cached:
+                    stats["from_cache"] += 1
+                    _record(url, self._resolve_cached_work(url, cached))
+                    continue
+                data = batch_results.get(url)
+                if data is None:
+                    logger.error(f"Batch extraction failed for {url}")
+                    _record_failure(url)
+                else:
+                    _record(url, data if is_artwork(data) else None)
+        else:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                # Submit misses first so their network latency overlaps with
+                # resolving cache hits on this thread
+                future_to_url = {}
+                for url in pending:
+                    future = executor.submit(self.extract_work_details_v2, url)
+                    future_to_url[future] = url
+
+                for url in urls:
+                    cached = cached_works.get(url)
+                    if cached:
+                        stats["from_cache"] += 1
+                        _record(url, self._resolve_cached_work(url, cached))
+
+                for future in concurrent.futures.as_completed(future_to_url):
+                    url = future_to_url[future]
+                    try:
+                        data = future.result()
+                    except Exception as e:
+                        logger.error(f"Error extracting {url}: {e}")
+                        _record_failure(url)
+                        continue
+                    _record(url, data)
 
         # ===== Step 3: Merge with existing data (incremental mode) =====
         _progress("Merging and deduplicating...", 0.85)
 
         if incremental:
             try:
-                with WORKS_JSON_PATH.open("r", encoding="utf-8") as f:
-                    existing_works = json.load(f)
-                    # Merge: new works take precedence
-                    existing_urls = {w.get("url") for w in extracted_works}
-                    for work in existing_works:
-                        if work.get("url") not in existing_urls:
-                            extracted_works.append(work)
+                existing_works = self.load_from_json()
+                # Merge: new works take precedence
+                existing_urls = {w.get("url") for w in extracted_works}
+                for work in existing_works:
+                    if work.get("url") not in existing_urls:
+                        extracted_works.append(work)
             except FileNotFoundError:
                 pass
 
         # Deduplicate
         self.works = deduplicate_works(extracted_works)
+        intern_categorical_fields(self.works)
 
         # ===== Step 3.5: Cross-contamination cleanup =====
         _progress("Checking for cross-contamination...", 0.88)
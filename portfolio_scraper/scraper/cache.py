@@ -2,26 +2,185 @@
 Caching mixin for the aaajiao scraper.
 
 This module provides caching functionality to minimize API calls and improve performance:
-- General cache: Basic URL-based caching using pickle
+- General cache: URL-keyed work data in a single SQLite key-value store
 - Sitemap cache: Stores sitemap lastmod timestamps for incremental updates
-- Extract cache: Prompt-specific caching for LLM extraction results
+- Extract cache: Prompt-specific caching for LLM extraction results (same store)
+- Agent cache: Open-ended agent search results keyed by query (same store)
 - Discovery cache: Caches discovered URLs from scroll operations
 
 All cache files are stored in the CACHE_DIR directory (.cache by default).
+Legacy per-URL ``.pkl`` files are still read, migrated into the store on
+first access and then removed. Store entries are timestamped and, when the
+scraper has a ``cache_ttl_hours`` set, treated as misses once they are older
+than that.
+
+Store values are plain JSON text. With ``CACHE_COMPRESS=1`` (and
+``zstandard`` installed) new values are zstd-compressed instead; both forms
+are read back transparently. Only enable it where every machine reading the
+cache has ``zstandard``: compressed rows cannot be decoded without it and
+are reported and treated as misses.
+
+When ``REDIS_URL`` is set (and ``redis`` is installed), store entries are
+also written to Redis and local misses are filled from it, so several
+machines share one set of Firecrawl results. Work entries in Redis are
+scoped to a hash of the extraction schemas, so a schema change starts a
+fresh shared set instead of serving entries in the old shape.
 """
 
+import contextlib
+import functools
 import hashlib
-import json
 import logging
 import os
 import pickle
+import sqlite3
+import threading
 import time
-from typing import Dict, Optional
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+try:
+    import redis
+except ImportError:  # Optional: pip install ".[redis]"
+    redis = None
+
+try:
+    import zstandard
+except ImportError:  # Optional: pip install ".[speedups]"
+    zstandard = None
 
-from .constants import CACHE_DIR
+from .constants import ARTWORK_JSON_SCHEMA, CACHE_DB_NAME, CACHE_DIR, LLM_EXTRACT_SCHEMA
+from .core import json_dumpb, json_dumps, json_loads
 
 logger = logging.getLogger(__name__)
 
+# One lock for all cache connections: sqlite serializes writers anyway, and
+# the connection is shared across extraction worker threads.
+_DB_LOCK = threading.Lock()
+
+# Keys per "IN (...)" query; stays under SQLite's default 999-variable limit.
+_SQL_BATCH = 500
+
+# Entries kept decoded in memory per scraper; older ones are re-read from SQLite
+_MEM_CACHE_SIZE = 2048
+
+# Namespace and expiry for entries mirrored to the shared Redis cache
+_REDIS_PREFIX = "fc:"
+_REDIS_DEFAULT_TTL = 30 * 24 * 3600
+
+# Seconds to wait on the shared cache before falling back to the local store
+_REDIS_TIMEOUT = 2
+
+# Compression level for store values and the frame magic used to detect them
+_ZSTD_LEVEL = 3
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# zstd (de)compressors are not thread-safe; keep one pair per worker thread
+_zstd_local = threading.local()
+
+# Compressed rows without zstandard are reported once per process, not per row
+_zstd_missing_reported = False
+
+
+class _LRUDict(OrderedDict):
+    """Dict holding at most ``maxsize`` entries, evicting the least recently used.
+
+    Lookups go through ``get``, which marks the entry as recently used.
+    Concurrent workers may race on eviction; the worst case is evicting
+    one entry too many, which only costs a store read.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        super().__init__()
+        self.maxsize = maxsize
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        try:
+            value = self[key]
+            self.move_to_end(key)
+        except KeyError:
+            return default
+        return value
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        while len(self) > self.maxsize:
+            try:
+                self.popitem(last=False)
+            except KeyError:
+                break
+
+
+@functools.lru_cache(maxsize=4096)
+def _hash_key(text: str) -> str:
+    """Hash text into a 32-char hex cache key (BLAKE2b, 128-bit).
+
+    Memoized: the same URL is hashed on every load/save during a run.
+    """
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+# Work entries are shaped by the extraction schemas. Their Redis names carry a
+# hash of both, so machines on different schema versions never share entries.
+_WORK_SCHEMA_HASH = _hash_key(json_dumps([ARTWORK_JSON_SCHEMA, LLM_EXTRACT_SCHEMA]))[:8]
+
+
+def _redis_key(key: str) -> str:
+    """Redis name for a store key.
+
+    Extract keys already include their prompt hash and agent keys their
+    query; work entries (bare URL hashes) are scoped by ``_WORK_SCHEMA_HASH``.
+    """
+    if key.startswith(("extract_", "agent_")):
+        return _REDIS_PREFIX + key
+    return f"{_REDIS_PREFIX}{_WORK_SCHEMA_HASH}:{key}"
+
+
+def _encode_value(data: Dict, compress: bool = False) -> Union[str, bytes]:
+    """Serialize a store value: JSON text, or zstd-compressed JSON bytes if ``compress``."""
+    if not compress or zstandard is None:
+        return json_dumps(data)
+    cctx = getattr(_zstd_local, "cctx", None)
+    if cctx is None:
+        cctx = _zstd_local.cctx = zstandard.ZstdCompressor(level=_ZSTD_LEVEL)
+    return cctx.compress(json_dumpb(data))
+
+
+def _decode_value(value: Union[str, bytes]) -> Optional[Dict]:
+    """Parse a store value written by ``_encode_value``.
+
+    Returns:
+        The decoded dictionary, or None for a compressed value when
+        ``zstandard`` is not installed (treated as a cache miss, with a
+        warning logged the first time).
+    """
+    global _zstd_missing_reported
+    if isinstance(value, bytes) and value.startswith(_ZSTD_MAGIC):
+        if zstandard is None:
+            if not _zstd_missing_reported:
+                _zstd_missing_reported = True
+                logger.warning(
+                    "⚠️ Cache holds zstd-compressed entries but zstandard is not installed; "
+                    "they will be re-extracted. Install it with: pip install \".[speedups]\""
+                )
+            return None
+        dctx = getattr(_zstd_local, "dctx", None)
+        if dctx is None:
+            dctx = _zstd_local.dctx = zstandard.ZstdDecompressor()
+        value = dctx.decompress(value)
+    return json_loads(value)
+
+
+@functools.lru_cache(maxsize=4096)
+def _legacy_hash(text: str) -> str:
+    """MD5 hex digest used to name pre-SQLite ``.pkl`` cache files.
+
+    Memoized like ``_hash_key``: bulk extract lookups derive the legacy
+    path of every URL from the same prompt.
+    """
+    return hashlib.md5(text.encode()).hexdigest()
+
 
 class CacheMixin:
     """Mixin providing caching functionality for scraper operations.
@@ -34,24 +193,357 @@ class CacheMixin:
     internal utilities.
     """
 
+    # ====================
+    # Key-Value Store
+    # ====================
+
+    def _cache_db(self) -> sqlite3.Connection:
+        """Return the SQLite cache connection, opening it on first use.
+
+        Returns:
+            Connection to ``CACHE_DIR/CACHE_DB_NAME`` in autocommit/WAL mode
+            with ``synchronous=NORMAL`` (no fsync per write).
+
+        Note:
+            Reopened if CACHE_DIR changes, so the store always lives next
+            to the other cache files.
+        """
+        db_path = os.path.join(CACHE_DIR, CACHE_DB_NAME)
+        conn = getattr(self, "_cache_conn", None)
+        if conn is not None and getattr(self, "_cache_conn_path", None) == db_path:
+            return conn
+
+        with _DB_LOCK:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            # WAL makes NORMAL crash-safe; only the last commits can be lost on power failure
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, updated_at REAL)"
+            )
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(cache)")}
+            if "updated_at" not in columns:
+                conn.execute("ALTER TABLE cache ADD COLUMN updated_at REAL")
+        self._cache_conn = conn
+        self._cache_conn_path = db_path
+        self._mem_cache = _LRUDict(_MEM_CACHE_SIZE)
+        # Legacy .pkl files are only ever read and then removed, so list them
+        # once here instead of stat()-ing a pickle path on every cache miss
+        self._legacy_pickles = {name for name in os.listdir(CACHE_DIR) if name.endswith(".pkl")}
+        return conn
+
+    def _redis_client(self) -> Optional[Any]:
+        """Return the shared Redis client, connecting on first use.
+
+        Returns:
+            A ``redis.Redis`` client when ``REDIS_URL`` is set and the
+            ``redis`` package is installed, otherwise None.
+        """
+        client = getattr(self, "_redis", False)
+        if client is not False:
+            return client
+
+        client = None
+        redis_url = os.getenv("REDIS_URL")
+        if redis_url and redis is None:
+            logger.info("REDIS_URL is set but redis is not installed, using local cache only")
+        elif redis_url:
+            try:
+                client = redis.Redis.from_url(
+                    redis_url,
+                    socket_connect_timeout=_REDIS_TIMEOUT,
+                    socket_timeout=_REDIS_TIMEOUT,
+                )
+            except Exception as e:
+                logger.warning(f"Redis cache unavailable: {e}")
+        self._redis = client
+        return client
+
+    def _redis_failed(self, error: Exception) -> None:
+        """Handle a failed Redis call.
+
+        Connection failures and timeouts switch the shared cache off for the
+        rest of the run, so an unreachable server costs one timeout instead
+        of one per lookup. Other errors are only logged.
+        """
+        if redis is not None and isinstance(error, (redis.ConnectionError, redis.TimeoutError)):
+            logger.warning(f"Redis cache unreachable, using local cache only: {error}")
+            self._redis = None
+        else:
+            logger.debug(f"Redis cache call failed: {error}")
+
+    def _compress_values(self) -> bool:
+        """Whether new store values are zstd-compressed (``CACHE_COMPRESS``).
+
+        Off by default so the store stays readable on machines without
+        ``zstandard``, such as the bundled macOS runtime.
+        """
+        enabled = getattr(self, "_compress", None)
+        if enabled is not None:
+            return enabled
+
+        enabled = os.getenv("CACHE_COMPRESS", "").strip().lower() in ("1", "true", "yes")
+        if enabled and zstandard is None:
+            logger.info("CACHE_COMPRESS is set but zstandard is not installed, storing plain JSON")
+            enabled = False
+        self._compress = enabled
+        return enabled
+
+    def _redis_ttl(self) -> int:
+        """Expiry in seconds for Redis entries (``cache_ttl_hours`` or 30 days)."""
+        ttl_hours = getattr(self, "cache_ttl_hours", None)
+        return int(ttl_hours * 3600) if ttl_hours else _REDIS_DEFAULT_TTL
+
+    def _redis_get_many(self, keys: List[str]) -> Dict[str, Tuple[Dict, Optional[float]]]:
+        """Fetch entries from Redis and copy them into the local store.
+
+        Args:
+            keys: Store keys missing locally.
+
+        Returns:
+            Dictionary mapping found keys to ``(data, updated_at)``.
+            Empty if Redis is not configured or unreachable.
+        """
+        client = self._redis_client()
+        if client is None or not keys:
+            return {}
+        try:
+            values = client.mget([_redis_key(key) for key in keys])
+        except Exception as e:
+            self._redis_failed(e)
+            return {}
+
+        found: Dict[str, Tuple[Dict, Optional[float]]] = {}
+        for key, value in zip(keys, values):
+            if value is None:
+                continue
+            entry = json_loads(value)
+            data, updated_at = entry["data"], entry.get("updated_at")
+            self._db_put(key, data, updated_at=updated_at, mirror=False)
+            found[key] = (data, updated_at)
+        return found
+
+    def _is_expired(self, updated_at: Optional[float]) -> bool:
+        """Check a cache entry's age against ``cache_ttl_hours``.
+
+        Args:
+            updated_at: Unix timestamp the entry was written, or None if
+                unknown (rows written before timestamps were recorded).
+
+        Returns:
+            False when no TTL is configured; otherwise True if the entry is
+            older than the TTL or its age is unknown.
+        """
+        ttl_hours = getattr(self, "cache_ttl_hours", None)
+        if not ttl_hours:
+            return False
+        return updated_at is None or (time.time() - updated_at) > ttl_hours * 3600
+
+    def _db_entry(self, key: str) -> Optional[Tuple[Dict, Optional[float]]]:
+        """Read a raw store entry, expired or not.
+
+        Returns:
+            ``(data, updated_at)`` for the key, or None if the store has no
+            entry for it. ``data`` is shared with the memory cache and must
+            not be mutated.
+
+        Note:
+            Values recently read or written by this instance are served from
+            an in-process LRU (``_MEM_CACHE_SIZE`` entries), so repeated lookups
+            skip SQLite and JSON decoding.
+        """
+        conn = self._cache_db()
+        entry = self._mem_cache.get(key)
+        if entry is not None:
+            return entry
+        with _DB_LOCK:
+            row = conn.execute(
+                "SELECT value, updated_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+        data = _decode_value(row[0]) if row else None
+        if data is None:
+            return self._redis_get_many([key]).get(key)
+        entry = (data, row[1])
+        self._mem_cache[key] = entry
+        return entry
+
+    def _db_get(self, key: str) -> Optional[Dict]:
+        """Read a JSON value from the cache store, or None if absent or expired.
+
+        Callers get a shallow copy and may mutate it freely.
+        """
+        entry = self._db_entry(key)
+        if entry is None or self._is_expired(entry[1]):
+            return None
+        return dict(entry[0])
+
+    def _load_entry(self, key: str, legacy_path: Callable[[], str]) -> Optional[Dict]:
+        """Load a store entry, migrating its legacy ``.pkl`` file if it has none.
+
+        Args:
+            key: Store key.
+            legacy_path: Returns the legacy ``.pkl`` path for the entry; only
+                called when the store has no entry for ``key``.
+
+        Returns:
+            A copy of the unexpired data, or None.
+
+        Note:
+            An expired entry is a miss: the legacy file is older than
+            anything written to the store, so it is not migrated over it.
+        """
+        try:
+            entry = self._db_entry(key)
+            if entry is not None:
+                data, updated_at = entry
+                return None if self._is_expired(updated_at) else dict(data)
+        except Exception as e:
+            logger.debug(f"Cache load failed: {e}")
+
+        if not self._has_legacy_cache():
+            return None
+        return self._migrate_legacy_pickle(key, legacy_path())
+
+    def _db_put(
+        self, key: str, data: Dict, updated_at: Optional[float] = None, mirror: bool = True
+    ) -> None:
+        """Write a JSON value to the cache store (insert or replace).
+
+        Args:
+            key: Store key.
+            data: Dictionary to store.
+            updated_at: Entry timestamp. Defaults to now.
+            mirror: Also write the entry to Redis when configured.
+                Defaults to True.
+        """
+        self._db_put_many([(key, data)], updated_at=updated_at, mirror=mirror)
+
+    def _db_put_many(
+        self,
+        entries: List[Tuple[str, Dict]],
+        updated_at: Optional[float] = None,
+        mirror: bool = True,
+    ) -> None:
+        """Write several values to the cache store in one transaction.
+
+        The connection is in autocommit mode, so separate ``_db_put`` calls
+        each pay a commit; batching results from one fan-out pays it once.
+
+        Args:
+            entries: ``(key, data)`` pairs to store.
+            updated_at: Timestamp for every entry. Defaults to now.
+            mirror: Also write the entries to Redis when configured.
+                Defaults to True.
+        """
+        if not entries:
+            return
+        if updated_at is None:
+            updated_at = time.time()
+        compress = self._compress_values()
+        rows = [(key, _encode_value(data, compress), updated_at) for key, data in entries]
+        conn = self._cache_db()
+        with _DB_LOCK:
+            conn.execute("BEGIN")
+            try:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO cache (key, value, updated_at) VALUES (?, ?, ?)",
+                    rows,
+                )
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        for key, data in entries:
+            self._mem_cache[key] = (dict(data), updated_at)
+
+        client = self._redis_client() if mirror else None
+        if client is not None:
+            ttl = self._redis_ttl()
+            try:
+                # One round trip for the whole batch instead of one per entry
+                pipe = client.pipeline(transaction=False)
+                for key, data in entries:
+                    pipe.setex(
+                        _redis_key(key),
+                        ttl,
+                        json_dumps({"data": data, "updated_at": updated_at}),
+                    )
+                pipe.execute()
+            except Exception as e:
+                self._redis_failed(e)
+
+    def _has_legacy_cache(self) -> bool:
+        """Whether CACHE_DIR holds ``.pkl`` files that have not been migrated.
+
+        Callers check this before deriving legacy paths, so misses on a
+        migrated cache skip both the MD5 hash and the file probe.
+        """
+        return bool(getattr(self, "_legacy_pickles", True))
+
+    def _load_legacy_pickle(self, cache_path: str) -> Optional[Dict]:
+        """Read a pre-SQLite ``.pkl`` cache file if it exists.
+
+        Only files listed when the store opened and not yet migrated are
+        opened, so a few leftover pickles don't cost every miss a file probe.
+        """
+        legacy = getattr(self, "_legacy_pickles", None)
+        if legacy is not None and os.path.basename(cache_path) not in legacy:
+            return None
+        try:
+            # One read of the whole file; pickle.load would issue many small reads
+            with open(cache_path, "rb") as f:
+                return pickle.loads(f.read())
+        except Exception:
+            return None
+
+    def _migrate_legacy_pickle(self, key: str, cache_path: str) -> Optional[Dict]:
+        """Copy a legacy ``.pkl`` entry into the store under ``key``.
+
+        The file's mtime becomes the entry timestamp, so the TTL applies to
+        migrated entries as well. The file is removed once the entry is
+        stored, so a fully migrated cache stops deriving legacy paths.
+
+        Returns:
+            The migrated data, or None if there is no legacy file or it has
+            expired.
+        """
+        data = self._load_legacy_pickle(cache_path)
+        if data is None:
+            return None
+        updated_at = os.path.getmtime(cache_path)
+        try:
+            self._db_put(key, data, updated_at=updated_at)
+        except Exception as e:
+            logger.debug(f"Cache migration failed: {e}")
+        else:
+            with contextlib.suppress(OSError):
+                os.remove(cache_path)
+            getattr(self, "_legacy_pickles", set()).discard(os.path.basename(cache_path))
+        return None if self._is_expired(updated_at) else data
+
     # ====================
     # General Cache
     # ====================
 
+    def _get_cache_key(self, url: str) -> str:
+        """Generate the cache store key for a URL (BLAKE2b of the URL)."""
+        return _hash_key(url)
+
     def _get_cache_path(self, url: str) -> str:
-        """Generate cache file path for a given URL.
+        """Generate the legacy pickle cache file path for a given URL.
         
         Args:
             url: The URL to generate cache path for.
             
         Returns:
-            Absolute path to the cache file.
+            Path to the legacy ``.pkl`` cache file.
             
         Note:
-            Uses MD5 hash of URL to create a unique filename.
+            Only used to migrate caches written before the SQLite store.
         """
-        url_hash = hashlib.md5(url.encode()).hexdigest()
-        return os.path.join(CACHE_DIR, f"{url_hash}.pkl")
+        return os.path.join(CACHE_DIR, f"{_legacy_hash(url)}.pkl")
 
     def _load_cache(self, url: str) -> Optional[Dict]:
         """Load cached data for a URL.
@@ -63,16 +555,85 @@ class CacheMixin:
             Cached data dictionary if found and valid, None otherwise.
             
         Note:
-            Silently returns None if cache doesn't exist or is corrupted.
+            Silently returns None if cache doesn't exist, is corrupted or is
+            older than ``cache_ttl_hours``. When the store has no entry for
+            the URL, falls back to a legacy ``.pkl`` file and migrates it.
         """
-        cache_path = self._get_cache_path(url)
-        if os.path.exists(cache_path):
-            try:
-                with open(cache_path, "rb") as f:
-                    return pickle.load(f)
-            except Exception:
-                pass
-        return None
+        return self._load_entry(self._get_cache_key(url), lambda: self._get_cache_path(url))
+
+    def _load_many(self, keys: Dict[str, str], legacy_path: Callable[[str], str]) -> Dict[str, Dict]:
+        """Load many store entries with batched reads.
+
+        Keys missing from the in-process memo are fetched with one
+        ``IN (...)`` query per ``_SQL_BATCH`` keys instead of one query each,
+        then from Redis when configured.
+
+        Args:
+            keys: Mapping of store key to the URL it belongs to.
+            legacy_path: Returns the legacy ``.pkl`` path for a URL; only
+                called for keys absent from the store.
+
+        Returns:
+            Dictionary mapping each cached (and unexpired) URL to a copy of
+            its data. URLs without a usable entry are omitted.
+        """
+        # Collected locally: a bulk load larger than the memory cache would
+        # otherwise evict its own first entries before they are returned
+        entries: Dict[str, Tuple[Dict, Optional[float]]] = {}
+        try:
+            conn = self._cache_db()
+            missing: List[str] = []
+            for key in keys:
+                entry = self._mem_cache.get(key)
+                if entry is None:
+                    missing.append(key)
+                else:
+                    entries[key] = entry
+            for start in range(0, len(missing), _SQL_BATCH):
+                chunk = missing[start:start + _SQL_BATCH]
+                placeholders = ",".join("?" * len(chunk))
+                with _DB_LOCK:
+                    rows = conn.execute(
+                        f"SELECT key, value, updated_at FROM cache WHERE key IN ({placeholders})",
+                        chunk,
+                    ).fetchall()
+                for key, value, updated_at in rows:
+                    data = _decode_value(value)
+                    if data is not None:
+                        entries[key] = self._mem_cache[key] = (data, updated_at)
+            entries.update(self._redis_get_many([key for key in missing if key not in entries]))
+        except Exception as e:
+            logger.debug(f"Bulk cache load failed: {e}")
+
+        found: Dict[str, Dict] = {}
+        for key, url in keys.items():
+            entry = entries.get(key)
+            if entry is not None:
+                data, updated_at = entry
+                if not self._is_expired(updated_at):
+                    found[url] = dict(data)
+                continue
+            if not self._has_legacy_cache():
+                continue
+            data = self._migrate_legacy_pickle(key, legacy_path(url))
+            if data is not None:
+                found[url] = data
+        return found
+
+    def _load_cache_many(self, urls: List[str]) -> Dict[str, Dict]:
+        """Load cached data for many URLs with batched store reads.
+
+        Equivalent to calling ``_load_cache`` per URL.
+
+        Args:
+            urls: URLs to look up. Duplicates are fine.
+
+        Returns:
+            Dictionary mapping each cached (and unexpired) URL to a copy of
+            its data. URLs without a usable entry are omitted.
+        """
+        keys = {self._get_cache_key(url): url for url in urls}
+        return self._load_many(keys, self._get_cache_path)
 
     def _save_cache(self, url: str, data: Dict) -> None:
         """Save data to cache for a URL.
@@ -84,13 +645,44 @@ class CacheMixin:
         Note:
             Failures are logged at debug level and silently ignored.
         """
-        cache_path = self._get_cache_path(url)
         try:
-            with open(cache_path, "wb") as f:
-                pickle.dump(data, f)
+            self._db_put(self._get_cache_key(url), data)
         except Exception as e:
             logger.debug(f"Cache save failed: {e}")
 
+    def _load_all_cached_entries(self) -> List[Dict[str, Any]]:
+        """Load every general (non-extract) cache entry.
+
+        Returns:
+            List of cached dictionaries from the store plus any legacy
+            ``.pkl`` files that have not been migrated yet.
+        """
+        entries: Dict[str, Dict[str, Any]] = {}
+
+        try:
+            conn = self._cache_db()
+            with _DB_LOCK:
+                rows = conn.execute(
+                    "SELECT key, value FROM cache "
+                    "WHERE substr(key, 1, 8) != 'extract_' AND substr(key, 1, 6) != 'agent_'"
+                ).fetchall()
+            for key, value in rows:
+                data = _decode_value(value)
+                if data is not None:
+                    entries[data.get("url") or key] = data
+        except Exception as e:
+            logger.debug(f"Cache scan failed: {e}")
+
+        if os.path.exists(CACHE_DIR):
+            for filename in os.listdir(CACHE_DIR):
+                if not filename.endswith(".pkl") or filename.startswith(("extract_", "discovery_")):
+                    continue
+                data = self._load_legacy_pickle(os.path.join(CACHE_DIR, filename))
+                if isinstance(data, dict):
+                    entries.setdefault(data.get("url") or filename, data)
+
+        return list(entries.values())
+
     # ====================
     # Sitemap Cache
     # ====================
@@ -106,13 +698,11 @@ class CacheMixin:
             Used for incremental scraping to detect updated pages.
         """
         cache_path = os.path.join(CACHE_DIR, "sitemap_lastmod.json")
-        if os.path.exists(cache_path):
-            try:
-                with open(cache_path, "r", encoding="utf-8") as f:
-                    return json.load(f)
-            except Exception:
-                pass
-        return {}
+        try:
+            with open(cache_path, "rb") as f:
+                return json_loads(f.read())
+        except Exception:
+            return {}
 
     def _save_sitemap_cache(self, sitemap: Dict[str, str]) -> None:
         """Save sitemap lastmod timestamps cache.
@@ -126,7 +716,7 @@ class CacheMixin:
         cache_path = os.path.join(CACHE_DIR, "sitemap_lastmod.json")
         try:
             with open(cache_path, "w", encoding="utf-8") as f:
-                json.dump(sitemap, f, indent=2)
+                f.write(json_dumps(sitemap, indent=True))
         except Exception as e:
             logger.error(f"Sitemap cache save failed: {e}")
 
@@ -134,22 +724,33 @@ class CacheMixin:
     # Extract Cache (V2)
     # ====================
 
-    def _get_extract_cache_path(self, url: str, prompt_hash: str) -> str:
-        """Generate cache path for LLM extraction results.
+    def _get_extract_cache_key(self, url: str, prompt_hash: str) -> str:
+        """Generate the cache store key for an LLM extraction result.
         
         Args:
             url: The URL being extracted.
             prompt_hash: Hash of the extraction prompt.
             
         Returns:
-            Absolute path to the extract cache file.
+            Store key combining URL and prompt hashes.
             
         Note:
             Cache is keyed by both URL and prompt to handle different
             extraction modes (quick, full, custom).
         """
-        url_hash = hashlib.md5(url.encode()).hexdigest()
-        return os.path.join(CACHE_DIR, f"extract_{url_hash}_{prompt_hash[:8]}.pkl")
+        return f"extract_{_hash_key(url)}_{prompt_hash[:8]}"
+
+    def _get_extract_cache_path(self, url: str, prompt_hash: str) -> str:
+        """Generate the legacy pickle path for an LLM extraction result.
+
+        Args:
+            url: The URL being extracted.
+            prompt_hash: MD5 hash of the extraction prompt.
+
+        Returns:
+            Path to the legacy ``.pkl`` extract cache file.
+        """
+        return os.path.join(CACHE_DIR, f"extract_{_legacy_hash(url)}_{prompt_hash[:8]}.pkl")
 
     def _load_extract_cache(self, url: str, prompt: str) -> Optional[Dict]:
         """Load cached LLM extraction result.
@@ -164,17 +765,29 @@ class CacheMixin:
         Note:
             Different prompts for the same URL will have separate caches.
         """
-        prompt_hash = hashlib.md5(prompt.encode()).hexdigest()
-        cache_path = self._get_extract_cache_path(url, prompt_hash)
+        return self._load_entry(
+            self._get_extract_cache_key(url, _hash_key(prompt)),
+            lambda: self._get_extract_cache_path(url, _legacy_hash(prompt)),
+        )
 
-        if os.path.exists(cache_path):
-            try:
-                with open(cache_path, "rb") as f:
-                    data = pickle.load(f)
-                    return data
-            except Exception:
-                pass
-        return None
+    def _load_extract_cache_many(self, urls: List[str], prompt: str) -> Dict[str, Dict]:
+        """Load cached LLM extraction results for many URLs at once.
+
+        Equivalent to calling ``_load_extract_cache`` per URL, with the
+        batched reads of ``_load_many``.
+
+        Args:
+            urls: URLs to look up. Duplicates are fine.
+            prompt: The extraction prompt used (for cache key).
+
+        Returns:
+            Dictionary mapping each cached URL to a copy of its result.
+        """
+        prompt_hash = _hash_key(prompt)
+        keys = {self._get_extract_cache_key(url, prompt_hash): url for url in urls}
+        return self._load_many(
+            keys, lambda url: self._get_extract_cache_path(url, _legacy_hash(prompt))
+        )
 
     def _save_extract_cache(self, url: str, prompt: str, data: Dict) -> None:
         """Save LLM extraction result to cache.
@@ -187,14 +800,68 @@ class CacheMixin:
         Note:
             Failures are logged at debug level and silently ignored.
         """
-        prompt_hash = hashlib.md5(prompt.encode()).hexdigest()
-        cache_path = self._get_extract_cache_path(url, prompt_hash)
         try:
-            with open(cache_path, "wb") as f:
-                pickle.dump(data, f)
+            self._db_put(self._get_extract_cache_key(url, _hash_key(prompt)), data)
         except Exception as e:
             logger.debug(f"Extract cache save failed: {e}")
 
+    def _save_extract_cache_many(self, prompt: str, results: Dict[str, Dict]) -> None:
+        """Save several LLM extraction results for one prompt in one write.
+
+        Equivalent to calling ``_save_extract_cache`` per URL.
+
+        Args:
+            prompt: The extraction prompt used (for cache key).
+            results: Mapping of URL to extraction result data.
+
+        Note:
+            Failures are logged at debug level and silently ignored.
+        """
+        prompt_hash = _hash_key(prompt)
+        try:
+            self._db_put_many([
+                (self._get_extract_cache_key(url, prompt_hash), data)
+                for url, data in results.items()
+            ])
+        except Exception as e:
+            logger.debug(f"Extract cache save failed: {e}")
+
+    # ====================
+    # Agent Cache
+    # ====================
+
+    def _get_agent_cache_key(self, query: str, limit: int) -> str:
+        """Generate the cache store key for an agent search (query + result limit)."""
+        return f"agent_{_hash_key(f'{query}|{limit}')}"
+
+    def _load_agent_cache(self, query: str, limit: int) -> Optional[Dict]:
+        """Load a cached agent search result.
+
+        Args:
+            query: The agent query sent to Firecrawl.
+            limit: Result limit the search ran with.
+
+        Returns:
+            Cached result dictionary (``{"data": [...]}``) if found and
+            unexpired, None otherwise.
+        """
+        try:
+            return self._db_get(self._get_agent_cache_key(query, limit))
+        except Exception as e:
+            logger.debug(f"Agent cache load failed: {e}")
+            return None
+
+    def _save_agent_cache(self, query: str, limit: int, result: Dict) -> None:
+        """Save an agent search result to cache.
+
+        Note:
+            Failures are logged at debug level and silently ignored.
+        """
+        try:
+            self._db_put(self._get_agent_cache_key(query, limit), result)
+        except Exception as e:
+            logger.debug(f"Agent cache save failed: {e}")
+
     # ====================
     # Discovery Cache
     # ====================
@@ -209,8 +876,7 @@ class CacheMixin:
         Returns:
             Absolute path to the discovery cache file.
         """
-        url_hash = hashlib.md5(url.encode()).hexdigest()
-        return os.path.join(CACHE_DIR, f"discovery_{url_hash}_{scroll_mode}.json")
+        return os.path.join(CACHE_DIR, f"discovery_{_hash_key(url)}_{scroll_mode}.json")
 
     def _is_discovery_cache_valid(self, cache_path: str, ttl_hours: int = 24) -> bool:
         """Check if discovery cache is still valid based on TTL.
@@ -226,9 +892,10 @@ class CacheMixin:
             Discovery caches expire after TTL to ensure fresh results
             for dynamic pages.
         """
-        if not os.path.exists(cache_path):
+        try:
+            mtime = os.path.getmtime(cache_path)
+        except OSError:
             return False
-        mtime = os.path.getmtime(cache_path)
         if (time.time() - mtime) > ttl_hours * 3600:
             return False
         return True
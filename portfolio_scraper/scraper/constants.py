@@ -122,19 +122,29 @@ HEADERS: Final[Dict[str, str]] = {
     "User-Agent": (
         "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
         "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-    )
+    ),
+    "Accept-Encoding": "gzip, deflate",
 }
-"""HTTP headers for web requests to avoid bot detection."""
+"""HTTP headers for web requests (browser UA, compressed transfer)."""
 
 CACHE_DIR: Final[str] = ".cache"
 """Directory path for storing cached extraction results."""
 
+CACHE_DB_NAME: Final[str] = "firecrawl.sqlite"
+"""SQLite key-value store (inside CACHE_DIR) holding work and extract caches."""
+
 # ====================
 # API Configuration
 # ====================
 
-MAX_WORKERS: Final[int] = 2
-"""Maximum number of concurrent workers for parallel processing."""
+MAX_WORKERS: Final[int] = 4
+"""Default number of concurrent workers (override with MAX_WORKERS env var)."""
+
+RATE_LIMIT_CALLS_PER_MINUTE: Final[int] = 10
+"""Default Firecrawl call budget per minute (override with RATE_LIMIT_CALLS_PER_MINUTE env var)."""
+
+SITE_CALLS_PER_MINUTE: Final[int] = 120
+"""Default direct page fetches per minute, per host (override with SITE_CALLS_PER_MINUTE env var)."""
 
 TIMEOUT: Final[int] = 15
 """Default HTTP request timeout in seconds."""
@@ -142,9 +152,32 @@ TIMEOUT: Final[int] = 15
 FC_TIMEOUT: Final[int] = 30
 """Firecrawl API request timeout in seconds (longer due to LLM processing)."""
 
+FC_API_BASE: Final[str] = "https://api.firecrawl.dev"
+"""Firecrawl API host; all Firecrawl calls share one pooled session."""
+
+POLL_INITIAL_DELAY: Final[float] = 0.5
+"""Seconds before the first job-status poll (extract/agent jobs)."""
+
+POLL_BACKOFF: Final[float] = 1.5
+"""Multiplier applied to the poll delay after each status check."""
+
+POLL_MAX_DELAY: Final[float] = 10.0
+"""Upper bound in seconds for the delay between job-status polls."""
+
+RETRY_MAX_DELAY: Final[float] = 60.0
+"""Upper bound in seconds for the backoff between rate-limited (429) retries."""
+
+BATCH_SCRAPE_SIZE: Final[int] = 20
+"""Default number of URLs per Firecrawl batch-scrape job."""
+
 SPA_WAIT_MS: Final[int] = 3000
 """Milliseconds to wait for SPA content to render before scraping."""
 
+SPA_WAIT_ACTIONS: Final[List[Dict[str, Any]]] = [
+    {"type": "wait", "milliseconds": SPA_WAIT_MS},
+]
+"""Firecrawl ``actions`` that give SPA pages time to render before extraction."""
+
 SPA_EXCLUDE_TAGS: Final[List[str]] = [
     "nav",
     ".project_thumb:not(.active)",
@@ -509,3 +542,56 @@ VERIFICATION: Your extracted title should relate to the URL slug of the page.
 
 Emphasizes ignoring sidebar content and handling various data formats.
 """
+
+ARTWORK_JSON_SCHEMA: Final[Dict[str, Any]] = ArtworkSchema.model_json_schema()
+"""JSON schema generated once from ArtworkSchema for Firecrawl requests."""
+
+LLM_EXTRACT_SCHEMA: Final[Dict[str, Any]] = {
+    "type": "object",
+    "properties": {
+        "title": {"type": "string", "description": "The English title of the work"},
+        "title_cn": {
+            "type": "string",
+            "description": "The Chinese title of the work. If not explicitly found, leave empty.",
+        },
+        "year": {
+            "type": "string",
+            "description": "Creation year or year range (e.g. 2018-2022)",
+        },
+        "category": {
+            "type": "string",
+            "description": "The art category (e.g. Video Installation, Software, Website, Exhibition)",
+        },
+        "materials": {
+            "type": "string",
+            "description": "Physical materials ONLY (e.g. LED, acrylic, wood, silicone, screen printing). Do NOT include credits or collaborators here.",
+        },
+        "size": {
+            "type": "string",
+            "description": "Physical dimensions (e.g. '180 x 180 cm', 'Dimension variable'). Leave empty if not specified.",
+        },
+        "duration": {
+            "type": "string",
+            "description": "Video duration for video/film works (e.g. '4:30', '2′47′'). Leave empty for non-video works.",
+        },
+        "credits": {
+            "type": "string",
+            "description": "Credits and collaborators (e.g. 'Photo: John', 'concept: aaajiao; sound: yang2'). Separate from materials.",
+        },
+        "video_link": {"type": "string", "description": "Vimeo URL if present"},
+    },
+    "required": ["title"],
+}
+"""Schema for the legacy LLM scrape path (FirecrawlMixin._extract_with_llm)."""
+
+LLM_EXTRACT_PROMPT: Final[str] = (
+    "You are an art archivist. This is a Single Page Application (SPA) portfolio site. "
+    "IMPORTANT: Extract ONLY the artwork that matches the URL slug '{url_slug}'. "
+    "The page may show multiple artworks, but you must find and extract the one "
+    "whose title or ID matches '{url_slug}'. "
+    "Ignore navigation links and other artworks. "
+    "The title usually appears as 'English Title / Chinese Title'. Separate them. "
+    "Materials = physical materials only (LED, acrylic, wood). "
+    "Credits = collaborators (concept: xxx, sound: xxx). Keep them separate."
+)
+"""Prompt template for the legacy LLM scrape path; format with ``url_slug``."""
@@ -2,24 +2,48 @@
 Core scraper components and utilities.
 
 This module provides the foundational classes for the aaajiao scraper:
-- RateLimiter: Thread-safe rate limiting for API calls
+- RateLimiter: Thread-safe token-bucket rate limiting for API calls
 - CoreScraper: Base scraper with session management and configuration
 
 All scraper mixins inherit from CoreScraper to share common functionality.
 """
 
+import asyncio
+import functools
+import json
 import logging
 import os
+import sys
 import time
 from threading import Lock
 from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse
 
 import requests
 from dotenv import load_dotenv
-from requests.adapters import HTTPAdapter
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
+from requests.packages.urllib3.util import make_headers
 from requests.packages.urllib3.util.retry import Retry
 
-from .constants import CACHE_DIR, HEADERS, MAX_WORKERS, TIMEOUT
+try:
+    import orjson
+except ImportError:  # Optional: pip install ".[speedups]"
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:  # Optional: pip install ".[async]" (not available on Windows)
+    uvloop = None
+
+from .constants import (
+    CACHE_DIR,
+    FC_API_BASE,
+    HEADERS,
+    MAX_WORKERS,
+    RATE_LIMIT_CALLS_PER_MINUTE,
+    SITE_CALLS_PER_MINUTE,
+    TIMEOUT,
+)
 
 # Configure logging
 logging.basicConfig(
@@ -30,47 +54,166 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
+def _load_env_files() -> None:
+    """Load ``.env`` settings into the environment once per process.
+
+    Reads the nearest ``.env`` (python-dotenv search), then the package-level
+    ``.env`` as a fallback. Existing environment variables are never
+    overridden. Memoized so repeated scraper instantiation does no file I/O.
+    """
+    load_dotenv()
+    package_env = os.path.join(os.path.dirname(os.path.dirname(__file__)), ".env")
+    if os.path.exists(package_env):
+        load_dotenv(package_env)
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read a positive integer from the environment, falling back to default."""
+    try:
+        value = int(os.getenv(name, ""))
+    except ValueError:
+        return default
+    return value if value > 0 else default
+
+
+def run_async(coro: Any) -> Any:
+    """Run a coroutine to completion on a fresh event loop.
+
+    Uses uvloop's libuv-backed loop when it is installed, otherwise the
+    default asyncio loop (always the case on Windows).
+    """
+    if uvloop is not None:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
+
+def json_loads(data: Any) -> Any:
+    """Parse JSON text or bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize to UTF-8 JSON text (non-ASCII kept), using orjson when installed.
+
+    Args:
+        obj: JSON-serializable object.
+        indent: Pretty-print with 2-space indentation.
+
+    Returns:
+        JSON string. Indented output matches
+        ``json.dumps(obj, ensure_ascii=False, indent=2)``.
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option | orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None)
+
+
+def json_dumpb(obj: Any, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes; same output as ``json_dumps(...).encode()``.
+
+    Use for file writes: with orjson the bytes go straight to disk without
+    a decode/encode round trip through ``str``.
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None).encode("utf-8")
+
+
+def response_json(resp: Any) -> Any:
+    """Decode a JSON HTTP response body.
+
+    Parses the raw bytes with orjson when available, otherwise defers to
+    ``resp.json()`` (stdlib parser).
+    """
+    content = getattr(resp, "content", None)
+    if orjson is not None and isinstance(content, bytes):
+        return orjson.loads(content)
+    return resp.json()
+
+
 class RateLimiter:
-    """Thread-safe rate limiter for API calls.
+    """Thread-safe token-bucket rate limiter for API calls.
     
-    Ensures that API calls respect rate limits by enforcing a minimum
-    time interval between consecutive calls.
+    Tokens refill continuously at ``calls_per_minute / 60`` per second up to
+    ``capacity``. Each call consumes one token, so idle periods accumulate
+    credit that allows short bursts, while sustained usage is throttled to
+    the configured per-minute rate.
     
     Attributes:
-        interval: Minimum time in seconds between calls.
-        last_call: Timestamp of the last API call.
+        interval: Average time in seconds between calls at the sustained rate.
+        capacity: Maximum number of tokens (burst size).
+        refill_rate: Tokens added per second.
+        tokens: Currently available tokens.
+        last_refill: Monotonic timestamp of the last refill.
         lock: Thread lock for synchronization.
         
     Example:
         >>> limiter = RateLimiter(calls_per_minute=10)
-        >>> limiter.wait()  # Blocks if called too soon
+        >>> limiter.wait()  # Blocks only when the bucket is empty
         >>> # Make API call here
     """
 
-    def __init__(self, calls_per_minute: int = 5) -> None:
+    def __init__(self, calls_per_minute: int = 5, capacity: Optional[int] = None) -> None:
         """Initialize the rate limiter.
         
         Args:
             calls_per_minute: Maximum number of calls allowed per minute.
                 Defaults to 5 calls/min (conservative).
+            capacity: Maximum burst size. Defaults to ``calls_per_minute``,
+                so a burst never exceeds one minute's budget.
         """
         self.interval: float = 60.0 / calls_per_minute
-        self.last_call: float = 0
+        self.capacity: float = float(capacity if capacity is not None else calls_per_minute)
+        self.refill_rate: float = calls_per_minute / 60.0
+        self.tokens: float = self.capacity
+        self.last_refill: float = time.monotonic()
         self.lock: Lock = Lock()
 
+    def _refill(self) -> None:
+        """Add tokens accrued since the last refill. Caller must hold the lock."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate)
+        self.last_refill = now
+
+    def _reserve(self) -> float:
+        """Claim the next token and return how long the caller must wait for it.
+
+        The token is taken immediately, letting the balance go negative, so
+        concurrent callers are handed consecutive slots instead of waking
+        together and competing for the same refill.
+        """
+        with self.lock:
+            self._refill()
+            self.tokens -= 1
+            return max(0.0, -self.tokens / self.refill_rate)
+
     def wait(self) -> None:
-        """Wait until the next call is allowed.
+        """Wait until a token is available, then consume it.
         
-        This method blocks execution if insufficient time has passed
-        since the last call. Thread-safe for concurrent usage.
+        Returns immediately while the bucket has tokens. Otherwise sleeps
+        (without holding the lock) until the reserved token has refilled.
+        Thread-safe for concurrent usage.
         """
-        with self.lock:
-            elapsed = time.time() - self.last_call
-            if elapsed < self.interval:
-                sleep_time = self.interval - elapsed
-                logger.debug(f"Rate limit: sleeping {sleep_time:.2f}s")
-                time.sleep(sleep_time)
-            self.last_call = time.time()
+        sleep_time = self._reserve()
+        if sleep_time > 0:
+            logger.debug(f"Rate limit: sleeping {sleep_time:.2f}s")
+            time.sleep(sleep_time)
+
+    async def acquire(self) -> None:
+        """Async variant of :meth:`wait` that yields to the event loop.
+
+        Shares the same bucket as :meth:`wait`, so threaded and async
+        callers draw from one budget.
+        """
+        sleep_time = self._reserve()
+        if sleep_time > 0:
+            logger.debug(f"Rate limit: sleeping {sleep_time:.2f}s")
+            await asyncio.sleep(sleep_time)
 
 
 class CoreScraper:
@@ -82,46 +225,131 @@ class CoreScraper:
     - Rate limiting for API calls
     - Cache directory initialization
     
+    Concurrency and rate limit default to ``MAX_WORKERS`` (4) and
+    ``RATE_LIMIT_CALLS_PER_MINUTE`` (10), and can be overridden with the
+    environment variables of the same name or the constructor arguments.
+    The workload is I/O-bound, so keep ``max_workers`` roughly in line with
+    your Firecrawl plan's per-minute quota: the free tier is comfortable
+    at the defaults, paid tiers can go to 8-16 workers and 50-100 calls/min.
+
     Attributes:
         session: Configured requests.Session with retry logic.
+        fc_session: Pooled keep-alive session for Firecrawl API calls.
         works: List of scraped artwork data.
         use_cache: Whether to use cache for API responses.
+        max_workers: Number of concurrent extraction workers.
+        calls_per_minute: Firecrawl call budget per minute.
+        cache_ttl_hours: Maximum age of cache entries, or None for no expiry.
         firecrawl_key: Firecrawl API key from environment.
         rate_limiter: RateLimiter instance for API calls.
+        site_calls_per_minute: Direct page fetch budget per minute, per host.
         
     Example:
-        >>> scraper = CoreScraper(use_cache=True)
+        >>> scraper = CoreScraper(use_cache=True, max_workers=8, calls_per_minute=50)
         >>> scraper.session.get("https://example.com")
     """
 
-    def __init__(self, use_cache: bool = True) -> None:
+    def __init__(
+        self,
+        use_cache: bool = True,
+        max_workers: Optional[int] = None,
+        calls_per_minute: Optional[int] = None,
+        cache_ttl_hours: Optional[float] = None,
+    ) -> None:
         """Initialize the core scraper.
         
         Args:
             use_cache: Enable caching of API responses. Defaults to True.
                 Set to False for fresh data without cache lookup.
+            max_workers: Concurrent extraction workers. Defaults to the
+                MAX_WORKERS env var, then ``constants.MAX_WORKERS``.
+            calls_per_minute: Firecrawl rate limit. Defaults to the
+                RATE_LIMIT_CALLS_PER_MINUTE env var, then
+                ``constants.RATE_LIMIT_CALLS_PER_MINUTE``.
+            cache_ttl_hours: Treat cached works/extractions older than this
+                as misses. Defaults to the CACHE_TTL_HOURS env var; unset
+                means cache entries never expire.
         """
-        self.session: requests.Session = self._create_retry_session()
+        _load_env_files()
+
         self.works: list = []
         self.use_cache: bool = use_cache
+        self.max_workers: int = max_workers or _env_int("MAX_WORKERS", MAX_WORKERS)
+        self.calls_per_minute: int = calls_per_minute or _env_int(
+            "RATE_LIMIT_CALLS_PER_MINUTE", RATE_LIMIT_CALLS_PER_MINUTE
+        )
+        self.cache_ttl_hours: Optional[float] = (
+            cache_ttl_hours or _env_int("CACHE_TTL_HOURS", 0) or None
+        )
+
+        # Site session: pool sized after max_workers so concurrent page fetches reuse connections
+        self.session: requests.Session = self._create_retry_session()
 
         # Load API key from environment
         self.firecrawl_key: Optional[str] = self._load_api_key()
 
-        # Initialize rate limiter (10 calls/min)
-        self.rate_limiter: RateLimiter = RateLimiter(calls_per_minute=10)
+        # Persistent Firecrawl session (reuses TCP/TLS connections across calls)
+        self.fc_session: requests.Session = self._create_firecrawl_session()
+
+        # Initialize rate limiter (token bucket sized to one minute's budget)
+        self.rate_limiter: RateLimiter = RateLimiter(calls_per_minute=self.calls_per_minute)
 
-        # Ensure cache directory exists
-        os.makedirs(CACHE_DIR, exist_ok=True)
+        # Direct page fetches get their own bucket per host, independent of Firecrawl
+        self.site_calls_per_minute: int = _env_int("SITE_CALLS_PER_MINUTE", SITE_CALLS_PER_MINUTE)
+        self._host_limiters: Dict[str, RateLimiter] = {}
+        self._host_limiters_lock: Lock = Lock()
+
+        # Ensure cache directory exists (created once, then remembered)
+        self._created_dirs: set = set()
+        self._ensure_dir(CACHE_DIR)
+
+        logger.info(
+            f"Scraper initialized (cache: {'enabled' if use_cache else 'disabled'}, "
+            f"workers: {self.max_workers}, rate: {self.calls_per_minute}/min)"
+        )
 
-        logger.info(f"Scraper initialized (cache: {'enabled' if use_cache else 'disabled'})")
+    def _wait_for_host(self, url: str) -> None:
+        """Pace a direct page fetch against its host's token bucket.
+
+        Each host gets its own ``RateLimiter`` on first use, so workers
+        fetching from different hosts never wait on each other while any
+        one host sees at most ``site_calls_per_minute`` sustained requests.
+
+        Args:
+            url: URL about to be fetched with ``self.session``.
+        """
+        host = urlparse(url).netloc
+        limiter = self._host_limiters.get(host)
+        if limiter is None:
+            with self._host_limiters_lock:
+                limiter = self._host_limiters.setdefault(
+                    host, RateLimiter(calls_per_minute=self.site_calls_per_minute)
+                )
+        limiter.wait()
+
+    def _ensure_dir(self, path: str) -> None:
+        """Create a directory once per scraper instance.
+
+        Args:
+            path: Directory path to create if missing.
+
+        Note:
+            Directories already ensured by this instance are skipped without
+            touching the filesystem, keeping repeated writes syscall-free.
+        """
+        if path in self._created_dirs:
+            return
+        os.makedirs(path, exist_ok=True)
+        self._created_dirs.add(path)
 
     def _load_api_key(self) -> Optional[str]:
         """Load Firecrawl API key from environment variables.
         
         Searches for FIRECRAWL_API_KEY in the following order:
         1. Current environment variables
-        2. .env file in project root
+        2. Nearest .env file, then the package-level .env
+
+        The .env files are read once per process (see ``_load_env_files``).
         
         Returns:
             API key string if found, None otherwise.
@@ -130,15 +358,8 @@ class CoreScraper:
             Logs a warning if API key is not found. AI features
             will be unavailable without a valid key.
         """
-        load_dotenv()
+        _load_env_files()
         key = os.getenv("FIRECRAWL_API_KEY")
-        
-        if not key:
-            # Search for .env in parent directory (package compatibility)
-            env_file = os.path.join(os.path.dirname(os.path.dirname(__file__)), ".env")
-            if os.path.exists(env_file):
-                load_dotenv(env_file)
-                key = os.getenv("FIRECRAWL_API_KEY")
 
         if not key:
             logger.warning("FIRECRAWL_API_KEY not found, AI features will be unavailable")
@@ -162,8 +383,11 @@ class CoreScraper:
             Configured requests.Session with retry adapter and default headers.
             
         Note:
-            Retries are triggered for network errors and 5xx server errors.
+            Retries are triggered for network errors, 5xx server errors,
+            408 timeouts and 429 rate limits (waiting out ``Retry-After``).
             The session includes a User-Agent header to avoid bot detection.
+            The keep-alive pool holds at least two connections per worker so
+            concurrent extraction never discards pooled connections.
         """
         session = requests.Session()
         retry = Retry(
@@ -171,14 +395,67 @@ class CoreScraper:
             read=retries,
             connect=retries,
             backoff_factor=backoff_factor,
-            status_forcelist=[500, 502, 503, 504],
+            status_forcelist=[408, 429, 500, 502, 503, 504],
+        )
+        adapter = HTTPAdapter(
+            pool_maxsize=max(DEFAULT_POOLSIZE, self.max_workers * 2),
+            max_retries=retry,
         )
-        adapter = HTTPAdapter(max_retries=retry)
         session.mount("http://", adapter)
         session.mount("https://", adapter)
         session.headers.update(HEADERS)
+        # The sitemap and pages are text: accept every encoding urllib3 can
+        # inflate while streaming (br/zstd with the speedups extra)
+        session.headers["Accept-Encoding"] = make_headers(accept_encoding=True)["accept-encoding"]
+        return session
+
+    def _create_firecrawl_session(self) -> requests.Session:
+        """Create a pooled HTTP session for Firecrawl API calls.
+
+        Every Firecrawl request goes to the same host, so a single
+        keep-alive session avoids a new TCP + TLS handshake per call.
+        Authorization and Content-Type headers are set once here.
+
+        Responses are requested compressed: gzip/deflate always, plus
+        Brotli (``br``) when a decoder is installed (``.[speedups]``).
+
+        Returns:
+            requests.Session with a sized connection pool and auth headers.
+
+        Note:
+            Retries only cover connection errors, 408 and 5xx responses; 429
+            handling stays in the callers, which know how to back off.
+            POST is retried too, since every Firecrawl call is a POST and
+            those statuses mean the job was not accepted. Once retries run
+            out the last response is returned for the caller to inspect.
+        """
+        session = requests.Session()
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[408, 500, 502, 503, 504],
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS | {"POST"},
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=self.max_workers * 2,
+            max_retries=retry,
+        )
+        session.mount("https://", adapter)
+        session.headers.update({
+            "Content-Type": "application/json",
+            # Only advertise encodings urllib3 can actually decode
+            "Accept-Encoding": make_headers(accept_encoding=True)["accept-encoding"],
+        })
+        if self.firecrawl_key:
+            session.headers["Authorization"] = f"Bearer {self.firecrawl_key}"
         return session
 
+    def close(self) -> None:
+        """Close HTTP sessions and release pooled connections."""
+        self.session.close()
+        self.fc_session.close()
 
     def get_credit_usage(self) -> Optional[Dict[str, Any]]:
         """Get current Firecrawl API credit usage and remaining balance.
@@ -204,17 +481,13 @@ class CoreScraper:
             return None
 
         try:
-            resp = requests.get(
-                "https://api.firecrawl.dev/v1/team/credit-usage",
-                headers={
-                    "Authorization": f"Bearer {self.firecrawl_key}",
-                    "Content-Type": "application/json",
-                },
+            resp = self.fc_session.get(
+                f"{FC_API_BASE}/v1/team/credit-usage",
                 timeout=10,
             )
 
             if resp.status_code == 200:
-                data = resp.json()
+                data = response_json(resp)
                 if data.get("success"):
                     # API returns data in nested 'data' object
                     info = data.get("data", data)
@@ -271,3 +544,24 @@ def deduplicate_works(works: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
 
     return unique_works
 
+
+
+# Low-cardinality fields shared by many works ("Video Installation", "2018", ...)
+_CATEGORICAL_FIELDS = ("type", "year", "materials")
+
+
+def intern_categorical_fields(works: List[Dict[str, Any]]) -> None:
+    """Intern repeated categorical string values across works in place.
+
+    Works decoded separately (cache, API, JSON) each carry their own copy of
+    values like ``"Video Installation"``; interning collapses them to one
+    shared object and makes equality checks a pointer comparison.
+
+    Args:
+        works: List of work dictionaries; modified in place.
+    """
+    for work in works:
+        for field in _CATEGORICAL_FIELDS:
+            value = work.get(field)
+            if value and isinstance(value, str):
+                work[field] = sys.intern(value)
@@ -10,28 +10,67 @@ This module provides advanced scraping capabilities using Firecrawl V2 API:
 All methods integrate with the caching system to reduce API costs.
 """
 
-import json
+import asyncio
+import email.utils
 import logging
+import random
 import re
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
+from difflib import SequenceMatcher
 from typing import Any, Dict, List, Optional, Tuple
 
-import requests
-
-from difflib import SequenceMatcher
+try:
+    import aiohttp
+except ImportError:  # Optional: pip install ".[async]"
+    aiohttp = None
 
+from .basic import is_artwork, is_extraction_complete, normalize_year, parse_size_duration
 from .constants import (
-    FC_TIMEOUT, FULL_SCHEMA, PROMPT_TEMPLATES, QUICK_SCHEMA,
-    MATERIAL_KEYWORDS, CREDITS_PATTERNS, CANONICAL_TYPES,
-    ArtworkSchema, ARTWORK_EXTRACT_PROMPT,
-    SPA_WAIT_MS, SPA_EXCLUDE_TAGS,
+    ARTWORK_EXTRACT_PROMPT,
+    ARTWORK_JSON_SCHEMA,
     BASE_URL,
+    BATCH_SCRAPE_SIZE,
+    CANONICAL_TYPES,
+    CREDITS_PATTERNS,
+    FC_API_BASE,
+    FC_TIMEOUT,
+    FULL_SCHEMA,
+    LLM_EXTRACT_PROMPT,
+    LLM_EXTRACT_SCHEMA,
+    MATERIAL_KEYWORDS,
+    POLL_BACKOFF,
+    POLL_INITIAL_DELAY,
+    POLL_MAX_DELAY,
+    PROMPT_TEMPLATES,
+    QUICK_SCHEMA,
+    RETRY_MAX_DELAY,
+    SPA_EXCLUDE_TAGS,
+    SPA_WAIT_ACTIONS,
+    SPA_WAIT_MS,
 )
-from .basic import is_artwork, normalize_year, parse_size_duration, is_extraction_complete
+from .core import json_dumps, json_loads, response_json, run_async
 
 logger = logging.getLogger(__name__)
 
+# Request options shared by every call; only the per-URL fields are added at call time
+_MARKDOWN_SCRAPE_OPTIONS: Dict[str, Any] = {
+    "formats": ["markdown"],
+    "onlyMainContent": True,
+    # Exclude sidebar navigation to reduce noise
+    "excludeTags": SPA_EXCLUDE_TAGS,
+    # Wait for SPA content to render
+    "waitFor": SPA_WAIT_MS,
+    # Enable Firecrawl server-side caching (2 days default)
+    # This can speed up repeated scrapes by up to 5x
+    "maxAge": 172800,  # 2 days in seconds
+}
+_LLM_SCRAPE_OPTIONS: Dict[str, Any] = {
+    "onlyMainContent": True,
+    "excludeTags": SPA_EXCLUDE_TAGS,
+    "waitFor": SPA_WAIT_MS,
+}
+
 
 class FirecrawlMixin:
     """Mixin providing Firecrawl V2 API integration.
@@ -49,7 +88,118 @@ class FirecrawlMixin:
         Requires valid FIRECRAWL_API_KEY in environment for AI features.
     """
 
-    def extract_work_details(self, url: str, retry_count: int = 0) -> Optional[Dict[str, Any]]:
+    def _retry_after_seconds(self, resp: Any, default: float) -> float:
+        """Seconds to wait before retrying a 429, honoring ``Retry-After``.
+
+        Args:
+            resp: The rate-limited response.
+            default: Fallback wait when the header is absent or unparsable.
+
+        Returns:
+            Wait time in seconds (never negative).
+        """
+        retry_after = resp.headers.get("Retry-After") if resp.headers else None
+        if isinstance(retry_after, str):
+            try:
+                return max(0.0, float(retry_after))
+            except ValueError:
+                try:
+                    when = email.utils.parsedate_to_datetime(retry_after)
+                    return max(0.0, when.timestamp() - time.time())
+                except (TypeError, ValueError):
+                    pass
+        return default
+
+    def _next_poll_delay(self, resp: Any, delay: float) -> float:
+        """Delay before the next job-status poll.
+
+        Grows the current delay by ``POLL_BACKOFF`` up to ``POLL_MAX_DELAY``,
+        so short jobs are picked up quickly and long ones are polled rarely.
+        A 429 status response defers to its ``Retry-After`` hint.
+
+        Args:
+            resp: The status response just received (requests or aiohttp).
+            delay: The delay used before this poll.
+
+        Returns:
+            Seconds to sleep before polling again.
+        """
+        next_delay = min(delay * POLL_BACKOFF, POLL_MAX_DELAY)
+        status = getattr(resp, "status_code", None) or getattr(resp, "status", None)
+        if status == 429:
+            return self._retry_after_seconds(resp, next_delay)
+        return next_delay
+
+    def _post_with_retry(
+        self,
+        endpoint: str,
+        payload: Dict[str, Any],
+        timeout: float = FC_TIMEOUT,
+        max_retries: int = 3,
+        backoff: float = 2.0,
+        label: str = "Firecrawl",
+    ) -> Any:
+        """POST to Firecrawl, retrying rate-limited (429) responses in a loop.
+
+        Waits for the server's ``Retry-After`` hint when given, otherwise
+        ``backoff * 2**attempt`` seconds plus up to one second of random
+        jitter (capped at ``RETRY_MAX_DELAY``) so concurrent workers don't
+        retry in lockstep.
+
+        Args:
+            endpoint: Firecrawl API URL.
+            payload: JSON body.
+            timeout: Request timeout in seconds. Defaults to FC_TIMEOUT.
+            max_retries: Retries after the first attempt. Defaults to 3.
+            backoff: Base wait in seconds without Retry-After. Defaults to 2.
+            label: Operation name for log messages.
+
+        Returns:
+            The final response; still a 429 if retries were exhausted.
+        """
+        for attempt in range(max_retries + 1):
+            resp = self.fc_session.post(endpoint, json=payload, timeout=timeout)
+            if resp.status_code != 429 or attempt == max_retries:
+                return resp
+            default_wait = min(RETRY_MAX_DELAY, backoff * 2 ** attempt + random.random())
+            wait_time = self._retry_after_seconds(resp, default_wait)
+            logger.warning(f"Rate limited on {label}, waiting {wait_time:.1f}s before retry...")
+            time.sleep(wait_time)
+        return resp
+
+    async def _post_with_retry_async(
+        self,
+        session: "aiohttp.ClientSession",
+        endpoint: str,
+        payload: Dict[str, Any],
+        max_retries: int = 3,
+        backoff: float = 2.0,
+        label: str = "Firecrawl",
+    ) -> Tuple[int, Optional[Dict[str, Any]]]:
+        """Async counterpart of ``_post_with_retry`` for aiohttp sessions.
+
+        Each attempt draws a rate-limiter token; a 429 waits for its
+        ``Retry-After`` hint (or jittered backoff) with ``asyncio.sleep``
+        so other jobs on the loop keep running.
+
+        Returns:
+            ``(status, body)``; ``body`` is the decoded JSON for a 200,
+            otherwise None. Still 429 if retries were exhausted.
+        """
+        for attempt in range(max_retries + 1):
+            await self.rate_limiter.acquire()
+            async with session.post(endpoint, json=payload) as resp:
+                if resp.status == 200:
+                    return resp.status, await resp.json(loads=json_loads)
+                if resp.status != 429 or attempt == max_retries:
+                    return resp.status, None
+                default_wait = min(RETRY_MAX_DELAY, backoff * 2 ** attempt + random.random())
+                wait_time = self._retry_after_seconds(resp, default_wait)
+            logger.warning(f"Rate limited on {label}, waiting {wait_time:.1f}s before retry...")
+            await asyncio.sleep(wait_time)
+        return 429, None
+
+    def extract_work_details(self, url: str) -> Optional[Dict[str, Any]]:
         """[LEGACY] Extract artwork details using old three-tier strategy.
 
         DEPRECATED: Use extract_work_details_v2() instead for better results.
@@ -59,13 +209,10 @@ class FirecrawlMixin:
 
         Args:
             url: Artwork page URL to extract from.
-            retry_count: Current retry attempt (for internal recursion).
 
         Returns:
             Dictionary with extracted artwork fields, or None if extraction fails.
         """
-        max_retries = 3
-
         # ===== Layer 0: Cache Check =====
         if self.use_cache:
             cached = self._load_cache(url)
@@ -126,7 +273,7 @@ class FirecrawlMixin:
 
         # ===== Layer 3: LLM Extract (~20-50 credits, token-based) - Last Resort =====
         logger.info(f"🔥 Layer 3: Using LLM extraction for {url}")
-        llm_data = self._extract_with_llm(url, retry_count)
+        llm_data = self._extract_with_llm(url)
 
         # Merge LLM data with Layer 1/2 data to preserve images and descriptions
         if llm_data and local_data:
@@ -160,40 +307,21 @@ class FirecrawlMixin:
         self.rate_limiter.wait()
 
         try:
-            payload: Dict[str, Any] = {
-                "url": url,
-                "formats": ["markdown"],
-                "onlyMainContent": True,
-                # Exclude sidebar navigation to reduce noise
-                "excludeTags": SPA_EXCLUDE_TAGS,
-                # Wait for SPA content to render
-                "waitFor": SPA_WAIT_MS,
-                # Enable Firecrawl server-side caching (2 days default)
-                # This can speed up repeated scrapes by up to 5x
-                "maxAge": 172800,  # 2 days in seconds
-            }
-            headers = {
-                "Authorization": f"Bearer {self.firecrawl_key}",
-                "Content-Type": "application/json",
-            }
+            payload: Dict[str, Any] = {"url": url, **_MARKDOWN_SCRAPE_OPTIONS}
 
-            resp = requests.post(
+            resp = self._post_with_retry(
                 "https://api.firecrawl.dev/v2/scrape",
-                json=payload,
-                headers=headers,
+                payload,
                 timeout=FC_TIMEOUT,
+                label="markdown scrape",
             )
 
             if resp.status_code == 200:
-                data = resp.json()
+                data = response_json(resp)
                 markdown = data.get("data", {}).get("markdown", "")
                 if markdown:
                     logger.debug(f"Scraped markdown: {len(markdown)} chars")
                     return markdown
-            elif resp.status_code == 429:
-                logger.warning("Rate limited on markdown scrape")
-                time.sleep(2)
-                return self.scrape_markdown(url)  # Simple retry
             else:
                 logger.warning(f"Markdown scrape failed: {resp.status_code}")
 
@@ -699,11 +827,6 @@ class FirecrawlMixin:
         try:
             logger.info(f"🎯 Schema Extract (v2) [call #{call_num}]: {url}")
 
-            headers = {
-                "Authorization": f"Bearer {self.firecrawl_key}",
-                "Content-Type": "application/json",
-            }
-
             # Build prompt with URL context for better accuracy
             url_slug = url.rstrip("/").split("/")[-1].replace("-", " ").replace("_", " ")
             prompt_with_context = (
@@ -714,29 +837,26 @@ class FirecrawlMixin:
             # Use Pydantic schema for structured extraction
             payload: Dict[str, Any] = {
                 "urls": [url],
-                "schema": ArtworkSchema.model_json_schema(),
+                "schema": ARTWORK_JSON_SCHEMA,
                 "prompt": prompt_with_context,
             }
 
             # Step 1: Submit async extraction job (v2 API)
-            resp = requests.post(
+            resp = self._post_with_retry(
                 "https://api.firecrawl.dev/v2/extract",
-                json=payload,
-                headers=headers,
+                payload,
                 timeout=60,
+                backoff=5.0,
+                label="schema extract",
             )
 
             if resp.status_code != 200:
-                if resp.status_code == 429:
-                    logger.warning("Rate limited on schema extract, waiting...")
-                    time.sleep(5)
-                    return self._extract_with_schema(url)
                 logger.warning(f"Schema Extract submit failed: {resp.status_code}")
                 # Fallback to scrape_with_json
                 logger.info(f"↩️ Falling back to Scrape+JSON for {url}")
                 return self.scrape_with_json(url)
 
-            result = resp.json()
+            result = response_json(resp)
             if not result.get("success") or not result.get("id"):
                 logger.warning(f"Schema Extract job creation failed: {result}")
                 # Fallback to scrape_with_json
@@ -750,9 +870,8 @@ class FirecrawlMixin:
             for poll_attempt in range(max_polls):
                 time.sleep(3)  # Wait 3 seconds between polls
 
-                poll_resp = requests.get(
+                poll_resp = self.fc_session.get(
                     f"https://api.firecrawl.dev/v2/extract/{job_id}",
-                    headers=headers,
                     timeout=30,
                 )
 
@@ -760,7 +879,7 @@ class FirecrawlMixin:
                     logger.warning(f"Poll failed: {poll_resp.status_code}")
                     continue
 
-                poll_result = poll_resp.json()
+                poll_result = response_json(poll_resp)
                 status = poll_result.get("status")
 
                 if status == "completed":
@@ -824,44 +943,36 @@ class FirecrawlMixin:
             Dictionary mapping URL to extracted data (or None if failed).
         """
         if not self.firecrawl_key or not urls:
-            return {url: None for url in urls}
+            return dict.fromkeys(urls)
 
         self.rate_limiter.wait()
 
         try:
             logger.info(f"🎯 Batch Schema Extract (v2): {len(urls)} URLs")
 
-            headers = {
-                "Authorization": f"Bearer {self.firecrawl_key}",
-                "Content-Type": "application/json",
-            }
-
             # Submit batch extraction job (v2 API)
             payload = {
                 "urls": urls,
-                "schema": ArtworkSchema.model_json_schema(),
+                "schema": ARTWORK_JSON_SCHEMA,
                 "prompt": ARTWORK_EXTRACT_PROMPT,
             }
 
-            resp = requests.post(
+            resp = self._post_with_retry(
                 "https://api.firecrawl.dev/v2/extract",
-                json=payload,
-                headers=headers,
+                payload,
                 timeout=60,
+                backoff=10.0,
+                label="batch extract",
             )
 
             if resp.status_code != 200:
-                if resp.status_code == 429:
-                    logger.warning("Rate limited on batch extract, waiting...")
-                    time.sleep(10)
-                    return self._batch_extract_with_schema(urls, max_polls)
                 logger.warning(f"Batch Extract submit failed: {resp.status_code}")
-                return {url: None for url in urls}
+                return dict.fromkeys(urls)
 
-            result = resp.json()
+            result = response_json(resp)
             if not result.get("success") or not result.get("id"):
                 logger.warning(f"Batch Extract job creation failed: {result}")
-                return {url: None for url in urls}
+                return dict.fromkeys(urls)
 
             job_id = result["id"]
             logger.debug(f"Batch extract job submitted: {job_id}")
@@ -870,16 +981,15 @@ class FirecrawlMixin:
             for poll_attempt in range(max_polls):
                 time.sleep(3)
 
-                poll_resp = requests.get(
+                poll_resp = self.fc_session.get(
                     f"https://api.firecrawl.dev/v2/extract/{job_id}",
-                    headers=headers,
                     timeout=30,
                 )
 
                 if poll_resp.status_code != 200:
                     continue
 
-                poll_result = poll_resp.json()
+                poll_result = response_json(poll_resp)
                 status = poll_result.get("status")
 
                 if status == "completed":
@@ -913,16 +1023,225 @@ class FirecrawlMixin:
 
                 elif status == "failed":
                     logger.warning(f"Batch Extract job failed: {poll_result}")
-                    return {url: None for url in urls}
+                    return dict.fromkeys(urls)
 
                 logger.debug(f"Batch job {job_id} status: {status} (poll {poll_attempt + 1}/{max_polls})")
 
             logger.warning(f"Batch Extract timed out after {max_polls} polls")
-            return {url: None for url in urls}
+            return dict.fromkeys(urls)
 
         except Exception as e:
             logger.error(f"Batch Extract error: {e}")
-            return {url: None for url in urls}
+            return dict.fromkeys(urls)
+
+    def _batch_scrape_with_schema(
+        self, urls: List[str], max_wait: float = 180
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Scrape several URLs with one /v2/batch/scrape job and a JSON format.
+
+        Unlike a multi-URL Extract job, every batch document carries its own
+        ``metadata.sourceURL``, so results map back to URLs exactly instead
+        of by position. The schema and prompt are sent once per batch.
+
+        Args:
+            urls: List of URLs to scrape.
+            max_wait: Seconds to wait for the job before giving up.
+                Defaults to 180.
+
+        Returns:
+            Dictionary mapping URL to extracted data (or None if failed).
+        """
+        if not self.firecrawl_key or not urls:
+            return dict.fromkeys(urls)
+
+        self.rate_limiter.wait()
+        batch_endpoint = f"{FC_API_BASE}/v2/batch/scrape"
+
+        try:
+            logger.info(f"🎯 Batch Scrape (v2): {len(urls)} URLs")
+            payload: Dict[str, Any] = {
+                "urls": urls,
+                "formats": [
+                    {
+                        "type": "json",
+                        "schema": ARTWORK_JSON_SCHEMA,
+                        "prompt": ARTWORK_EXTRACT_PROMPT,
+                    }
+                ],
+                "onlyMainContent": True,
+                "excludeTags": SPA_EXCLUDE_TAGS,
+                "waitFor": SPA_WAIT_MS,
+            }
+
+            resp = self._post_with_retry(
+                batch_endpoint, payload, timeout=60, backoff=10.0, label="batch scrape"
+            )
+            if resp.status_code != 200:
+                logger.warning(f"Batch Scrape submit failed: {resp.status_code}")
+                return dict.fromkeys(urls)
+
+            result = response_json(resp)
+            if not result.get("success") or not result.get("id"):
+                logger.warning(f"Batch Scrape job creation failed: {result}")
+                return dict.fromkeys(urls)
+
+            status_endpoint = f"{batch_endpoint}/{result['id']}"
+            delay = POLL_INITIAL_DELAY
+            elapsed = 0.0
+
+            while elapsed < max_wait:
+                time.sleep(delay)
+                elapsed += delay
+
+                poll_resp = self.fc_session.get(status_endpoint, timeout=30)
+                delay = self._next_poll_delay(poll_resp, delay)
+                if poll_resp.status_code != 200:
+                    continue
+
+                poll_result = response_json(poll_resp)
+                status = poll_result.get("status")
+
+                if status == "completed":
+                    documents = list(poll_result.get("data") or [])
+                    # Large jobs are paginated; follow "next" until exhausted.
+                    # 5xx pages are already retried by the session adapter;
+                    # a page that still fails is retried a few times with the
+                    # poll backoff, then the remaining pages are given up on.
+                    next_url = poll_result.get("next")
+                    page_delay = POLL_INITIAL_DELAY
+                    attempts = 0
+                    while next_url:
+                        page_resp = self.fc_session.get(next_url, timeout=30)
+                        if page_resp.status_code == 200:
+                            page = response_json(page_resp)
+                            documents.extend(page.get("data") or [])
+                            next_url = page.get("next")
+                            attempts = 0
+                            continue
+                        attempts += 1
+                        if attempts >= 3:
+                            logger.warning(
+                                f"Batch Scrape results incomplete: page fetch failed "
+                                f"({page_resp.status_code}), missing URLs count as failed"
+                            )
+                            break
+                        page_delay = self._next_poll_delay(page_resp, page_delay)
+                        time.sleep(page_delay)
+
+                    wanted = {url.rstrip("/"): url for url in urls}
+                    results: Dict[str, Optional[Dict[str, Any]]] = dict.fromkeys(urls)
+                    for doc in documents:
+                        metadata = doc.get("metadata") or {}
+                        source = (metadata.get("sourceURL") or metadata.get("url") or "").rstrip("/")
+                        url = wanted.get(source)
+                        item = doc.get("json")
+                        if url and isinstance(item, dict) and item:
+                            item["url"] = url
+                            item["source"] = "batch_scrape_v2"
+                            results[url] = item
+
+                    found = sum(1 for item in results.values() if item)
+                    logger.info(f"✅ Batch Scrape success: {found}/{len(urls)} URLs")
+                    return results
+
+                elif status == "failed":
+                    logger.warning(f"Batch Scrape job failed: {poll_result}")
+                    return dict.fromkeys(urls)
+
+                logger.debug(f"Batch scrape job {result['id']} status: {status} ({elapsed:.0f}s)")
+
+            logger.warning(f"Batch Scrape timed out after {max_wait:.0f}s")
+            return dict.fromkeys(urls)
+
+        except Exception as e:
+            logger.error(f"Batch Scrape error: {e}")
+            return dict.fromkeys(urls)
+
+    def extract_works_batch(
+        self, urls: List[str], batch_size: int = BATCH_SCRAPE_SIZE
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Extract many artwork pages with one batch-scrape job per chunk of URLs.
+
+        Cheaper on HTTP round-trips and rate-limit tokens than calling
+        ``extract_work_details_v2`` per URL, at the cost of skipping the
+        Layer 1 (BS4) cross-check. Results whose title does not match their
+        URL slug are dropped, since the LLM can still pick up sidebar
+        titles (SPA contamination) without that cross-check.
+
+        Chunks are submitted side by side on up to ``max_workers`` threads;
+        each job mostly waits on status polls, so overlapping them bounds
+        wall time by the slowest job instead of the sum. Submissions still
+        draw from the shared rate limiter.
+
+        Args:
+            urls: Artwork page URLs.
+            batch_size: URLs per batch-scrape job. Defaults to
+                ``BATCH_SCRAPE_SIZE``.
+
+        Returns:
+            Dictionary mapping each URL to its artwork data, or None for
+            exhibitions, failures and rejected results.
+        """
+        results: Dict[str, Optional[Dict[str, Any]]] = {}
+        cached_works = self._load_cache_many(urls) if self.use_cache else {}
+        pending: List[str] = []
+        for url in urls:
+            cached = cached_works.get(url)
+            if cached:
+                results[url] = self._resolve_cached_work(url, cached)
+            else:
+                pending.append(url)
+
+        for url, data in self._extract_uncached_batch(pending, batch_size).items():
+            results[url] = data if data and is_artwork(data) else None
+
+        return results
+
+    def _extract_uncached_batch(
+        self, urls: List[str], batch_size: int = BATCH_SCRAPE_SIZE
+    ) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Batch-scrape URLs already known to be cache misses.
+
+        The network half of ``extract_works_batch``, for callers that did
+        their own bulk cache read. Results get the same title cleanup as
+        ``extract_work_details_v2``, are title-checked, have their year
+        normalized and are cached. Non-artworks are kept so that callers can
+        tell them apart from failures.
+
+        Args:
+            urls: Artwork page URLs with no usable cache entry.
+            batch_size: URLs per batch-scrape job. Defaults to
+                ``BATCH_SCRAPE_SIZE``.
+
+        Returns:
+            Dictionary mapping each URL to its extracted data, or None when
+            its job failed or the result was rejected.
+        """
+        chunks = [urls[start:start + batch_size] for start in range(0, len(urls), batch_size)]
+        if not chunks:
+            return {}
+
+        # Validation and cache writes stay on this thread, in input order
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(chunks))) as executor:
+            chunk_results = list(executor.map(self._batch_scrape_with_schema, chunks))
+
+        results: Dict[str, Optional[Dict[str, Any]]] = {}
+        for batch in chunk_results:
+            for url, data in batch.items():
+                # Cleaned first: a type string as title is fixed from the slug, not rejected
+                if data:
+                    self._clean_title_fields(url, data)
+                if data and not self._validate_title_against_url(data.get("title", ""), url):
+                    logger.warning(f"⚠️ Batch result REJECTED (title mismatch): {url}")
+                    data = None
+                if data:
+                    if data.get("year"):
+                        data["year"] = normalize_year(data["year"])
+                    if self.use_cache:
+                        self._save_cache(url, data)
+                results[url] = data
+
+        return results
 
     # Known sidebar titles that should NOT be used as titles for other pages
     # These are actual artwork titles that appear in the navigation sidebar
@@ -1297,6 +1616,77 @@ class FirecrawlMixin:
 
         return title, title_cn
 
+    def _clean_title_fields(
+        self, url: str, data: Dict[str, Any], *, drop_title_cn: bool = False
+    ) -> bool:
+        """Apply the post-extraction title fixes to an artwork dict in place.
+
+        Collapses bilingual/duplicated titles (``_clean_duplicate_title``) and,
+        when the title is really a type string (e.g. "sculpture"), moves it to
+        ``type`` and uses the URL slug as the title.
+
+        Args:
+            url: Artwork page URL (source of the slug title).
+            data: Artwork dictionary to fix.
+            drop_title_cn: Also clear ``title_cn`` when the title was a type
+                string. Defaults to False.
+
+        Returns:
+            True if any field was changed.
+        """
+        changed = False
+        title = data.get('title', '')
+        title_cn = data.get('title_cn', '')
+        clean_title, clean_cn = self._clean_duplicate_title(title, title_cn)
+        if clean_title != title or clean_cn != title_cn:
+            logger.debug(f"Title cleaned: '{title}' -> '{clean_title}', '{title_cn}' -> '{clean_cn}'")
+            data['title'] = clean_title
+            data['title_cn'] = clean_cn
+            changed = True
+
+        # Fix title-as-type bug: if title is actually a type string (e.g., "sculpture"),
+        # use the URL slug as the real title and move the title to the type field
+        final_title = data.get('title', '')
+        if final_title and self._is_type_string(final_title):
+            url_slug = url.rstrip("/").split("/")[-1]
+            slug_title = url_slug.replace("-", " ").replace("_", " ").title()
+            logger.warning(
+                f"⚠️ Title '{final_title}' is a type string, "
+                f"using URL slug '{slug_title}' as title"
+            )
+            # Move to type if type is empty
+            if not data.get('type'):
+                data['type'] = final_title.title()
+            data['title'] = slug_title
+            if drop_title_cn:
+                data['title_cn'] = ''
+            changed = True
+
+        return changed
+
+    def _resolve_cached_work(self, url: str, cached: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Apply post-extraction fixes to a cache hit and decide whether to keep it.
+
+        Cached entries may predate title cleanup fixes, so the same title
+        validation as a fresh extraction is re-applied (and written back).
+
+        Args:
+            url: Artwork page URL the entry was cached under.
+            cached: Cached artwork dictionary.
+
+        Returns:
+            The (possibly corrected) artwork dictionary, or None if the cached
+            entry is an exhibition/catalog.
+        """
+        if not is_artwork(cached):
+            logger.debug(f"Cache hit (exhibition, skipped): {url}")
+            return None
+        # Apply title validation to cached data (may predate fixes)
+        if self._clean_title_fields(url, cached, drop_title_cn=True):
+            self._save_cache(url, cached)
+        logger.debug(f"Cache hit: {url}")
+        return cached
+
     def extract_work_details_v2(self, url: str) -> Optional[Dict[str, Any]]:
         """Optimized two-layer extraction strategy for maximum completeness.
 
@@ -1318,30 +1708,7 @@ class FirecrawlMixin:
         if self.use_cache:
             cached = self._load_cache(url)
             if cached:
-                if not is_artwork(cached):
-                    logger.debug(f"Cache hit (exhibition, skipped): {url}")
-                    return None
-                # Apply title validation to cached data (may predate fixes)
-                title = cached.get('title', '')
-                title_cn = cached.get('title_cn', '')
-                clean_title, clean_cn = self._clean_duplicate_title(title, title_cn)
-                if clean_title != title or clean_cn != title_cn:
-                    cached['title'] = clean_title
-                    cached['title_cn'] = clean_cn
-                    if self.use_cache:
-                        self._save_cache(url, cached)
-                final_title = cached.get('title', '')
-                if final_title and self._is_type_string(final_title):
-                    url_slug = url.rstrip("/").split("/")[-1]
-                    slug_title = url_slug.replace("-", " ").replace("_", " ").title()
-                    if not cached.get('type'):
-                        cached['type'] = final_title.title()
-                    cached['title'] = slug_title
-                    cached['title_cn'] = ''
-                    if self.use_cache:
-                        self._save_cache(url, cached)
-                logger.debug(f"Cache hit: {url}")
-                return cached
+                return self._resolve_cached_work(url, cached)
 
         # Layer 1: BS4 local parsing (0 credits)
         local_data = None
@@ -1496,28 +1863,7 @@ class FirecrawlMixin:
 
         # Clean up duplicate titles before caching
         if local_data:
-            title = local_data.get('title', '')
-            title_cn = local_data.get('title_cn', '')
-            clean_title, clean_cn = self._clean_duplicate_title(title, title_cn)
-            if clean_title != title or clean_cn != title_cn:
-                logger.debug(f"Title cleaned: '{title}' -> '{clean_title}', '{title_cn}' -> '{clean_cn}'")
-                local_data['title'] = clean_title
-                local_data['title_cn'] = clean_cn
-
-            # Fix title-as-type bug: if title is actually a type string (e.g., "sculpture"),
-            # use the URL slug as the real title and move the title to the type field
-            final_title = local_data.get('title', '')
-            if final_title and self._is_type_string(final_title):
-                url_slug = url.rstrip("/").split("/")[-1]
-                slug_title = url_slug.replace("-", " ").replace("_", " ").title()
-                logger.warning(
-                    f"⚠️ Title '{final_title}' is a type string, "
-                    f"using URL slug '{slug_title}' as title"
-                )
-                # Move to type if type is empty
-                if not local_data.get('type'):
-                    local_data['type'] = final_title.title()
-                local_data['title'] = slug_title
+            self._clean_title_fields(url, local_data)
 
         # Cache and return
         if local_data and self.use_cache:
@@ -1525,14 +1871,13 @@ class FirecrawlMixin:
 
         return local_data
 
-    def _extract_with_llm(self, url: str, retry_count: int = 0) -> Optional[Dict[str, Any]]:
+    def _extract_with_llm(self, url: str) -> Optional[Dict[str, Any]]:
         """Extract data using Firecrawl LLM (~20-50 credits, token-based).
 
         This is the most expensive extraction method, used as last resort.
 
         Args:
             url: URL to extract from.
-            retry_count: Current retry attempt for rate limiting.
 
         Returns:
             Extracted work dictionary, or None if extraction fails.
@@ -1542,48 +1887,10 @@ class FirecrawlMixin:
         self.rate_limiter.wait()
 
         try:
-            logger.info(f"[{retry_count+1}/{max_retries}] LLM Extract: {url}")
+            logger.info(f"LLM Extract: {url}")
 
             fc_endpoint = "https://api.firecrawl.dev/v2/scrape"
 
-            # Schema for LLM extraction
-            schema: Dict[str, Any] = {
-                "type": "object",
-                "properties": {
-                    "title": {"type": "string", "description": "The English title of the work"},
-                    "title_cn": {
-                        "type": "string",
-                        "description": "The Chinese title of the work. If not explicitly found, leave empty.",
-                    },
-                    "year": {
-                        "type": "string",
-                        "description": "Creation year or year range (e.g. 2018-2022)",
-                    },
-                    "category": {
-                        "type": "string",
-                        "description": "The art category (e.g. Video Installation, Software, Website, Exhibition)",
-                    },
-                    "materials": {
-                        "type": "string",
-                        "description": "Physical materials ONLY (e.g. LED, acrylic, wood, silicone, screen printing). Do NOT include credits or collaborators here.",
-                    },
-                    "size": {
-                        "type": "string",
-                        "description": "Physical dimensions (e.g. '180 x 180 cm', 'Dimension variable'). Leave empty if not specified.",
-                    },
-                    "duration": {
-                        "type": "string",
-                        "description": "Video duration for video/film works (e.g. '4:30', '2′47′'). Leave empty for non-video works.",
-                    },
-                    "credits": {
-                        "type": "string",
-                        "description": "Credits and collaborators (e.g. 'Photo: John', 'concept: aaajiao; sound: yang2'). Separate from materials.",
-                    },
-                    "video_link": {"type": "string", "description": "Vimeo URL if present"},
-                },
-                "required": ["title"],
-            }
-
             url_slug = url.rstrip("/").split("/")[-1].replace("-", " ").replace("_", " ")
 
             payload: Dict[str, Any] = {
@@ -1591,33 +1898,24 @@ class FirecrawlMixin:
                 "formats": [
                     {
                         "type": "json",
-                        "schema": schema,
-                        "prompt": (
-                            f"You are an art archivist. This is a Single Page Application (SPA) portfolio site. "
-                            f"IMPORTANT: Extract ONLY the artwork that matches the URL slug '{url_slug}'. "
-                            f"The page may show multiple artworks, but you must find and extract the one "
-                            f"whose title or ID matches '{url_slug}'. "
-                            f"Ignore navigation links and other artworks. "
-                            f"The title usually appears as 'English Title / Chinese Title'. Separate them. "
-                            f"Materials = physical materials only (LED, acrylic, wood). "
-                            f"Credits = collaborators (concept: xxx, sound: xxx). Keep them separate."
-                        ),
+                        "schema": LLM_EXTRACT_SCHEMA,
+                        "prompt": LLM_EXTRACT_PROMPT.format(url_slug=url_slug),
                     }
                 ],
-                "onlyMainContent": True,
-                "excludeTags": SPA_EXCLUDE_TAGS,
-                "waitFor": SPA_WAIT_MS,
-            }
-
-            headers = {
-                "Authorization": f"Bearer {self.firecrawl_key}",
-                "Content-Type": "application/json",
+                **_LLM_SCRAPE_OPTIONS,
             }
 
-            resp = requests.post(fc_endpoint, json=payload, headers=headers, timeout=FC_TIMEOUT)
+            resp = self._post_with_retry(
+                fc_endpoint,
+                payload,
+                timeout=FC_TIMEOUT,
+                max_retries=max_retries,
+                backoff=1.0,
+                label="LLM extract",
+            )
 
             if resp.status_code == 200:
-                data = resp.json()
+                data = response_json(resp)
                 json_data = data.get("data", {}).get("json")
                 if json_data:
                     work = {
@@ -1637,11 +1935,11 @@ class FirecrawlMixin:
                     }
 
                     # Post-processing: Split bilingual title
-                    if not work["title_cn"] and "/" in work["title"]:
-                        parts = work["title"].split("/")
-                        work["title"] = parts[0].strip()
-                        if len(parts) > 1:
-                            work["title_cn"] = parts[1].strip()
+                    if not work["title_cn"]:
+                        head, sep, tail = work["title"].partition("/")
+                        if sep:
+                            work["title"] = head.strip()
+                            work["title_cn"] = tail.partition("/")[0].strip()
 
                     # Normalize year
                     if work["year"]:
@@ -1663,13 +1961,7 @@ class FirecrawlMixin:
                     logger.error(f"Firecrawl returned unexpected format: {data}")
 
             elif resp.status_code == 429:
-                if retry_count >= max_retries:
-                    logger.error(f"Max retries exceeded: {url}")
-                    return None
-                wait_time = 2 ** retry_count
-                logger.warning(f"Rate limited, waiting {wait_time}s before retry...")
-                time.sleep(wait_time)
-                return self._extract_with_llm(url, retry_count + 1)
+                logger.error(f"Max retries exceeded: {url}")
 
             else:
                 logger.error(f"Firecrawl Error {resp.status_code}: {resp.text[:200]}")
@@ -1680,12 +1972,152 @@ class FirecrawlMixin:
             logger.error(f"LLM extraction error {url}: {e}")
             return None
 
+    @staticmethod
+    def _finalize_batch_item(url: str, status_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Turn a completed /v2/extract job response into a result item.
+
+        Args:
+            url: Source URL of the extraction job.
+            status_data: JSON body of the completed job status response.
+
+        Returns:
+            Extracted item with ``url`` set; flagged with ``error`` if empty.
+        """
+        data = status_data.get("data", {})
+        # Handle list or single object
+        if isinstance(data, list):
+            item = data[0] if data else {}
+        else:
+            item = data
+
+        # Ensure URL is set
+        if not item.get("url"):
+            item["url"] = url
+
+        # Validate: must have title or meaningful content
+        if not item.get("title") and not item.get("description_en") and not item.get("images"):
+            logger.warning(f"⚠️ [{url[:40]}...] Empty extraction result")
+            item["title"] = "[Error: Empty Content]"
+            item["error"] = "Extraction returned empty data"
+
+        logger.info(f"✅ [{item.get('title', url)[:30]}...] Extracted")
+        return item
+
+    async def _extract_url_async(
+        self,
+        session: "aiohttp.ClientSession",
+        sem: asyncio.Semaphore,
+        url: str,
+        prompt: str,
+        schema: Optional[Dict[str, Any]],
+    ) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """Submit and poll a single /v2/extract job on the event loop.
+
+        Async counterpart of the thread-pool worker in ``agent_search``;
+        returns the same ``(url, item)`` pairs, including error items.
+        """
+        extract_endpoint = "https://api.firecrawl.dev/v2/extract"
+        payload: Dict[str, Any] = {
+            "urls": [url],
+            "prompt": prompt,
+            "enableWebSearch": False,
+        }
+        if schema:
+            payload["schema"] = schema
+
+        async with sem:
+            try:
+                status_code, result = await self._post_with_retry_async(
+                    session, extract_endpoint, payload, label=f"extract [{url[:30]}...]"
+                )
+                if result is None:
+                    logger.error(f"❌ [{url[:50]}...] Submit failed: {status_code}")
+                    return url, {"url": url, "title": "[Error: Submit Failed]", "error": f"HTTP {status_code}"}
+
+                if not result.get("success"):
+                    logger.error(f"❌ [{url[:50]}...] API error: {result}")
+                    return url, {"url": url, "title": "[Error: API Failed]", "error": str(result)}
+
+                status_endpoint = f"{extract_endpoint}/{result.get('id')}"
+
+                # Poll for completion (max 3 min per URL), backing off between polls
+                max_wait = 180
+                delay = POLL_INITIAL_DELAY
+                elapsed = 0.0
+
+                while elapsed < max_wait:
+                    await asyncio.sleep(delay)
+                    elapsed += delay
+
+                    async with session.get(status_endpoint) as status_resp:
+                        delay = self._next_poll_delay(status_resp, delay)
+                        if status_resp.status != 200:
+                            continue
+                        status_data = await status_resp.json(loads=json_loads)
+
+                    status = status_data.get("status")
+                    if status == "completed":
+                        return url, self._finalize_batch_item(url, status_data)
+                    elif status == "failed":
+                        logger.error(f"❌ [{url[:50]}...] Job failed")
+                        return url, {"url": url, "title": "[Error: Job Failed]", "error": "Extraction job failed"}
+
+                logger.error(f"⏰ [{url[:50]}...] Timeout (3min)")
+                return url, {"url": url, "title": "[Error: Timeout]", "error": "Extraction timeout"}
+
+            except Exception as e:
+                logger.error(f"❌ [{url[:50]}...] Exception: {e}")
+                return url, {"url": url, "title": "[Error: Exception]", "error": str(e)}
+
+    async def _extract_urls_async(
+        self,
+        urls: List[str],
+        prompt: str,
+        schema: Optional[Dict[str, Any]],
+        concurrency: int = 3,
+    ) -> List[Tuple[str, Optional[Dict[str, Any]]]]:
+        """Fan out /v2/extract jobs over one shared aiohttp session.
+
+        A semaphore bounds in-flight jobs and the shared token bucket still
+        paces submissions, so concurrency is limited by the rate budget
+        rather than by OS threads. The connector is dedicated to the
+        Firecrawl API and capped per host, so direct site fetches never
+        share its connection budget.
+
+        Args:
+            urls: URLs to extract.
+            prompt: Extraction prompt.
+            schema: Optional JSON schema for structured output.
+            concurrency: Maximum jobs in flight. Defaults to 3.
+
+        Returns:
+            List of ``(url, item)`` pairs in input order.
+        """
+        sem = asyncio.Semaphore(concurrency)
+        connector = aiohttp.TCPConnector(
+            limit=concurrency, limit_per_host=concurrency, ttl_dns_cache=300, keepalive_timeout=30
+        )
+        headers = {
+            "Authorization": f"Bearer {self.firecrawl_key}",
+            "Content-Type": "application/json",
+        }
+        async with aiohttp.ClientSession(
+            connector=connector,
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=FC_TIMEOUT),
+            json_serialize=json_dumps,
+        ) as session:
+            return await asyncio.gather(
+                *(self._extract_url_async(session, sem, url, prompt, schema) for url in urls)
+            )
+
     def agent_search(
         self,
         prompt: str,
         urls: Optional[List[str]] = None,
         max_credits: int = 50,
         extraction_level: str = "custom",
+        use_async: bool = False,
     ) -> Optional[Dict[str, Any]]:
         """Intelligent search/extraction entry point for batch or agent mode.
         
@@ -1706,17 +2138,22 @@ class FirecrawlMixin:
                 For agent: limits search result count.
             extraction_level: Schema mode - 'quick', 'full', 'images_only', or 'custom'.
                 Defaults to 'custom'. Determines which predefined schema to use.
+            use_async: Run batch extraction on a single aiohttp event loop
+                instead of a thread pool. Requires the optional ``aiohttp``
+                dependency; falls back to threads if it is missing.
         
         Returns:
             Dictionary with extraction results:
                 - data: List of extracted items (dicts)
                 - cached_count: Number of cache hits (batch mode only)
                 - new_count: Number of new extractions (batch mode only)
-                - from_cache: True if all results from cache (batch mode only)
+                - from_cache: True if all results came from cache
             Returns None if extraction/search fails.
             
         Note:
-            - Batch mode checks cache first for each URL
+            - Batch mode checks cache first for each URL; agent mode per query
+            - With ``use_cache`` off, cache reads are skipped but new results
+              are still saved
             - Uses async job polling (up to 10min timeout)
             - Automatically saves new results to cache
             - Falls back to cached results on API failure
@@ -1758,11 +2195,13 @@ class FirecrawlMixin:
             # Limit URLs to match max credits
             target_urls = urls[:max_credits]
 
-            # === Cache check: separate cached and uncached URLs ===
+            # === Cache check: separate cached and uncached URLs (one bulk read) ===
+            # With use_cache off every URL is re-extracted; results are still saved
+            cached_by_url = self._load_extract_cache_many(target_urls, prompt) if self.use_cache else {}
             cached_results: List[Dict[str, Any]] = []
             uncached_urls: List[str] = []
             for url in target_urls:
-                cached = self._load_extract_cache(url, prompt)
+                cached = cached_by_url.get(url)
                 if cached:
                     cached_results.append(cached)
                 else:
@@ -1781,13 +2220,11 @@ class FirecrawlMixin:
                     "cached_count": len(cached_results),
                 }
 
-            logger.info(f"🚀 Starting concurrent extraction (Target: {len(uncached_urls)} URLs, Workers: 3)")
+            logger.info(
+                f"🚀 Starting concurrent extraction (Target: {len(uncached_urls)} URLs, Workers: {self.max_workers})"
+            )
 
             extract_endpoint = "https://api.firecrawl.dev/v2/extract"
-            headers = {
-                "Authorization": f"Bearer {self.firecrawl_key}",
-                "Content-Type": "application/json",
-            }
 
             def extract_single_url(url: str) -> Tuple[str, Optional[Dict[str, Any]]]:
                 """Extract data from a single URL with job polling."""
@@ -1801,13 +2238,13 @@ class FirecrawlMixin:
 
                 try:
                     # 1. Submit job
-                    resp = requests.post(extract_endpoint, json=payload, headers=headers, timeout=FC_TIMEOUT)
+                    resp = self._post_with_retry(extract_endpoint, payload, label="extract submit")
                     
                     if resp.status_code != 200:
                         logger.error(f"❌ [{url[:50]}...] Submit failed: {resp.status_code}")
                         return url, {"url": url, "title": "[Error: Submit Failed]", "error": f"HTTP {resp.status_code}"}
 
-                    result = resp.json()
+                    result = response_json(resp)
                     if not result.get("success"):
                         logger.error(f"❌ [{url[:50]}...] API error: {result}")
                         return url, {"url": url, "title": "[Error: API Failed]", "error": str(result)}
@@ -1815,42 +2252,25 @@ class FirecrawlMixin:
                     job_id = result.get("id")
                     status_endpoint = f"{extract_endpoint}/{job_id}"
 
-                    # 2. Poll for completion (max 3 min per URL)
+                    # 2. Poll for completion (max 3 min per URL), backing off between polls
                     max_wait = 180
-                    poll_interval = 3
-                    elapsed = 0
+                    delay = POLL_INITIAL_DELAY
+                    elapsed = 0.0
 
                     while elapsed < max_wait:
-                        time.sleep(poll_interval)
-                        elapsed += poll_interval
+                        time.sleep(delay)
+                        elapsed += delay
 
-                        status_resp = requests.get(status_endpoint, headers=headers, timeout=FC_TIMEOUT)
+                        status_resp = self.fc_session.get(status_endpoint, timeout=FC_TIMEOUT)
+                        delay = self._next_poll_delay(status_resp, delay)
                         if status_resp.status_code != 200:
                             continue
 
-                        status_data = status_resp.json()
+                        status_data = response_json(status_resp)
                         status = status_data.get("status")
 
                         if status == "completed":
-                            data = status_data.get("data", {})
-                            # Handle list or single object
-                            if isinstance(data, list):
-                                item = data[0] if data else {}
-                            else:
-                                item = data
-                            
-                            # Ensure URL is set
-                            if not item.get("url"):
-                                item["url"] = url
-                            
-                            # Validate: must have title or meaningful content
-                            if not item.get("title") and not item.get("description_en") and not item.get("images"):
-                                logger.warning(f"⚠️ [{url[:40]}...] Empty extraction result")
-                                item["title"] = "[Error: Empty Content]"
-                                item["error"] = "Extraction returned empty data"
-                            
-                            logger.info(f"✅ [{item.get('title', url)[:30]}...] Extracted")
-                            return url, item
+                            return url, self._finalize_batch_item(url, status_data)
 
                         elif status == "failed":
                             logger.error(f"❌ [{url[:50]}...] Job failed")
@@ -1864,20 +2284,30 @@ class FirecrawlMixin:
                     logger.error(f"❌ [{url[:50]}...] Exception: {e}")
                     return url, {"url": url, "title": "[Error: Exception]", "error": str(e)}
 
-            # === Concurrent execution with ThreadPoolExecutor ===
+            # === Concurrent execution (aiohttp event loop or ThreadPoolExecutor) ===
             try:
                 new_results: List[Dict[str, Any]] = []
                 
-                with ThreadPoolExecutor(max_workers=3) as executor:
-                    future_to_url = {executor.submit(extract_single_url, url): url for url in uncached_urls}
-                    
-                    for future in as_completed(future_to_url):
-                        url, result = future.result()
-                        if result:
-                            new_results.append(result)
-                            # Save to cache (only successful extractions)
-                            if not result.get("error"):
-                                self._save_extract_cache(url, prompt, result)
+                if use_async and aiohttp is None:
+                    logger.info("aiohttp not installed, falling back to thread pool")
+
+                if use_async and aiohttp is not None:
+                    pairs = run_async(
+                        self._extract_urls_async(uncached_urls, prompt, schema, concurrency=self.max_workers)
+                    )
+                else:
+                    # map() keeps input order, matching the asyncio.gather path above
+                    with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                        pairs = list(executor.map(extract_single_url, uncached_urls))
+
+                to_cache: Dict[str, Dict[str, Any]] = {}
+                for url, result in pairs:
+                    if result:
+                        new_results.append(result)
+                        # Save to cache (only successful extractions)
+                        if not result.get("error"):
+                            to_cache[url] = result
+                self._save_extract_cache_many(prompt, to_cache)
 
                 logger.info(f"✅ Concurrent extraction complete. Total: {len(new_results)} results")
 
@@ -1905,24 +2335,27 @@ class FirecrawlMixin:
             logger.info("🤖 Starting Smart Agent task (open search)...")
 
             agent_endpoint = "https://api.firecrawl.dev/v2/agent"
-            headers = {
-                "Authorization": f"Bearer {self.firecrawl_key}",
-                "Content-Type": "application/json",
-            }
 
             payload = {
                 "query": f"{prompt} site:eventstructure.com",
                 "limit": max_credits,
             }
 
+            if self.use_cache:
+                cached = self._load_agent_cache(payload["query"], max_credits)
+                if cached is not None:
+                    logger.info("✅ Agent result from cache, saving API calls!")
+                    cached["from_cache"] = True
+                    return cached
+
             try:
                 # 1. Submit job
-                resp = requests.post(agent_endpoint, json=payload, headers=headers, timeout=FC_TIMEOUT)
+                resp = self._post_with_retry(agent_endpoint, payload, label="agent submit")
 
                 if resp.status_code != 200:
                     raise RuntimeError(f"Agent start failed: {resp.status_code} - {resp.text}")
 
-                result = resp.json()
+                result = response_json(resp)
                 if not result.get("success"):
                     raise RuntimeError(f"Agent start failed: {result}")
 
@@ -1931,29 +2364,32 @@ class FirecrawlMixin:
                 logger.info(f"   Agent job ID: {job_id}")
                 status_endpoint = f"{agent_endpoint}/{job_id}"
                 max_wait = 600
-                poll_interval = 5
-                elapsed = 0
+                delay = POLL_INITIAL_DELAY
+                elapsed = 0.0
 
                 while elapsed < max_wait:
-                    time.sleep(poll_interval)
-                    elapsed += poll_interval
+                    time.sleep(delay)
+                    elapsed += delay
 
-                    status_resp = requests.get(
-                        status_endpoint, headers=headers, timeout=FC_TIMEOUT
+                    status_resp = self.fc_session.get(
+                        status_endpoint, timeout=FC_TIMEOUT
                     )
+                    delay = self._next_poll_delay(status_resp, delay)
                     if status_resp.status_code != 200:
                         continue
 
-                    status_data = status_resp.json()
+                    status_data = response_json(status_resp)
                     status = status_data.get("status")
 
                     if status == "processing":
-                        logger.info(f"   ⏳ Thinking... ({elapsed}s)")
+                        logger.info(f"   ⏳ Thinking... ({elapsed:.0f}s)")
                     elif status == "completed":
                         credits = status_data.get("creditsUsed", "N/A")
                         data = status_data.get("data", [])
                         logger.info(f"✅ Agent task complete (Credits: {credits})")
-                        return {"data": data}
+                        result = {"data": data}
+                        self._save_agent_cache(payload["query"], max_credits, result)
+                        return result
                     elif status == "failed":
                         raise RuntimeError("Agent task failed")
 
@@ -2004,8 +2440,8 @@ class FirecrawlMixin:
         cache_path = self._get_discovery_cache_path(url, scroll_mode)
         if use_cache and self._is_discovery_cache_valid(cache_path):
             try:
-                with open(cache_path, "r") as f:
-                    cached = json.load(f)
+                with open(cache_path, "rb") as f:
+                    cached = json_loads(f.read())
                     logger.info(f"✅ Discovery cache hit: {len(cached)} links (TTL: 24h)")
                     return cached
             except Exception:
@@ -2051,36 +2487,30 @@ class FirecrawlMixin:
                 actions.append({"type": "scroll", "direction": "down"})
 
         endpoint = "https://api.firecrawl.dev/v2/scrape"
-        headers = {
-            "Authorization": f"Bearer {self.firecrawl_key}",
-            "Content-Type": "application/json",
-        }
 
+        # "links" is extracted server-side from the rendered DOM: no LLM
+        # credits and no HTML body to download or parse here
         payload = {
             "url": url,
-            "formats": ["extract"],
+            "formats": ["links"],
             "actions": actions,
-            "extract": {
-                "prompt": "Extract all artwork URLs from the page. Return ONLY a list of URLs."
-            },
         }
 
         try:
-            resp = requests.post(endpoint, json=payload, headers=headers, timeout=60)
+            resp = self._post_with_retry(endpoint, payload, timeout=60, label="link discovery")
             if resp.status_code == 200:
-                data = resp.json()
-                # Extract URLs from response
-                # Note: Actual parsing depends on Firecrawl's response format
-                links = [
-                    item.get("url")
-                    for item in data.get("data", {}).get("extract", {}).get("urls", [])
-                    if item.get("url")
-                ]
+                data = response_json(resp)
+                all_links = data.get("data", {}).get("links") or []
+                is_valid = getattr(self, "_is_valid_work_link", None)
+                links = list(dict.fromkeys(
+                    link for link in all_links
+                    if isinstance(link, str) and (is_valid is None or is_valid(link))
+                ))
 
                 # Save to cache
                 if links:
-                    with open(cache_path, "w") as f:
-                        json.dump(links, f)
+                    with open(cache_path, "w", encoding="utf-8") as f:
+                        f.write(json_dumps(links))
                     logger.info(f"📦 Cached {len(links)} discovered URLs")
 
                 return links
@@ -2119,49 +2549,42 @@ class FirecrawlMixin:
         try:
             logger.info(f"🗺️ Map API discovery: {target_url}")
 
-            headers = {
-                "Authorization": f"Bearer {self.firecrawl_key}",
-                "Content-Type": "application/json",
-            }
-
             payload: Dict[str, Any] = {
                 "url": target_url,
             }
             if search:
                 payload["search"] = search
 
-            resp = requests.post(
+            resp = self._post_with_retry(
                 "https://api.firecrawl.dev/v2/map",
-                json=payload,
-                headers=headers,
+                payload,
                 timeout=FC_TIMEOUT,
+                backoff=5.0,
+                label="Map API",
             )
 
             if resp.status_code == 200:
-                data = resp.json()
+                data = response_json(resp)
                 if data.get("success"):
                     all_links = data.get("links", [])
-                    # Filter to valid artwork links
-                    valid_links = []
-                    for link in all_links:
-                        link_url = link if isinstance(link, str) else link.get("url", "")
-                        if link_url and hasattr(self, "_is_valid_work_link"):
-                            if self._is_valid_work_link(link_url):
-                                valid_links.append(link_url)
-                        elif link_url:
-                            valid_links.append(link_url)
+                    link_urls = (
+                        link if isinstance(link, str) else link.get("url", "")
+                        for link in all_links
+                    )
+                    # Filter to valid artwork links (validator looked up once, not per link)
+                    is_valid = getattr(self, "_is_valid_work_link", None)
+                    valid_links = [
+                        link_url for link_url in link_urls
+                        if link_url and (is_valid is None or is_valid(link_url))
+                    ]
 
                     logger.info(
                         f"✅ Map discovered {len(valid_links)} artwork URLs "
                         f"(from {len(all_links)} total)"
                     )
-                    return sorted(list(set(valid_links)))
+                    return list(dict.fromkeys(valid_links))
                 else:
                     logger.warning(f"Map API returned error: {data}")
-            elif resp.status_code == 429:
-                logger.warning("Rate limited on Map API, waiting...")
-                time.sleep(5)
-                return self.discover_urls_with_map(url, search)
             else:
                 logger.warning(f"Map API failed: {resp.status_code}")
 
@@ -2207,7 +2630,7 @@ class FirecrawlMixin:
             url_slug = url.rstrip("/").split("/")[-1].replace("-", " ").replace("_", " ")
 
             # Build schema
-            extraction_schema = schema or ArtworkSchema.model_json_schema()
+            extraction_schema = schema or ARTWORK_JSON_SCHEMA
 
             # Build prompt with URL context
             extraction_prompt = prompt or ARTWORK_EXTRACT_PROMPT
@@ -2223,11 +2646,6 @@ class FirecrawlMixin:
                 },
             ]
 
-            headers = {
-                "Authorization": f"Bearer {self.firecrawl_key}",
-                "Content-Type": "application/json",
-            }
-
             payload: Dict[str, Any] = {
                 "url": url,
                 "formats": formats,
@@ -2240,21 +2658,20 @@ class FirecrawlMixin:
             if wait_for_spa:
                 payload["waitFor"] = SPA_WAIT_MS
                 # Add actions to wait for content and dismiss overlays
-                payload["actions"] = [
-                    {"type": "wait", "milliseconds": SPA_WAIT_MS},
-                ]
+                payload["actions"] = SPA_WAIT_ACTIONS
 
             logger.info(f"🔍 Scrape+JSON: {url}")
 
-            resp = requests.post(
+            resp = self._post_with_retry(
                 "https://api.firecrawl.dev/v2/scrape",
-                json=payload,
-                headers=headers,
+                payload,
                 timeout=60,
+                backoff=5.0,
+                label="Scrape+JSON",
             )
 
             if resp.status_code == 200:
-                data = resp.json()
+                data = response_json(resp)
                 json_data = data.get("data", {}).get("json")
 
                 if json_data:
@@ -2293,10 +2710,6 @@ class FirecrawlMixin:
 
                 logger.warning(f"Scrape+JSON returned no JSON data for {url}")
 
-            elif resp.status_code == 429:
-                logger.warning("Rate limited on Scrape+JSON, waiting...")
-                time.sleep(5)
-                return self.scrape_with_json(url, schema, prompt, wait_for_spa)
             else:
                 logger.warning(f"Scrape+JSON failed: {resp.status_code}")
 
@@ -9,19 +9,55 @@ This module provides functionality to generate various output formats:
 Supports both basic scraper output and AI extraction results.
 """
 
-import json
+import itertools
 import logging
 import os
+from collections.abc import Iterable
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
-import requests
+try:
+    import aiohttp
+except ImportError:  # Optional: pip install ".[async]"
+    aiohttp = None
 
 from .constants import BASE_URL
+from .core import json_dumpb, json_loads, run_async
 from .paths import resolve_shared_artifact_path
 
 logger = logging.getLogger(__name__)
 
+# Write buffer for generated reports: many small writes, few syscalls
+_WRITE_BUFFER = 1 << 16
+
+# (field, label) pairs emitted per work by generate_markdown, in order
+_MARKDOWN_FIELDS = (
+    ("year", "Year"),
+    ("type", "Type"),
+    ("materials", "Materials"),
+    ("size", "Size"),
+    ("duration", "Duration"),
+    ("video_link", "Video"),
+    ("description_cn", "中文描述"),
+    ("description_en", "Description"),
+)
+
+
+def _plan_image_downloads(urls: Iterable[Any]) -> List[Tuple[str, str]]:
+    """Pair each unique http(s) image URL with a numbered local filename.
+
+    Done up front so the download loop is pure I/O. Files are numbered in
+    order (``01.jpg``, ``02.png``, ...), keeping the URL's extension.
+    """
+    unique = [
+        url for url in dict.fromkeys(urls)
+        if isinstance(url, str) and url.startswith(("http://", "https://"))
+    ]
+    return [
+        (url, f"{n:02d}{os.path.splitext(url.split('?')[0])[1] or '.jpg'}")
+        for n, url in enumerate(unique, 1)
+    ]
+
 
 class ReportMixin:
     """Mixin providing report generation functionality.
@@ -44,6 +80,10 @@ class ReportMixin:
         Note:
             Outputs UTF-8 encoded JSON with 2-space indentation.
             Uses ensure_ascii=False to preserve Chinese characters.
+            Works are serialized and written one at a time into a ``.tmp``
+            sibling, so the whole document is never held in memory, then
+            swapped in with ``os.replace``; an interrupted run never leaves
+            a torn file.
             
         Example:
             >>> scraper = AaajiaoScraper()
@@ -52,10 +92,40 @@ class ReportMixin:
         """
         target_path = resolve_shared_artifact_path(filename)
         target_path.parent.mkdir(parents=True, exist_ok=True)
-        with target_path.open("w", encoding="utf-8") as f:
-            json.dump(self.works, f, ensure_ascii=False, indent=2)
+        tmp_path = target_path.with_name(f"{target_path.name}.tmp")
+        try:
+            with open(tmp_path, "wb", buffering=_WRITE_BUFFER) as f:
+                # Same bytes as dumping the whole list: each work nests one level deeper
+                separator = b"[\n  "
+                for work in self.works:
+                    f.write(separator)
+                    f.write(json_dumpb(work, indent=True).replace(b"\n", b"\n  "))
+                    separator = b",\n  "
+                f.write(b"\n]" if self.works else b"[]")
+            os.replace(tmp_path, target_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
         logger.info(f"JSON data saved: {target_path} ({len(self.works)} works)")
 
+    def load_from_json(self, filename: str = "aaajiao_works.json") -> List[Dict[str, Any]]:
+        """Load artwork data previously written by ``save_to_json``.
+
+        The file is read as bytes and decoded in one pass (orjson when
+        installed), skipping the text-layer decode of ``json.load``.
+
+        Args:
+            filename: JSON filename. Defaults to 'aaajiao_works.json'.
+                Relative paths are resolved like ``save_to_json``.
+
+        Returns:
+            List of work dictionaries.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        return json_loads(resolve_shared_artifact_path(filename).read_bytes())
+
     def generate_markdown(self, filename: str = "aaajiao_portfolio.md") -> None:
         """Generate Markdown format portfolio document for basic scraper.
         
@@ -77,64 +147,42 @@ class ReportMixin:
             >>> # After scraping...
             >>> scraper.generate_markdown("portfolio.md")
         """
-        lines = [
-            "# aaajiao 作品集 / aaajiao Portfolio\n",
-            f"Source: {BASE_URL}\n",
-            "Generated by aaajiao Scraper v6.3.0\n",
-            "\n---\n\n",
-        ]
-
         # Sort by year in descending order (newest first)
         def get_sort_year(work):
             year = work.get("year") or "0000"
             # For year ranges like "2018-2022", use the end year for sorting
             if "-" in year:
-                parts = year.split("-")
-                return parts[-1].strip()  # Use end year (most recent)
+                return year.rpartition("-")[2].strip()  # Use end year (most recent)
             return year
-        
-        sorted_works = sorted(self.works, key=get_sort_year, reverse=True)
-
-        current_year = None
-        for work in sorted_works:
-            year = work.get("year", "Unknown")
-            if year != current_year:
-                lines.append(f"## {year}\n\n")
-                current_year = year
-
-            title = work.get("title", "Untitled")
-            title_cn = work.get("title_cn", "")
-
-            header = f"### [{title}]({work['url']})"
-            if title_cn:
-                header += f" / {title_cn}"
-            lines.append(header + "\n\n")
-
-            if work.get("year"):
-                lines.append(f"**Year**: {work['year']}\n\n")
-            if work.get("type"):
-                lines.append(f"**Type**: {work['type']}\n\n")
-            if work.get("materials"):
-                lines.append(f"**Materials**: {work['materials']}\n\n")
-            if work.get("size"):
-                lines.append(f"**Size**: {work['size']}\n\n")
-            if work.get("duration"):
-                lines.append(f"**Duration**: {work['duration']}\n\n")
-            if work.get("video_link"):
-                lines.append(f"**Video**: {work['video_link']}\n\n")
-
-            if work.get("description_cn"):
-                lines.append(f"**中文描述**: {work['description_cn']}\n\n")
-
-            if work.get("description_en"):
-                lines.append(f"**Description**: {work['description_en']}\n\n")
-
-            lines.append("---\n")
+
+        # Decorate once so the sort key isn't recomputed per comparison
+        decorated = [(get_sort_year(work), work) for work in self.works]
+        decorated.sort(key=lambda item: item[0], reverse=True)
 
         target_path = resolve_shared_artifact_path(filename)
         target_path.parent.mkdir(parents=True, exist_ok=True)
-        with target_path.open("w", encoding="utf-8") as f:
-            f.write("".join(lines))
+        with target_path.open("w", encoding="utf-8", buffering=_WRITE_BUFFER) as f:
+            write = f.write
+            write("# aaajiao 作品集 / aaajiao Portfolio\n")
+            write(f"Source: {BASE_URL}\n")
+            write("Generated by aaajiao Scraper v6.3.0\n")
+            write("\n---\n\n")
+
+            groups = itertools.groupby(decorated, key=lambda item: item[1].get("year", "Unknown"))
+            for year, group in groups:
+                write(f"## {year}\n\n")
+
+                for _, work in group:
+                    get = work.get
+                    title_cn = get("title_cn", "")
+                    header = f"### [{get('title', 'Untitled')}]({work['url']})"
+                    if title_cn:
+                        header += f" / {title_cn}"
+
+                    # Build the whole block, then hand it to the buffer in one write
+                    values = [(label, get(field)) for field, label in _MARKDOWN_FIELDS]
+                    body = "".join(f"**{label}**: {value}\n\n" for label, value in values if value)
+                    write(f"{header}\n\n{body}---\n")
 
         logger.info(f"Markdown file generated: {target_path}")
 
@@ -145,6 +193,7 @@ class ReportMixin:
         prompt: str = "",
         extraction_level: str = "custom",
         output_mode: str = "merged",  # "merged" | "split"
+        use_async: bool = False,
     ) -> str:
         """Generate detailed report from AI extraction results with image downloads.
         
@@ -164,6 +213,9 @@ class ReportMixin:
             extraction_level: Extraction mode (quick/full/custom). Defaults to "custom".
             output_mode: Output format - 'merged' (one combined MD) or 'split' 
                 (one MD per artwork). Defaults to "merged".
+            use_async: Download images concurrently on one aiohttp event
+                loop. Requires the optional ``aiohttp`` dependency; falls
+                back to sequential downloads if it is missing.
         
         Returns:
             Absolute path to the generated Markdown report file (or directory for split mode).
@@ -197,6 +249,8 @@ class ReportMixin:
         # === SPLIT MODE: One MD file per artwork ===
         if output_mode == "split":
             reports_generated = []
+            # (index, display title, directory name), reused for the index file
+            index_entries: List[Tuple[int, str, str]] = []
             
             for i, item in enumerate(data_list, 1):
                 if not isinstance(item, dict):
@@ -206,33 +260,17 @@ class ReportMixin:
                 # Sanitize title for filename
                 safe_title = "".join(c if c.isalnum() or c in "-_ " else "_" for c in title)[:50]
                 item_dir = os.path.join(output_dir, f"{i:02d}_{safe_title}")
-                os.makedirs(item_dir, exist_ok=True)
+                index_entries.append((i, item.get("title", f"作品 {i}"), f"{i:02d}_{safe_title}"))
                 
-                # Download images for this item
+                # Download images for this item (makedirs creates item_dir too)
                 images_dir = "images"
                 images_path = os.path.join(item_dir, images_dir)
                 os.makedirs(images_path, exist_ok=True)
                 
-                url_to_local: Dict[str, str] = {}
-                images = item.get("high_res_images") or item.get("images") or []
-                for j, img_url in enumerate(images, 1):
-                    if img_url in url_to_local:
-                        continue
-                    try:
-                        ext = os.path.splitext(img_url.split("?")[0])[-1] or ".jpg"
-                        if not ext.startswith("."):
-                            ext = ".jpg"
-                        local_filename = f"{j:02d}{ext}"
-                        local_path = os.path.join(images_path, local_filename)
-                        
-                        resp = requests.get(img_url, timeout=30)
-                        if resp.status_code == 200:
-                            with open(local_path, "wb") as f:
-                                f.write(resp.content)
-                            url_to_local[img_url] = f"{images_dir}/{local_filename}"
-                            logger.info(f"📥 [{title[:20]}...] Downloaded: {local_filename}")
-                    except Exception as e:
-                        logger.warning(f"Image download failed: {img_url[:50]}... - {e}")
+                jobs = _plan_image_downloads(item.get("high_res_images") or item.get("images") or [])
+                url_to_local = self._download_report_images(
+                    jobs, images_path, images_dir, label=f"[{title[:20]}...]", use_async=use_async
+                )
                 
                 # Generate individual MD file
                 report_path = os.path.join(item_dir, "report.md")
@@ -243,8 +281,8 @@ class ReportMixin:
                 
                 # Save item JSON
                 json_path = os.path.join(item_dir, "data.json")
-                with open(json_path, "w", encoding="utf-8") as f:
-                    json.dump(item, f, ensure_ascii=False, indent=2)
+                with open(json_path, "wb") as f:
+                    f.write(json_dumpb(item, indent=True))
                 
                 reports_generated.append(report_path)
                 logger.info(f"📄 Generated: {report_path}")
@@ -258,11 +296,8 @@ class ReportMixin:
                 f"> **Total / 作品数量:** {len(data_list)}\n\n",
                 "## Contents / 目录\n\n",
             ]
-            for i, item in enumerate(data_list, 1):
-                if isinstance(item, dict):
-                    title = item.get("title", f"作品 {i}")
-                    safe_title = "".join(c if c.isalnum() or c in "-_ " else "_" for c in title)[:50]
-                    index_lines.append(f"{i}. [{title}](./{i:02d}_{safe_title}/report.md)\n")
+            for i, title, dir_name in index_entries:
+                index_lines.append(f"{i}. [{title}](./{dir_name}/report.md)\n")
             
             with open(index_path, "w", encoding="utf-8") as f:
                 f.write("".join(index_lines))
@@ -276,32 +311,14 @@ class ReportMixin:
         images_path = os.path.join(output_dir, images_dir)
         os.makedirs(images_path, exist_ok=True)
 
-        url_to_local: Dict[str, str] = {}
-        img_counter = 0
-
-        for item in data_list:
-            if not isinstance(item, dict):
-                continue
-            images = item.get("high_res_images") or item.get("images") or []
-            for img_url in images:
-                if img_url in url_to_local:
-                    continue
-                img_counter += 1
-                try:
-                    ext = os.path.splitext(img_url.split("?")[0])[-1] or ".jpg"
-                    if not ext.startswith("."):
-                        ext = ".jpg"
-                    local_filename = f"{img_counter:02d}{ext}"
-                    local_path = os.path.join(images_path, local_filename)
-
-                    resp = requests.get(img_url, timeout=30)
-                    if resp.status_code == 200:
-                        with open(local_path, "wb") as f:
-                            f.write(resp.content)
-                        url_to_local[img_url] = f"{images_dir}/{local_filename}"
-                        logger.info(f"📥 Downloaded image [{img_counter}]: {local_filename}")
-                except Exception as e:
-                    logger.warning(f"Image download failed: {img_url[:50]}... - {e}")
+        jobs = _plan_image_downloads(
+            itertools.chain.from_iterable(
+                item.get("high_res_images") or item.get("images") or []
+                for item in data_list
+                if isinstance(item, dict)
+            )
+        )
+        url_to_local = self._download_report_images(jobs, images_path, images_dir, use_async=use_async)
 
         logger.info(f"✅ Successfully downloaded {len(url_to_local)} images")
 
@@ -346,13 +363,61 @@ class ReportMixin:
             "new_count": data.get("new_count", 0) if isinstance(data, dict) else 0,
         }
 
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(output_data, f, ensure_ascii=False, indent=2)
+        with open(json_path, "wb") as f:
+            f.write(json_dumpb(output_data, indent=True))
 
         logger.info(f"💾 JSON data saved: {json_path}")
 
         return report_path
 
+    def _download_report_images(
+        self,
+        jobs: List[Tuple[str, str]],
+        images_path: str,
+        images_dir: str,
+        label: str = "",
+        use_async: bool = False,
+    ) -> Dict[str, str]:
+        """Download planned report images, skipping failures.
+
+        Args:
+            jobs: ``(image_url, local_filename)`` pairs from ``_plan_image_downloads``.
+            images_path: Directory the files are written to.
+            images_dir: Directory name as referenced from the report.
+            label: Prefix for progress log lines.
+            use_async: Fetch all jobs concurrently with ``_download_images_async``
+                (streamed to disk) instead of one after another.
+
+        Returns:
+            Mapping of each downloaded URL to its report-relative path.
+        """
+        if use_async and aiohttp is None:
+            logger.info("aiohttp not installed, downloading images sequentially")
+
+        if use_async and aiohttp is not None and jobs:
+            saved = run_async(self._download_images_async(
+                [(img_url, os.path.join(images_path, name)) for img_url, name in jobs]
+            ))
+            return {
+                img_url: f"{images_dir}/{name}"
+                for (img_url, name), path in zip(jobs, saved)
+                if path
+            }
+
+        prefix = f"{label} " if label else ""
+        url_to_local: Dict[str, str] = {}
+        for img_url, local_filename in jobs:
+            try:
+                resp = self.session.get(img_url, timeout=30)
+                if resp.status_code == 200:
+                    with open(os.path.join(images_path, local_filename), "wb") as f:
+                        f.write(resp.content)
+                    url_to_local[img_url] = f"{images_dir}/{local_filename}"
+                    logger.info(f"📥 {prefix}Downloaded: {local_filename}")
+            except Exception as e:
+                logger.warning(f"Image download failed: {img_url[:50]}... - {e}")
+        return url_to_local
+
     def _generate_single_item_report(
         self, 
         item: Dict[str, Any], 
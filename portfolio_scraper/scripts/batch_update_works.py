@@ -10,7 +10,6 @@ Usage:
     python portfolio_scraper/scripts/batch_update_works.py --limit 10         # 只处理前 10 个
     python portfolio_scraper/scripts/batch_update_works.py                    # 处理所有作品
 """
-import json
 import sys
 import argparse
 from pathlib import Path
@@ -19,9 +18,6 @@ from pathlib import Path
 PRODUCT_ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(PRODUCT_ROOT))
 
-from scraper import AaajiaoScraper
-from scraper.paths import resolve_repo_path
-
 
 def batch_update(
     input_file: str,
@@ -42,12 +38,16 @@ def batch_update(
     Returns:
         更新的作品数量
     """
+    # 延迟导入：scraper 包会加载 requests/bs4 等依赖，--help 和参数错误时无需付出这部分启动开销
+    from scraper import AaajiaoScraper
+    from scraper.core import json_dumpb, json_loads
+    from scraper.paths import resolve_repo_path
+
     # 加载现有数据
     input_path = resolve_repo_path(input_file)
     output_path = resolve_repo_path(output_file)
 
-    with input_path.open('r', encoding='utf-8') as f:
-        works = json.load(f)
+    works = json_loads(input_path.read_bytes())
 
     # 初始化 scraper
     scraper = AaajiaoScraper(use_cache=True)
@@ -125,14 +125,12 @@ def batch_update(
         # 每 20 个保存一次进度
         if i % 20 == 0:
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            with output_path.open('w', encoding='utf-8') as f:
-                json.dump(works, f, ensure_ascii=False, indent=2)
+            output_path.write_bytes(json_dumpb(works, indent=True))
             print(f"    💾 进度已保存 ({i}/{len(to_update)})")
 
     # 最终保存
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with output_path.open('w', encoding='utf-8') as f:
-        json.dump(works, f, ensure_ascii=False, indent=2)
+    output_path.write_bytes(json_dumpb(works, indent=True))
 
     print()
     print(f"✅ 完成! 更新: {updated}, 错误: {errors}")
@@ -1,9 +1,16 @@
+import argparse
+import json
 import os
+import sys
 import requests
-import json
 import time
 from dotenv import load_dotenv
 
+parser = argparse.ArgumentParser(description="Probe Firecrawl extraction on a single page")
+parser.add_argument("--quiet", "-q", action="store_true", help="Print a one-line summary instead of the full JSON")
+args = parser.parse_args()
+show_json = not args.quiet
+
 # Load env variables
 load_dotenv()
 
@@ -56,7 +63,11 @@ try:
         
         if response.status_code == 200:
             data = response.json()
-            print(json.dumps(data, indent=2, ensure_ascii=False))
+            if show_json:
+                print(json.dumps(data, indent=2, ensure_ascii=False))
+            else:
+                extracted = (data.get("data") or {}).get("json") or (data.get("data") or {}).get("extract") or {}
+                print(f"Firecrawl returned {len(extracted)} fields", file=sys.stderr)
         else:
             print("Error:", response.text)
 
@@ -14,7 +14,7 @@ class TestFirecrawlErrorHandling(unittest.TestCase):
         self.scraper._load_extract_cache = MagicMock(return_value=None)
         self.scraper._save_extract_cache = MagicMock()
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_agent_search_api_error(self, mock_post):
         # Simulate 401 Unauthorized
         mock_response = MagicMock()
@@ -28,7 +28,7 @@ class TestFirecrawlErrorHandling(unittest.TestCase):
         self.assertIn("Extract start failed: 401", str(cm.exception))
         print("✅ Correctly raised RuntimeError on 401")
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_agent_search_success_false(self, mock_post):
         # Simulate 200 OK but success=False
         mock_response = MagicMock()
@@ -8,12 +8,13 @@ Tests BasicScraperMixin methods:
 - Fallback main page scanning
 """
 
+import io
 from unittest.mock import MagicMock, patch
 
 import pytest
 from bs4 import BeautifulSoup
 
-from scraper import AaajiaoScraper
+from scraper import AaajiaoScraper, is_artwork
 
 
 class TestGetAllWorkLinks:
@@ -25,6 +26,7 @@ class TestGetAllWorkLinks:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.content = mock_sitemap_xml.encode()
+            mock_response.raw = io.BytesIO(mock_response.content)
             mock_get.return_value = mock_response
             
             links = scraper_with_mock_cache.get_all_work_links(incremental=False)
@@ -41,6 +43,7 @@ class TestGetAllWorkLinks:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.content = mock_sitemap_xml.encode()
+            mock_response.raw = io.BytesIO(mock_response.content)
             mock_get.return_value = mock_response
             
             scraper_with_mock_cache.get_all_work_links(incremental=False)
@@ -74,6 +77,7 @@ class TestGetAllWorkLinks:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.content = new_sitemap_xml.encode()
+            mock_response.raw = io.BytesIO(mock_response.content)
             mock_get.return_value = mock_response
             
             links = scraper_with_mock_cache.get_all_work_links(incremental=True)
@@ -103,6 +107,7 @@ class TestGetAllWorkLinks:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.content = new_sitemap_xml.encode()
+            mock_response.raw = io.BytesIO(mock_response.content)
             mock_get.return_value = mock_response
             
             links = scraper_with_mock_cache.get_all_work_links(incremental=True)
@@ -134,6 +139,7 @@ class TestGetAllWorkLinks:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.content = sitemap_xml.encode()
+            mock_response.raw = io.BytesIO(mock_response.content)
             mock_get.return_value = mock_response
 
             links = scraper_with_mock_cache.get_all_work_links(incremental=True)
@@ -160,6 +166,54 @@ class TestGetAllWorkLinks:
             assert "Sitemap parsing failed" in caplog.text
             assert "Attempting to scan main page" in caplog.text
 
+    def test_malformed_xml_falls_back_to_soup(self, scraper_with_mock_cache):
+        """Test that a sitemap ElementTree cannot parse is re-read with BS4."""
+        malformed = (
+            "<urlset><url><loc>https://eventstructure.com/work/test-1</loc>"
+            "<lastmod>2024-01-01</lastmod></url><url></urlset>"
+        ).encode()
+
+        with patch.object(scraper_with_mock_cache.session, "get") as mock_get:
+            mock_response = MagicMock()
+            mock_response.status_code = 200
+            mock_response.content = malformed
+            mock_response.raw = io.BytesIO(malformed)
+            mock_get.return_value = mock_response
+
+            links = scraper_with_mock_cache.get_all_work_links(incremental=False)
+
+            assert links == ["https://eventstructure.com/work/test-1"]
+            assert mock_get.call_count == 2
+
+
+    def test_stream_parse_prunes_finished_entries(self, scraper_with_mock_cache, monkeypatch):
+        """Test parsed <url> entries are dropped from the tree as the sitemap streams."""
+        import scraper.basic as basic
+
+        monkeypatch.setattr(basic, "_HAS_LXML", False)
+        parsers = []
+        real_iterparse = basic.etree.iterparse
+
+        def recording_iterparse(*args, **kwargs):
+            parser = real_iterparse(*args, **kwargs)
+            parsers.append(parser)
+            return parser
+
+        monkeypatch.setattr(basic.etree, "iterparse", recording_iterparse)
+        body = (
+            '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+            + "".join(
+                f"<url><loc>https://eventstructure.com/work-{i}</loc><lastmod>2024-01-0{i}</lastmod></url>"
+                for i in range(1, 4)
+            )
+            + "</urlset>"
+        ).encode()
+
+        sitemap, raw_count = scraper_with_mock_cache._parse_sitemap_stream(io.BytesIO(body))
+
+        assert raw_count == 3
+        assert sitemap["https://eventstructure.com/work-2"] == "2024-01-02"
+        assert len(parsers[0].root) == 0
 
 class TestFallbackScanMainPage:
     """Test suite for _fallback_scan_main_page method."""
@@ -189,6 +243,37 @@ class TestFallbackScanMainPage:
             assert "https://eventstructure.com/work/art1" in links
             assert "https://eventstructure.com/work/art2" in links
 
+    def test_skips_non_page_hrefs(self, scraper_with_mock_cache):
+        """Test that anchor, mailto and off-site hrefs never become work links."""
+        html = b"""
+            <a href="#top">Top</a>
+            <a href="mailto:studio@example.com">Mail</a>
+            <a href="javascript:void(0)">JS</a>
+            <a href="https://other.example/work/x">Elsewhere</a>
+            <a href="work/art3">Art 3</a>
+        """
+
+        with patch.object(scraper_with_mock_cache.session, "get") as mock_get:
+            mock_get.return_value = MagicMock(status_code=200, content=html)
+
+            links = scraper_with_mock_cache._fallback_scan_main_page()
+
+        assert links == ["https://eventstructure.com/work/art3"]
+
+    @pytest.mark.parametrize("fast_parser", [True, False])
+    def test_iter_anchor_hrefs_skips_anchors_without_href(self, scraper_with_mock_cache, fast_parser):
+        """Test that only anchors carrying an href are yielded, in order."""
+        from scraper import basic
+
+        if fast_parser and basic.FastHTMLParser is None:
+            pytest.skip("selectolax not installed")
+        html = b'<p><a name="top">x</a><a href="/work/a">A</a><a href="/work/b">B</a></p>'
+
+        with patch.object(basic, "FastHTMLParser", basic.FastHTMLParser if fast_parser else None):
+            hrefs = list(scraper_with_mock_cache._iter_anchor_hrefs(html))
+
+        assert hrefs == ["/work/a", "/work/b"]
+
     def test_fallback_handles_errors_gracefully(self, scraper_with_mock_cache, caplog):
         """Test that fallback handles errors and returns empty list."""
         with patch.object(scraper_with_mock_cache.session, "get") as mock_get:
@@ -200,6 +285,105 @@ class TestFallbackScanMainPage:
             assert "Main page scanning failed" in caplog.text
 
 
+class TestEnrichWorkWithImages:
+    """Test suite for enrich_work_with_images method."""
+
+    WORK = {
+        "url": "https://eventstructure.com/work/art1",
+        "title": "Art 1",
+        "images": ["https://img.example/a.png", "https://img.example/b"],
+    }
+
+    def test_downloads_images_sequentially(self, scraper_with_mock_cache, tmp_path):
+        """Test that images are saved as numbered files keeping their extension."""
+        with patch.object(scraper_with_mock_cache.session, "get") as mock_get:
+            resp = mock_get.return_value.__enter__.return_value
+            resp.iter_content.return_value = [b"im", b"g"]
+
+            work = scraper_with_mock_cache.enrich_work_with_images(dict(self.WORK), str(tmp_path))
+
+        names = [p.rsplit("/", 1)[-1] for p in work["local_images"]]
+        assert names == ["01.png", "02.jpg"]
+        assert mock_get.call_count == 2
+        assert open(work["local_images"][0], "rb").read() == b"img"
+        assert not list(tmp_path.rglob("*.part"))
+
+    def test_failed_download_leaves_no_file(self, scraper_with_mock_cache, tmp_path):
+        """Test that a download failing mid-stream is retried on the next run."""
+        with patch.object(scraper_with_mock_cache.session, "get") as mock_get:
+            resp = mock_get.return_value.__enter__.return_value
+            resp.iter_content.side_effect = IOError("connection reset")
+
+            path = scraper_with_mock_cache.download_image(
+                "https://img.example/a.png", str(tmp_path / "img"), "01.png"
+            )
+
+        assert path is None
+        assert list((tmp_path / "img").iterdir()) == []
+
+    def test_async_failed_download_leaves_no_part_file(self, scraper_with_mock_cache, tmp_path):
+        """Test a body failing mid-stream on the aiohttp path leaves nothing on disk."""
+        pytest.importorskip("aiohttp")
+        from scraper.core import run_async
+
+        async def _chunks(size):
+            yield b"partial"
+            raise ConnectionResetError("connection reset")
+
+        resp = MagicMock()
+        resp.content.iter_chunked = _chunks
+
+        class _Request:
+            async def __aenter__(self):
+                return resp
+
+            async def __aexit__(self, *exc):
+                return False
+
+        image_dir = tmp_path / "img"
+        image_dir.mkdir()
+
+        with patch("aiohttp.ClientSession.get", return_value=_Request()):
+            paths = run_async(scraper_with_mock_cache._download_images_async(
+                [("https://img.example/a.jpg", str(image_dir / "01.jpg"))]
+            ))
+
+        assert paths == [None]
+        assert list(image_dir.iterdir()) == []
+
+    def test_async_downloader_skips_existing_files(self, scraper_with_mock_cache, tmp_path):
+        """Test files already on disk are returned without opening a request."""
+        pytest.importorskip("aiohttp")
+        from scraper.core import run_async
+
+        existing = tmp_path / "01.jpg"
+        existing.write_bytes(b"img")
+
+        with patch("aiohttp.ClientSession.get") as mock_get:
+            paths = run_async(scraper_with_mock_cache._download_images_async(
+                [("https://img.example/a.jpg", str(existing))]
+            ))
+
+        assert paths == [str(existing)]
+        mock_get.assert_not_called()
+
+    def test_use_async_downloads_on_event_loop(self, scraper_with_mock_cache, tmp_path):
+        """Test that use_async hands every image to the aiohttp downloader."""
+        with patch("scraper.basic.aiohttp", MagicMock()), \
+             patch.object(scraper_with_mock_cache, "_download_images_async") as mock_async:
+            async def _fake(jobs):
+                return [path for _, path in jobs]
+            mock_async.side_effect = _fake
+
+            work = scraper_with_mock_cache.enrich_work_with_images(
+                dict(self.WORK), str(tmp_path), use_async=True
+            )
+
+        jobs = mock_async.call_args.args[0]
+        assert [url for url, _ in jobs] == self.WORK["images"]
+        assert len(work["local_images"]) == 2
+
+
 class TestIsValidWorkLink:
     """Test suite for _is_valid_work_link method."""
 
@@ -261,6 +445,101 @@ class TestIsValidWorkLink:
         """Test that sitemap URL is rejected."""
         assert scraper_with_mock_cache._is_valid_work_link("https://eventstructure.com/sitemap") is False
 
+    def test_slugs_sharing_navigation_prefix_accepted(self, scraper_with_mock_cache):
+        """Test that work slugs starting with a nav word are not excluded."""
+        urls = [
+            "https://eventstructure.com/feedback-loop",
+            "https://eventstructure.com/about-the-absence-of-light",
+            "https://eventstructure.com/index-of-things",
+        ]
+        for url in urls:
+            assert scraper_with_mock_cache._is_valid_work_link(url) is True
+        assert scraper_with_mock_cache._is_valid_work_link("https://eventstructure.com/filter/video") is False
+
+
+class TestIsArtwork:
+    """Test suite for is_artwork helper."""
+
+    @pytest.mark.parametrize(
+        "data, expected",
+        [
+            ({"type": "Video Installation"}, True),
+            ({"type": "Solo EXHIBITION"}, False),
+            ({"category": "Catalogue"}, False),
+            ({"type": "", "category": "Artist Talk"}, False),
+            ({}, True),
+        ],
+    )
+    def test_excluded_types_match_case_insensitively(self, data, expected):
+        """Test exhibition/catalog/event types are rejected regardless of case or field."""
+        assert is_artwork(data) is expected
+
+class TestIsValidImage:
+    """Test suite for _is_valid_image method."""
+
+    @pytest.mark.parametrize(
+        "src, expected",
+        [
+            ("https://cdn.example.com/work/01.JPG", True),
+            ("https://cdn.example.com/work/01.jpeg?w=1600", True),
+            ("https://cdn.example.com/work/still.avif", True),
+            ("https://cdn.example.com/photos/12345", True),
+            ("https://cdn.example.com/work/01.jpg.txt", False),
+            ("https://cdn.example.com/work/01.gifv", False),
+            ("https://cdn.example.com/Thumbnail/01.jpg", False),
+            ("https://cdn.example.com/site-LOGO.png", False),
+            ("https://cdn.example.com/1x1.gif", False),
+            ("", False),
+        ],
+    )
+    def test_accepts_artwork_images_only(self, scraper_with_mock_cache, src, expected):
+        """Test extension/keyword acceptance and skip-pattern rejection (case-insensitive)."""
+        assert scraper_with_mock_cache._is_valid_image(src) is expected
+
+
+class TestExtractImagesFromPage:
+    """Test suite for extract_images_from_page method."""
+
+    def test_nested_containers_yield_each_image_once_in_order(self, scraper_with_mock_cache):
+        """Test images under overlapping content containers are deduplicated in page order."""
+        html = b"""
+        <main>
+          <article>
+            <img src_o="/img/b.jpg" src="/img/b_small.jpg">
+            <img src="/img/logo.png">
+            <img data-src="/img/a.png">
+          </article>
+          <img src="/img/b.jpg">
+        </main>
+        """
+        resp = MagicMock(content=html)
+
+        with patch("requests.Session.get", return_value=resp):
+            images = scraper_with_mock_cache.extract_images_from_page("https://eventstructure.com/work")
+
+        assert images == [
+            "https://eventstructure.com/img/b.jpg",
+            "https://eventstructure.com/img/a.png",
+        ]
+
+    def test_absolute_sources_kept_and_relative_resolved(self, scraper_with_mock_cache):
+        """Test absolute CDN sources pass through unchanged and relative ones are joined."""
+        html = b"""
+        <main>
+          <img src="https://cdn.example.com/photo/01.jpg">
+          <img src="img/02.jpg">
+        </main>
+        """
+        resp = MagicMock(content=html)
+
+        with patch("requests.Session.get", return_value=resp):
+            images = scraper_with_mock_cache.extract_images_from_page("https://eventstructure.com/work/")
+
+        assert images == [
+            "https://cdn.example.com/photo/01.jpg",
+            "https://eventstructure.com/work/img/02.jpg",
+        ]
+
 
 class TestExtractMetadataBS4:
     """Test suite for extract_metadata_bs4 method - materials and credits extraction."""
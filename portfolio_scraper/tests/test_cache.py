@@ -13,7 +13,7 @@ import json
 import os
 import pickle
 import time
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -33,6 +33,13 @@ class TestGeneralCache:
         assert expected_hash in path
         assert path.endswith(".pkl")
 
+    def test_cache_key_uses_blake2b(self, scraper_with_mock_cache):
+        """Test that store keys are 128-bit BLAKE2b digests of the URL."""
+        url = "https://eventstructure.com/test"
+        expected = hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
+
+        assert scraper_with_mock_cache._get_cache_key(url) == expected
+
     def test_save_and_load_cache(self, scraper_with_mock_cache, sample_artwork_data):
         """Test saving and loading data from cache."""
         url = "https://eventstructure.com/test"
@@ -66,6 +73,370 @@ class TestGeneralCache:
         assert "Cache save failed" in caplog.text or len(caplog.records) >= 0
 
 
+class TestCacheStore:
+    """Test suite for the SQLite cache store."""
+
+    def test_entries_share_single_db_file(self, scraper_with_mock_cache, temp_cache_dir):
+        """Test that work and extract caches go to one DB, not per-URL files."""
+        scraper_with_mock_cache._save_cache("https://eventstructure.com/a", {"url": "a"})
+        scraper_with_mock_cache._save_extract_cache("https://eventstructure.com/a", "p", {"url": "a"})
+
+        assert (temp_cache_dir / "firecrawl.sqlite").exists()
+        assert not list(temp_cache_dir.glob("*.pkl"))
+
+    def test_store_uses_wal_without_full_sync(self, scraper_with_mock_cache):
+        """Test the store runs in WAL mode with synchronous=NORMAL."""
+        conn = scraper_with_mock_cache._cache_db()
+
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+
+    def test_legacy_pickle_is_migrated(self, scraper_with_mock_cache, sample_artwork_data):
+        """Test that pre-existing .pkl caches are read and copied into the DB."""
+        url = "https://eventstructure.com/legacy"
+        legacy_path = scraper_with_mock_cache._get_cache_path(url)
+        with open(legacy_path, "wb") as f:
+            pickle.dump(sample_artwork_data, f)
+
+        assert scraper_with_mock_cache._load_cache(url) == sample_artwork_data
+
+        assert not os.path.exists(legacy_path)
+        assert not scraper_with_mock_cache._has_legacy_cache()
+        assert scraper_with_mock_cache._load_cache(url) == sample_artwork_data
+
+    def test_miss_skips_legacy_probe_without_pickles(self, scraper_with_mock_cache):
+        """Test that cache misses don't stat .pkl paths when none exist."""
+        scraper_with_mock_cache._cache_db()
+        with patch("scraper.cache.os.path.exists") as mock_exists:
+            assert scraper_with_mock_cache._load_cache("https://eventstructure.com/none") is None
+
+        mock_exists.assert_not_called()
+
+    def test_miss_skips_probe_for_other_urls_pickles(self, scraper_with_mock_cache, sample_artwork_data):
+        """Test that a leftover .pkl for one URL doesn't make other misses open files."""
+        scraper = scraper_with_mock_cache
+        with open(scraper._get_cache_path("https://eventstructure.com/legacy"), "wb") as f:
+            pickle.dump(sample_artwork_data, f)
+        scraper._cache_db()
+
+        with patch("scraper.cache.open", create=True) as mock_open:
+            assert scraper._load_cache("https://eventstructure.com/none") is None
+            assert scraper._load_extract_cache("https://eventstructure.com/none", "p") is None
+
+        mock_open.assert_not_called()
+        assert scraper._load_cache("https://eventstructure.com/legacy") == sample_artwork_data
+
+    def test_miss_skips_legacy_hash_without_pickles(self, scraper_with_mock_cache):
+        """Test that misses on a migrated cache never compute MD5 paths."""
+        scraper_with_mock_cache._cache_db()
+        with patch("scraper.cache._legacy_hash") as mock_hash:
+            scraper_with_mock_cache._load_cache("https://eventstructure.com/none")
+            scraper_with_mock_cache._load_cache_many(["https://eventstructure.com/none"])
+            scraper_with_mock_cache._load_extract_cache("https://eventstructure.com/none", "p")
+
+        mock_hash.assert_not_called()
+
+    def test_repeated_loads_served_from_memory(self, scraper_with_mock_cache, sample_artwork_data):
+        """Test repeated lookups of one URL skip the SQLite store."""
+        scraper = scraper_with_mock_cache
+        url = sample_artwork_data["url"]
+        scraper._save_cache(url, sample_artwork_data)
+
+        scraper._cache_conn = MagicMock(wraps=scraper._cache_conn)
+        first = scraper._load_cache(url)
+        first["title"] = "mutated"
+        second = scraper._load_cache(url)
+
+        assert second == sample_artwork_data
+        scraper._cache_conn.execute.assert_not_called()
+
+    def test_ttl_expires_old_entries(self, scraper_with_mock_cache, sample_artwork_data):
+        """Test entries older than cache_ttl_hours are treated as misses."""
+        scraper = scraper_with_mock_cache
+        url = sample_artwork_data["url"]
+        key = scraper._get_cache_key(url)
+        scraper._db_put(key, sample_artwork_data, updated_at=time.time() - 3 * 3600)
+
+        assert scraper._load_cache(url) == sample_artwork_data
+
+        scraper.cache_ttl_hours = 2
+        assert scraper._load_cache(url) is None
+
+        scraper._save_cache(url, sample_artwork_data)
+        assert scraper._load_cache(url) == sample_artwork_data
+
+    def test_expired_entry_is_not_replaced_by_legacy_pickle(self, scraper_with_mock_cache, sample_artwork_data):
+        """Test an expired store entry is a miss, not a cue to migrate an older .pkl."""
+        scraper = scraper_with_mock_cache
+        url = sample_artwork_data["url"]
+        key = scraper._get_cache_key(url)
+        with open(scraper._get_cache_path(url), "wb") as f:
+            pickle.dump(dict(sample_artwork_data, title="old"), f)
+        scraper._db_put(key, dict(sample_artwork_data, title="new"), updated_at=time.time() - 3 * 3600)
+        scraper.cache_ttl_hours = 2
+
+        assert scraper._load_cache(url) is None
+        assert scraper._load_cache_many([url]) == {}
+
+        scraper.cache_ttl_hours = None
+        assert scraper._load_cache(url)["title"] == "new"
+
+    def test_load_cache_many_matches_single_loads(self, scraper_with_mock_cache, sample_artwork_data):
+        """Test bulk loads return the same hits as per-URL loads."""
+        scraper = scraper_with_mock_cache
+        urls = [f"https://eventstructure.com/work-{i}" for i in range(3)]
+        for url in urls[:2]:
+            scraper._save_cache(url, dict(sample_artwork_data, url=url))
+        scraper._mem_cache.clear()
+
+        found = scraper._load_cache_many(urls + [urls[0]])
+
+        assert set(found) == set(urls[:2])
+        assert found[urls[1]] == scraper._load_cache(urls[1])
+
+    def test_memory_cache_is_bounded_lru(self, scraper_with_mock_cache, sample_artwork_data):
+        """Test the in-memory layer evicts least recently used entries, and bulk loads
+        larger than it still return every hit."""
+        from scraper.cache import _LRUDict
+
+        lru = _LRUDict(2)
+        lru["a"], lru["b"] = 1, 2
+        assert lru.get("a") == 1  # "b" is now least recently used
+        lru["c"] = 3
+        assert list(lru) == ["a", "c"]
+
+        scraper = scraper_with_mock_cache
+        urls = [f"https://eventstructure.com/work-{i}" for i in range(3)]
+        for url in urls:
+            scraper._save_cache(url, dict(sample_artwork_data, url=url))
+        scraper._mem_cache = _LRUDict(2)
+
+        assert set(scraper._load_cache_many(urls)) == set(urls)
+        assert len(scraper._mem_cache) == 2
+
+    def test_values_stored_as_plain_json_by_default(self, scraper_with_mock_cache, sample_artwork_data):
+        """Test values stay plain JSON unless compression is opted into."""
+        scraper = scraper_with_mock_cache
+        url = sample_artwork_data["url"]
+        scraper._save_cache(url, sample_artwork_data)
+
+        (stored,) = scraper._cache_db().execute(
+            "SELECT value FROM cache WHERE key = ?", (scraper._get_cache_key(url),)
+        ).fetchone()
+        assert json.loads(stored) == sample_artwork_data
+
+    def test_values_compressed_and_plain_json_both_read(
+        self, scraper_with_mock_cache, sample_artwork_data, monkeypatch
+    ):
+        """Test CACHE_COMPRESS stores zstd frames and old JSON rows still load."""
+        pytest.importorskip("zstandard")
+        from scraper.cache import _ZSTD_MAGIC
+
+        monkeypatch.setenv("CACHE_COMPRESS", "1")
+        scraper = scraper_with_mock_cache
+        new_url, old_url = "https://eventstructure.com/new", "https://eventstructure.com/old"
+        scraper._save_cache(new_url, sample_artwork_data)
+        conn = scraper._cache_db()
+        conn.execute(
+            "INSERT INTO cache (key, value, updated_at) VALUES (?, ?, ?)",
+            (scraper._get_cache_key(old_url), json.dumps(sample_artwork_data), time.time()),
+        )
+        scraper._mem_cache.clear()
+
+        (stored,) = conn.execute(
+            "SELECT value FROM cache WHERE key = ?", (scraper._get_cache_key(new_url),)
+        ).fetchone()
+        assert stored.startswith(_ZSTD_MAGIC)
+        assert scraper._load_cache_many([new_url, old_url]) == {
+            new_url: sample_artwork_data,
+            old_url: sample_artwork_data,
+        }
+
+    def test_compressed_value_is_reported_miss_without_zstandard(
+        self, scraper_with_mock_cache, sample_artwork_data, monkeypatch, caplog
+    ):
+        """Test compressed rows read as misses, with a warning, when zstandard is unavailable."""
+        pytest.importorskip("zstandard")
+        monkeypatch.setenv("CACHE_COMPRESS", "1")
+        monkeypatch.setattr("scraper.cache._zstd_missing_reported", False)
+        scraper = scraper_with_mock_cache
+        url = sample_artwork_data["url"]
+        scraper._save_cache(url, sample_artwork_data)
+        scraper._mem_cache.clear()
+
+        with patch("scraper.cache.zstandard", None):
+            assert scraper._load_cache(url) is None
+            assert scraper._load_cache_many([url]) == {}
+
+        warnings = [r for r in caplog.records if "zstandard is not installed" in r.getMessage()]
+        assert len(warnings) == 1
+        assert warnings[0].levelname == "WARNING"
+
+    def test_get_all_cached_works_skips_extract_entries(self, scraper_with_mock_cache):
+        """Test that only general work entries are listed."""
+        scraper_with_mock_cache._save_cache("https://eventstructure.com/a", {"url": "a"})
+        scraper_with_mock_cache._save_extract_cache("https://eventstructure.com/b", "p", {"url": "b"})
+
+        works = scraper_with_mock_cache.get_all_cached_works()
+
+        assert works == [{"url": "a"}]
+
+
+class FakeRedis:
+    """Minimal in-memory stand-in for the redis client calls the cache uses."""
+
+    def __init__(self):
+        self.store = {}
+        self.ttls = {}
+        self.pipelines = 0
+
+    def setex(self, name, ttl, value):
+        self.store[name] = value.encode() if isinstance(value, str) else value
+        self.ttls[name] = ttl
+
+    def mget(self, names):
+        return [self.store.get(name) for name in names]
+
+    def pipeline(self, transaction=True):
+        self.pipelines += 1
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    """Queues FakeRedis commands until execute(), like a redis pipeline."""
+
+    def __init__(self, client):
+        self.client = client
+        self.calls = []
+
+    def setex(self, name, ttl, value):
+        self.calls.append((name, ttl, value))
+
+    def execute(self):
+        for call in self.calls:
+            self.client.setex(*call)
+
+
+class FakeRedisModule:
+    """Stand-in for the redis module: records client options, exposes its errors."""
+
+    class ConnectionError(Exception):
+        pass
+
+    class TimeoutError(Exception):
+        pass
+
+    def __init__(self):
+        self.options = None
+        outer = self
+
+        class Redis:
+            @staticmethod
+            def from_url(url, **options):
+                outer.options = options
+                return FakeRedis()
+
+        self.Redis = Redis
+
+
+class TestRedisCache:
+    """Test suite for the optional shared Redis cache layer."""
+
+    def test_no_redis_url_means_no_client(self, scraper_with_mock_cache, monkeypatch):
+        """Test that the Redis layer stays off without REDIS_URL."""
+        monkeypatch.delenv("REDIS_URL", raising=False)
+
+        assert scraper_with_mock_cache._redis_client() is None
+
+    def test_saves_are_mirrored_with_ttl(self, scraper_with_mock_cache, sample_artwork_data):
+        """Test that store writes are copied to Redis with an expiry."""
+        scraper = scraper_with_mock_cache
+        scraper._redis = FakeRedis()
+        scraper.cache_ttl_hours = 2
+        url = sample_artwork_data["url"]
+
+        scraper._save_cache(url, sample_artwork_data)
+
+        (name,) = scraper._redis.store
+        assert name.startswith("fc:") and name.endswith(":" + scraper._get_cache_key(url))
+        assert json.loads(scraper._redis.store[name])["data"] == sample_artwork_data
+        assert scraper._redis.ttls[name] == 7200
+
+    def test_schema_change_isolates_work_entries(self, scraper_with_mock_cache, sample_artwork_data, monkeypatch):
+        """Test that work entries written under another schema version are not served."""
+        shared = FakeRedis()
+        scraper = scraper_with_mock_cache
+        scraper._redis = shared
+        url = sample_artwork_data["url"]
+        scraper._save_cache(url, sample_artwork_data)
+        scraper._save_extract_cache(url, "p", {"url": url})
+
+        monkeypatch.setattr("scraper.cache._WORK_SCHEMA_HASH", "00000000")
+        os.remove(scraper._cache_conn_path)
+        scraper._cache_conn = None
+
+        assert scraper._load_cache(url) is None
+        assert scraper._load_extract_cache(url, "p") == {"url": url}
+
+    def test_client_uses_short_socket_timeouts(self, scraper_with_mock_cache, monkeypatch):
+        """Test an unreachable Redis can't stall lookups on the default socket timeout."""
+        fake = FakeRedisModule()
+        monkeypatch.setattr("scraper.cache.redis", fake)
+        monkeypatch.setenv("REDIS_URL", "redis://cache.invalid:6379/0")
+
+        assert isinstance(scraper_with_mock_cache._redis_client(), FakeRedis)
+        assert fake.options["socket_connect_timeout"] <= 5
+        assert fake.options["socket_timeout"] <= 5
+
+    def test_batch_writes_share_one_pipeline(self, scraper_with_mock_cache):
+        """Test that a batched store write reaches Redis in one round trip."""
+        scraper = scraper_with_mock_cache
+        scraper._redis = FakeRedis()
+
+        scraper._save_extract_cache_many("p", {f"https://eventstructure.com/{i}": {"i": i} for i in range(3)})
+
+        assert scraper._redis.pipelines == 1
+        assert len(scraper._redis.store) == 3
+
+    def test_connection_error_disables_redis(self, scraper_with_mock_cache, sample_artwork_data, monkeypatch):
+        """Test that the first connection failure switches the shared cache off."""
+        fake = FakeRedisModule()
+        monkeypatch.setattr("scraper.cache.redis", fake)
+        scraper = scraper_with_mock_cache
+        client = scraper._redis = MagicMock()
+        client.mget.side_effect = fake.ConnectionError("refused")
+        url = sample_artwork_data["url"]
+
+        assert scraper._load_cache(url) is None
+        scraper._save_cache(url, sample_artwork_data)
+
+        assert scraper._redis_client() is None
+        client.mget.assert_called_once()
+        client.pipeline.assert_not_called()
+        assert scraper._load_cache(url) == sample_artwork_data
+
+    def test_local_miss_is_filled_from_redis(self, scraper_with_mock_cache, temp_cache_dir, sample_artwork_data):
+        """Test that another machine's entries are served and stored locally."""
+        shared = FakeRedis()
+        writer = scraper_with_mock_cache
+        writer._redis = shared
+        urls = [f"https://eventstructure.com/work-{i}" for i in range(2)]
+        for url in urls:
+            writer._save_cache(url, dict(sample_artwork_data, url=url))
+
+        # Fresh local store, same Redis
+        os.remove(temp_cache_dir / "firecrawl.sqlite")
+        writer._cache_conn = None
+        writer._mem_cache = {}
+
+        assert writer._load_cache(urls[0])["url"] == urls[0]
+        assert set(writer._load_cache_many(urls)) == set(urls)
+
+        writer._redis = None
+        writer._mem_cache = {}
+        assert writer._load_cache(urls[1])["url"] == urls[1]
+
+
 class TestSitemapCache:
     """Test suite for sitemap cache methods."""
 
@@ -145,6 +516,29 @@ class TestExtractCache:
         assert loaded2 == data2
         assert loaded1 != loaded2
 
+    def test_load_extract_cache_many_is_prompt_scoped(self, scraper_with_mock_cache):
+        """Test bulk extract loads return only hits for the given prompt."""
+        scraper = scraper_with_mock_cache
+        urls = [f"https://eventstructure.com/work-{i}" for i in range(3)]
+        scraper._save_extract_cache(urls[0], "prompt1", {"result": 0})
+        scraper._save_extract_cache(urls[1], "prompt2", {"result": 1})
+        scraper._mem_cache.clear()
+
+        found = scraper._load_extract_cache_many(urls, "prompt1")
+
+        assert found == {urls[0]: {"result": 0}}
+
+    def test_save_extract_cache_many_round_trips(self, scraper_with_mock_cache):
+        """Test a batched extract save is readable per URL from the store."""
+        scraper = scraper_with_mock_cache
+        results = {f"https://eventstructure.com/work-{i}": {"result": i} for i in range(3)}
+
+        scraper._save_extract_cache_many("prompt1", results)
+        scraper._mem_cache.clear()
+
+        assert scraper._load_extract_cache_many(list(results), "prompt1") == results
+        assert scraper._load_extract_cache_many(list(results), "prompt2") == {}
+
 
 class TestDiscoveryCache:
     """Test suite for discovery cache methods."""
@@ -206,3 +600,74 @@ class TestCacheIntegration:
         # Even though data exists, use_cache=False should prevent loading
         # (Note: Current implementation still saves, just doesn't load in extract methods)
         assert scraper.use_cache is False
+
+    def test_pipeline_resolves_cache_hits_without_executor(
+        self, scraper_with_mock_cache, sample_artwork_data
+    ):
+        """Test warm-cache URLs are resolved inline and never re-extracted."""
+        scraper = scraper_with_mock_cache
+        cached_url = sample_artwork_data["url"]
+        fresh_url = "https://eventstructure.com/fresh-work"
+        scraper._save_cache(cached_url, sample_artwork_data)
+
+        scraper.get_all_work_links = MagicMock(return_value=[cached_url, fresh_url])
+        scraper.extract_work_details_v2 = MagicMock(return_value=None)
+        scraper.save_to_json = MagicMock()
+        scraper.generate_markdown = MagicMock()
+
+        result = scraper.run_full_pipeline(incremental=False)
+
+        scraper.extract_work_details_v2.assert_called_once_with(fresh_url)
+        assert result["stats"]["from_cache"] == 1
+        assert result["stats"]["extracted"] == 1
+        assert result["stats"]["skipped_exhibitions"] == 1
+
+    def test_pipeline_batch_mode_sends_only_misses(
+        self, scraper_with_mock_cache, sample_artwork_data
+    ):
+        """Test use_batch sends misses to one batch call without re-reading the cache."""
+        scraper = scraper_with_mock_cache
+        cached_url = sample_artwork_data["url"]
+        fresh_url = "https://eventstructure.com/fresh-work"
+        broken_url = "https://eventstructure.com/broken-work"
+        scraper._save_cache(cached_url, sample_artwork_data)
+
+        scraper.get_all_work_links = MagicMock(return_value=[cached_url, fresh_url, broken_url])
+        scraper.extract_work_details_v2 = MagicMock()
+        scraper._extract_uncached_batch = MagicMock(return_value={
+            fresh_url: {**sample_artwork_data, "url": fresh_url, "title": "Fresh Work"},
+            broken_url: None,
+        })
+        scraper.save_to_json = MagicMock()
+        scraper.generate_markdown = MagicMock()
+
+        with patch.object(scraper, "_load_cache_many", wraps=scraper._load_cache_many) as mock_load:
+            result = scraper.run_full_pipeline(incremental=False, use_batch=True, batch_size=25)
+
+        scraper._extract_uncached_batch.assert_called_once_with([fresh_url, broken_url], batch_size=25)
+        scraper.extract_work_details_v2.assert_not_called()
+        assert mock_load.call_count == 1
+        assert result["stats"]["from_cache"] == 1
+        assert result["stats"]["extracted"] == 2
+        assert result["stats"]["failed"] == 1
+        assert result["stats"]["skipped_exhibitions"] == 0
+
+    def test_pipeline_fetches_sitemap_off_thread(self, scraper_with_mock_cache):
+        """Test the sitemap fetch runs on a worker while the cache store opens."""
+        import threading
+
+        scraper = scraper_with_mock_cache
+        fetch_threads = []
+
+        def fake_links(incremental=True):
+            fetch_threads.append(threading.current_thread())
+            return []
+
+        scraper.get_all_work_links = fake_links
+
+        with patch.object(scraper, "_cache_db", wraps=scraper._cache_db) as mock_db:
+            result = scraper.run_full_pipeline(incremental=False)
+
+        assert fetch_threads and fetch_threads[0] is not threading.current_thread()
+        assert mock_db.called
+        assert result["stats"]["urls_found"] == 0
@@ -8,24 +8,74 @@ Tests CoreScraper and RateLimiter classes:
 - Basic initialization
 """
 
+import asyncio
 import os
+import threading
 import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, HTTPServer
 from unittest.mock import MagicMock, patch
 
 import pytest
 import requests
 
-from scraper.core import CoreScraper, RateLimiter
+from scraper.core import (
+    CoreScraper,
+    RateLimiter,
+    _load_env_files,
+    intern_categorical_fields,
+    json_dumpb,
+    json_dumps,
+    response_json,
+    run_async,
+)
+
+
+@contextmanager
+def _status_server(status):
+    """Serve ``status`` for every GET/POST on localhost and count the requests."""
+    hits = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def _reply(self):
+            hits.append(self.command)
+            length = int(self.headers.get("Content-Length") or 0)
+            self.rfile.read(length)
+            self.send_response(status)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        do_GET = do_POST = _reply
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}/", hits
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _mount_for_local(session, url):
+    """Serve plain-http ``url`` with the session's https adapter, minus backoff."""
+    adapter = session.get_adapter("https://")
+    adapter.max_retries = adapter.max_retries.new(backoff_factor=0)
+    session.mount(url, adapter)
 
 
 class TestRateLimiter:
     """Test suite for RateLimiter class."""
 
     def test_initialization(self):
-        """Test RateLimiter initializes with correct interval."""
+        """Test RateLimiter initializes with correct interval and full bucket."""
         limiter = RateLimiter(calls_per_minute=10)
         assert limiter.interval == 6.0  # 60/10 = 6 seconds
-        assert limiter.last_call == 0
+        assert limiter.capacity == 10
+        assert limiter.tokens == 10
 
     def test_custom_rate(self):
         """Test RateLimiter with custom rate."""
@@ -43,9 +93,9 @@ class TestRateLimiter:
 
     def test_wait_blocks_rapid_calls(self):
         """Test that rapid calls are rate limited."""
-        limiter = RateLimiter(calls_per_minute=60)  # 1 second interval
+        limiter = RateLimiter(calls_per_minute=60, capacity=1)  # 1 second interval
         
-        # First call
+        # First call drains the bucket
         limiter.wait()
         
         # Second call should block
@@ -56,6 +106,31 @@ class TestRateLimiter:
         # Should wait approximately 1 second
         assert 0.9 < elapsed < 1.2
 
+    def test_burst_uses_accumulated_tokens(self):
+        """Test that calls within capacity do not block."""
+        limiter = RateLimiter(calls_per_minute=60, capacity=3)
+        start = time.time()
+        for _ in range(3):
+            limiter.wait()
+        elapsed = time.time() - start
+        assert elapsed < 0.1
+
+    def test_async_acquire_shares_bucket(self):
+        """Test that async acquire draws from the same bucket as wait()."""
+        limiter = RateLimiter(calls_per_minute=60, capacity=2)
+        limiter.wait()
+        asyncio.run(limiter.acquire())
+        assert limiter.tokens < 1
+
+    def test_reserve_hands_out_consecutive_slots(self):
+        """Test that waiters on an empty bucket are queued one interval apart."""
+        limiter = RateLimiter(calls_per_minute=60, capacity=1)
+        limiter.wait()
+
+        waits = [limiter._reserve() for _ in range(3)]
+
+        assert waits == pytest.approx([1.0, 2.0, 3.0], abs=0.05)
+
     def test_thread_safety(self):
         """Test that RateLimiter uses locks (basic check)."""
         limiter = RateLimiter()
@@ -86,6 +161,56 @@ class TestCoreScraper:
         
         assert scraper.use_cache is False
 
+    def test_concurrency_from_env(self, monkeypatch):
+        """Test workers and rate limit are read from environment variables."""
+        monkeypatch.setenv("MAX_WORKERS", "8")
+        monkeypatch.setenv("RATE_LIMIT_CALLS_PER_MINUTE", "60")
+
+        scraper = CoreScraper()
+
+        assert scraper.max_workers == 8
+        assert scraper.rate_limiter.refill_rate == 1.0
+
+    def test_host_limiters_are_per_host(self, monkeypatch):
+        """Test direct page fetches share a bucket per host, separate from Firecrawl."""
+        monkeypatch.setenv("SITE_CALLS_PER_MINUTE", "30")
+        scraper = CoreScraper()
+
+        scraper._wait_for_host("https://eventstructure.com/work-a")
+        scraper._wait_for_host("https://eventstructure.com/work-b")
+        scraper._wait_for_host("https://cdn.example.com/img.jpg")
+
+        limiters = scraper._host_limiters
+        assert set(limiters) == {"eventstructure.com", "cdn.example.com"}
+        assert limiters["eventstructure.com"].refill_rate == 0.5
+        assert limiters["eventstructure.com"].tokens == pytest.approx(28, abs=0.1)
+        assert limiters["cdn.example.com"].tokens == pytest.approx(29, abs=0.1)
+        assert scraper.rate_limiter.tokens == scraper.rate_limiter.capacity
+
+    def test_concurrency_kwargs_override_env(self, monkeypatch):
+        """Test constructor arguments take precedence over the environment."""
+        monkeypatch.setenv("MAX_WORKERS", "8")
+        monkeypatch.setenv("RATE_LIMIT_CALLS_PER_MINUTE", "not-a-number")
+
+        scraper = CoreScraper(max_workers=2, calls_per_minute=30)
+
+        assert scraper.max_workers == 2
+        assert scraper.calls_per_minute == 30
+
+    def test_env_files_read_once(self, monkeypatch):
+        """Test .env files are parsed once and reused across instances."""
+        monkeypatch.setenv("FIRECRAWL_API_KEY", "test-key")
+        _load_env_files.cache_clear()
+
+        with patch("scraper.core.load_dotenv") as mock_load:
+            CoreScraper(use_cache=False)
+            first_calls = mock_load.call_count
+            CoreScraper(use_cache=False)
+            CoreScraper(use_cache=False)
+
+        assert first_calls >= 1
+        assert mock_load.call_count == first_calls
+
     def test_api_key_loading_from_env(self, monkeypatch):
         """Test API key is loaded from environment variable."""
         test_key = "fc-test-key-12345"
@@ -124,6 +249,30 @@ class TestCoreScraper:
         assert "http://" in scraper.session.adapters
         assert "https://" in scraper.session.adapters
 
+    @pytest.mark.parametrize("status", [408, 429])
+    def test_site_session_resends_timeouts_and_rate_limits(self, status):
+        """Test site fetches answered 408/429 are resent by the adapter."""
+        scraper = CoreScraper(use_cache=False)
+
+        with _status_server(status) as (url, hits):
+            _mount_for_local(scraper.session, url)
+            with pytest.raises(requests.exceptions.RetryError):
+                scraper.session.get(url, timeout=5)
+
+        assert hits == ["GET"] * 4
+
+    @pytest.mark.parametrize("status, sent", [(408, 4), (429, 1)])
+    def test_firecrawl_session_resends_408_but_leaves_429_to_callers(self, status, sent):
+        """Test a Firecrawl POST is resent on 408 while 429 goes straight back to the caller."""
+        scraper = CoreScraper(use_cache=False)
+
+        with _status_server(status) as (url, hits):
+            _mount_for_local(scraper.fc_session, url)
+            resp = scraper.fc_session.post(url, json={}, timeout=5)
+
+        assert resp.status_code == status
+        assert hits == ["POST"] * sent
+
     def test_session_has_custom_headers(self, monkeypatch):
         """Test that session includes User-Agent header."""
         monkeypatch.setenv("FIRECRAWL_API_KEY", "test-key")
@@ -133,6 +282,40 @@ class TestCoreScraper:
         assert "User-Agent" in scraper.session.headers
         assert "Mozilla" in scraper.session.headers["User-Agent"]
 
+    def test_site_session_pool_scales_with_workers(self, monkeypatch):
+        """Test that the site session pool grows with max_workers."""
+        monkeypatch.setenv("FIRECRAWL_API_KEY", "test-key")
+
+        scraper = CoreScraper(use_cache=False, max_workers=16)
+
+        assert scraper.session.get_adapter("https://eventstructure.com")._pool_maxsize == 32
+
+    def test_firecrawl_session_requests_compression(self, monkeypatch):
+        """Test that Firecrawl session asks for compressed responses."""
+        monkeypatch.setenv("FIRECRAWL_API_KEY", "test-key")
+
+        scraper = CoreScraper()
+
+        assert "gzip" in scraper.fc_session.headers["Accept-Encoding"]
+
+    def test_firecrawl_session_retries_post_on_server_error(self):
+        """Test a 5xx Firecrawl POST is actually resent and the last response returned."""
+        scraper = CoreScraper(use_cache=False)
+
+        with _status_server(503) as (url, hits):
+            _mount_for_local(scraper.fc_session, url)
+            resp = scraper.fc_session.post(url, json={}, timeout=5)
+
+        assert resp.status_code == 503
+        assert hits == ["POST"] * 4
+
+    def test_site_session_accepts_all_decodable_encodings(self, monkeypatch):
+        """Test the site session advertises the same decodable encodings as Firecrawl's."""
+        scraper = CoreScraper(use_cache=False)
+
+        assert "gzip" in scraper.session.headers["Accept-Encoding"]
+        assert scraper.session.headers["Accept-Encoding"] == scraper.fc_session.headers["Accept-Encoding"]
+
     def test_cache_directory_created(self, temp_cache_dir, monkeypatch):
         """Test that cache directory is created on initialization."""
         test_cache = temp_cache_dir / "new_cache"
@@ -149,6 +332,18 @@ class TestCoreScraper:
         # Note: directory may be created lazily, so check scraper attribute
         assert scraper.use_cache is True
 
+    def test_ensure_dir_creates_once(self, tmp_path, monkeypatch):
+        """Test _ensure_dir only hits the filesystem the first time."""
+        monkeypatch.setenv("FIRECRAWL_API_KEY", "test-key")
+        scraper = CoreScraper(use_cache=False)
+        target = str(tmp_path / "images")
+
+        with patch("scraper.core.os.makedirs") as mock_makedirs:
+            scraper._ensure_dir(target)
+            scraper._ensure_dir(target)
+
+        mock_makedirs.assert_called_once_with(target, exist_ok=True)
+
     def test_rate_limiter_configuration(self, monkeypatch):
         """Test that rate limiter is configured correctly."""
         monkeypatch.setenv("FIRECRAWL_API_KEY", "test-key")
@@ -172,3 +367,75 @@ class TestCoreScraper:
             if hasattr(adapter, "max_retries"):
                 assert adapter.max_retries.total == 5
                 assert adapter.max_retries.backoff_factor == 1.0
+
+
+class TestJsonHelpers:
+    """Test suite for the JSON encode/decode helpers."""
+
+    def test_json_dumps_matches_stdlib_indent(self, sample_artwork_data):
+        """Test indented output is identical to json.dumps(indent=2)."""
+        import json
+
+        works = [sample_artwork_data, {"title": "空", "tags": [], "year": None}]
+
+        assert json_dumps(works, indent=True) == json.dumps(works, ensure_ascii=False, indent=2)
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_json_dumpb_is_encoded_json_dumps(self, sample_artwork_data, use_orjson):
+        """Test the bytes variant matches the text variant with and without orjson."""
+        import scraper.core as core
+
+        works = [sample_artwork_data, {"title": "空", "year": None}]
+        orjson_module = core.orjson if use_orjson else None
+        if use_orjson and orjson_module is None:
+            pytest.skip("orjson not installed")
+
+        with patch.object(core, "orjson", orjson_module):
+            for indent in (False, True):
+                assert json_dumpb(works, indent=indent) == json_dumps(works, indent=indent).encode("utf-8")
+
+    def test_run_async_prefers_uvloop_when_installed(self):
+        """Test coroutines run on uvloop if present and on asyncio otherwise."""
+        import scraper.core as core
+
+        async def answer():
+            return 42
+
+        fake_uvloop = MagicMock()
+        fake_uvloop.run.side_effect = lambda coro: core.asyncio.run(coro)
+        with patch.object(core, "uvloop", fake_uvloop):
+            assert run_async(answer()) == 42
+        fake_uvloop.run.assert_called_once()
+
+        with patch.object(core, "uvloop", None):
+            assert run_async(answer()) == 42
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_response_json_parses_raw_bytes(self, use_orjson):
+        """Test response bodies decode with orjson and with the stdlib fallback."""
+        import scraper.core as core
+
+        orjson_module = core.orjson if use_orjson else None
+        if use_orjson and orjson_module is None:
+            pytest.skip("orjson not installed")
+
+        resp = requests.Response()
+        resp._content = '{"success": true, "data": {"title": "守卫"}}'.encode("utf-8")
+        resp.encoding = "utf-8"
+
+        with patch.object(core, "orjson", orjson_module):
+            assert response_json(resp) == {"success": True, "data": {"title": "守卫"}}
+
+
+class TestInternCategoricalFields:
+    """Test suite for intern_categorical_fields."""
+
+    def test_equal_values_share_one_object(self):
+        """Test that equal type strings from separate works become identical."""
+        works = [{"type": "".join(["Video ", "Installation"]), "year": None} for _ in range(2)]
+        assert works[0]["type"] is not works[1]["type"]
+
+        intern_categorical_fields(works)
+
+        assert works[0]["type"] is works[1]["type"]
+        assert works[0]["year"] is None
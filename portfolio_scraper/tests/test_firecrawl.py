@@ -7,8 +7,10 @@ Tests FirecrawlMixin methods with mocked API responses:
 - discover_urls_with_scroll for infinite-scroll pages
 """
 
+import asyncio
 import json
 import os
+import threading
 import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch, PropertyMock
@@ -45,7 +47,7 @@ class TestExtractWorkDetails:
 
         scraper_with_mock_cache.extract_metadata_bs4 = MagicMock(return_value=partial_data)
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             # Mock markdown scrape response
             mock_response = MagicMock()
             mock_response.status_code = 200
@@ -66,7 +68,7 @@ class TestExtractWorkDetails:
         # Layer 1 fails
         scraper_with_mock_cache.extract_metadata_bs4 = MagicMock(return_value=None)
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             # Mock response for both markdown scrape (fails) and LLM extract (succeeds)
             # First call: markdown scrape fails, second call: LLM succeeds
             markdown_fail = MagicMock()
@@ -99,6 +101,17 @@ class TestExtractWorkDetails:
         scraper_with_mock_cache.extract_metadata_bs4.assert_not_called()
         assert result == sample_artwork_data
 
+    def test_cache_hit_bypasses_rate_limiter(self, scraper_with_mock_cache, sample_artwork_data):
+        """Test that cache hits never wait on (or lock) the rate limiter."""
+        url = "https://eventstructure.com/test-work"
+        scraper_with_mock_cache._save_cache(url, sample_artwork_data)
+        scraper_with_mock_cache.rate_limiter = MagicMock()
+
+        assert scraper_with_mock_cache.extract_work_details(url) is not None
+        assert scraper_with_mock_cache.extract_work_details_v2(url) is not None
+
+        scraper_with_mock_cache.rate_limiter.wait.assert_not_called()
+
     def test_saves_to_cache_after_extraction(self, scraper_with_mock_cache, sample_artwork_data):
         """Test that successful extraction is saved to cache."""
         url = "https://eventstructure.com/test"
@@ -141,7 +154,7 @@ class TestExtractWorkDetails:
         # Skip Layer 1
         scraper_with_mock_cache.extract_metadata_bs4 = MagicMock(return_value=None)
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             # Markdown scrape returns empty, then LLM: rate limited first, success second
             markdown_empty = MagicMock()
             markdown_empty.status_code = 200
@@ -165,13 +178,115 @@ class TestExtractWorkDetails:
             # Should have waited for backoff
             assert elapsed >= 1.0
 
+    def test_rate_limit_honors_retry_after(self, scraper_with_mock_cache, mock_firecrawl_response):
+        """Test that a 429 Retry-After header overrides the default backoff."""
+        url = "https://eventstructure.com/test"
+        scraper_with_mock_cache.extract_metadata_bs4 = MagicMock(return_value=None)
+
+        with patch("requests.Session.post") as mock_post, \
+             patch("scraper.firecrawl.time.sleep") as mock_sleep:
+            markdown_empty = MagicMock()
+            markdown_empty.status_code = 200
+            markdown_empty.json.return_value = {"data": {"markdown": ""}}
+
+            rate_limit_response = MagicMock()
+            rate_limit_response.status_code = 429
+            rate_limit_response.headers = {"Retry-After": "7"}
+
+            success_response = MagicMock()
+            success_response.status_code = 200
+            success_response.json.return_value = mock_firecrawl_response
+
+            mock_post.side_effect = [markdown_empty, rate_limit_response, success_response]
+
+            result = scraper_with_mock_cache.extract_work_details(url)
+
+            assert result is not None
+            mock_sleep.assert_any_call(7.0)
+
+    def test_rate_limit_backoff_adds_jitter(self, scraper_with_mock_cache):
+        """Test that 429 retries without Retry-After back off with jitter."""
+        rate_limit_response = MagicMock(status_code=429, headers={})
+        success_response = MagicMock(status_code=200)
+
+        with patch.object(scraper_with_mock_cache.fc_session, "post") as mock_post, \
+             patch("scraper.firecrawl.time.sleep") as mock_sleep, \
+             patch("scraper.firecrawl.random.random", return_value=0.25):
+            mock_post.side_effect = [rate_limit_response, rate_limit_response, success_response]
+
+            resp = scraper_with_mock_cache._post_with_retry("https://api", {}, backoff=2.0)
+
+        assert resp is success_response
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [2.25, 4.25]
+
+    def test_async_submit_honors_retry_after(self, scraper_with_mock_cache):
+        """Test the aiohttp submit path waits out a 429's Retry-After and retries."""
+        class FakeResponse:
+            def __init__(self, status, headers=None, body=None):
+                self.status = status
+                self.headers = headers or {}
+                self._body = body
+
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *exc):
+                return False
+
+            async def json(self, loads=None):
+                return self._body
+
+        session = MagicMock()
+        session.post.side_effect = [
+            FakeResponse(429, {"Retry-After": "3"}),
+            FakeResponse(200, body={"success": True, "id": "job-1"}),
+        ]
+        sleeps = []
+
+        async def fake_sleep(seconds):
+            sleeps.append(seconds)
+
+        with patch("scraper.firecrawl.asyncio.sleep", fake_sleep):
+            status, body = asyncio.run(
+                scraper_with_mock_cache._post_with_retry_async(session, "https://api", {})
+            )
+
+        assert (status, body) == (200, {"success": True, "id": "job-1"})
+        assert sleeps == [3.0]
+        assert session.post.call_count == 2
+
+    def test_rate_limit_retry_reuses_payload_and_checks_cache_once(
+        self, scraper_with_mock_cache, mock_firecrawl_response
+    ):
+        """Test that 429 retries resend the same payload without re-checking the cache."""
+        url = "https://eventstructure.com/test"
+        scraper_with_mock_cache.extract_metadata_bs4 = MagicMock(return_value=None)
+        scraper_with_mock_cache.scrape_markdown = MagicMock(return_value=None)
+
+        rate_limit_response = MagicMock(status_code=429, headers={})
+        success_response = MagicMock(status_code=200)
+        success_response.json.return_value = mock_firecrawl_response
+
+        with patch.object(scraper_with_mock_cache, "_load_cache", return_value=None) as mock_load, \
+             patch.object(scraper_with_mock_cache.fc_session, "post") as mock_post, \
+             patch("scraper.firecrawl.time.sleep"):
+            mock_post.side_effect = [rate_limit_response, rate_limit_response, success_response]
+
+            result = scraper_with_mock_cache.extract_work_details(url)
+
+        assert result is not None
+        mock_load.assert_called_once_with(url)
+        payloads = [c.kwargs["json"] for c in mock_post.call_args_list]
+        assert len(payloads) == 3
+        assert all(p is payloads[0] for p in payloads)
+
     def test_max_retries_exceeded(self, scraper_with_mock_cache, caplog):
         """Test that max retries returns None."""
         url = "https://eventstructure.com/test"
 
         scraper_with_mock_cache.extract_metadata_bs4 = MagicMock(return_value=None)
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             # Markdown empty, then always rate limited
             markdown_empty = MagicMock()
             markdown_empty.status_code = 200
@@ -193,7 +308,7 @@ class TestExtractWorkDetails:
 
         scraper_with_mock_cache.extract_metadata_bs4 = MagicMock(return_value=None)
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             # Markdown empty, then server error
             markdown_empty = MagicMock()
             markdown_empty.status_code = 200
@@ -216,7 +331,7 @@ class TestExtractWorkDetails:
 
         scraper_with_mock_cache.extract_metadata_bs4 = MagicMock(return_value=None)
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             # Markdown empty, then network error
             markdown_empty = MagicMock()
             markdown_empty.status_code = 200
@@ -269,7 +384,7 @@ class TestAgentSearch:
         for url in urls:
             scraper_with_mock_cache._save_extract_cache(url, prompt, sample_artwork_data)
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             result = scraper_with_mock_cache.agent_search(
                 prompt=prompt,
                 urls=urls,
@@ -295,8 +410,8 @@ class TestAgentSearch:
         # Cache only first URL
         scraper_with_mock_cache._save_extract_cache(urls[0], prompt, sample_artwork_data)
 
-        with patch("requests.post") as mock_post, \
-             patch("requests.get") as mock_get:
+        with patch("requests.Session.post") as mock_post, \
+             patch("requests.Session.get") as mock_get:
 
             # Mock job submission
             submit_response = MagicMock()
@@ -326,13 +441,67 @@ class TestAgentSearch:
             assert result["new_count"] == 1
             assert len(result["data"]) == 2
 
+    def test_batch_extraction_async_falls_back_without_aiohttp(
+        self, scraper_with_mock_cache, sample_artwork_data, monkeypatch
+    ):
+        """Test use_async falls back to the thread pool when aiohttp is missing."""
+        monkeypatch.setattr("scraper.firecrawl.aiohttp", None)
+        url = "https://eventstructure.com/work/1"
+
+        with patch("requests.Session.post") as mock_post, \
+             patch("requests.Session.get") as mock_get, \
+             patch("scraper.firecrawl.time.sleep"):
+            mock_post.return_value.status_code = 200
+            mock_post.return_value.json.return_value = {"success": True, "id": "job123"}
+            mock_get.return_value.status_code = 200
+            mock_get.return_value.json.return_value = {
+                "status": "completed",
+                "data": [{"url": url, **sample_artwork_data}],
+            }
+
+            result = scraper_with_mock_cache.agent_search(
+                prompt="Extract details", urls=[url], use_async=True
+            )
+
+        assert result["new_count"] == 1
+        mock_post.assert_called_once()
+
+    def test_batch_extraction_threads_keep_input_order(self, scraper_with_mock_cache):
+        """Test thread-pool results follow the input URLs, not completion order."""
+        import threading
+
+        urls = [f"https://eventstructure.com/work/{i}" for i in range(2)]
+        second_done = threading.Event()
+
+        def fake_post(endpoint, json=None, timeout=None):
+            job = json["urls"][0].rsplit("/", 1)[-1]
+            return MagicMock(status_code=200, json=MagicMock(return_value={"success": True, "id": job}))
+
+        def fake_get(endpoint, timeout=None):
+            job = endpoint.rsplit("/", 1)[-1]
+            if job == "0":
+                second_done.wait(5)  # first URL finishes last
+            resp = MagicMock(status_code=200, headers={})
+            resp.json.return_value = {"status": "completed", "data": [{"title": f"Work {job}"}]}
+            if job == "1":
+                second_done.set()
+            return resp
+
+        scraper_with_mock_cache.max_workers = 2
+        with patch("requests.Session.post", side_effect=fake_post), \
+             patch("requests.Session.get", side_effect=fake_get), \
+             patch("scraper.firecrawl.time.sleep"):
+            result = scraper_with_mock_cache.agent_search(prompt="Extract details", urls=urls)
+
+        assert [item["url"] for item in result["data"]] == urls
+
     def test_batch_extraction_job_polling(self, scraper_with_mock_cache):
         """Test that batch extraction polls job status."""
         urls = ["https://eventstructure.com/work/1"]
         prompt = "Extract"
 
-        with patch("requests.post") as mock_post, \
-             patch("requests.get") as mock_get:
+        with patch("requests.Session.post") as mock_post, \
+             patch("requests.Session.get") as mock_get:
 
             # Job submission
             submit_response = MagicMock()
@@ -360,6 +529,16 @@ class TestAgentSearch:
             assert result is not None
             assert len(result["data"]) == 1
 
+    def test_poll_delay_backs_off_and_honors_retry_after(self, scraper_with_mock_cache):
+        """Test poll delays grow to the cap and defer to Retry-After on 429."""
+        scraper = scraper_with_mock_cache
+        ok = MagicMock(status_code=200, headers={})
+        limited = MagicMock(status_code=429, headers={"Retry-After": "7"})
+
+        assert scraper._next_poll_delay(ok, 0.5) == pytest.approx(0.75)
+        assert scraper._next_poll_delay(ok, 9.0) == 10.0
+        assert scraper._next_poll_delay(limited, 0.5) == 7.0
+
     def test_agent_mode_open_search(self, scraper_with_mock_cache, caplog):
         """Test agent mode for open-ended search."""
         import logging
@@ -367,8 +546,8 @@ class TestAgentSearch:
 
         prompt = "Find all video installations"
 
-        with patch("requests.post") as mock_post, \
-             patch("requests.get") as mock_get:
+        with patch("requests.Session.post") as mock_post, \
+             patch("requests.Session.get") as mock_get:
 
             # Agent job submission
             submit_response = MagicMock()
@@ -392,6 +571,46 @@ class TestAgentSearch:
             assert result is not None
             assert len(result["data"]) == 2
 
+    def test_agent_mode_result_cached_per_query(self, scraper_with_mock_cache):
+        """Test a repeated agent search is served from the store without API calls."""
+        submit = MagicMock(status_code=200)
+        submit.json.return_value = {"success": True, "id": "agent123"}
+        complete = MagicMock(status_code=200, headers={})
+        complete.json.return_value = {"status": "completed", "data": [{"title": "Video Work"}]}
+
+        with patch("requests.Session.post", return_value=submit) as mock_post, \
+             patch("requests.Session.get", return_value=complete), \
+             patch("scraper.firecrawl.time.sleep"):
+            first = scraper_with_mock_cache.agent_search(prompt="Find video works")
+            second = scraper_with_mock_cache.agent_search(prompt="Find video works")
+            scraper_with_mock_cache.agent_search(prompt="Find video works", max_credits=10)
+
+        assert second == {"data": first["data"], "from_cache": True}
+        assert mock_post.call_count == 2  # second call cached; new limit is a new query
+
+    def test_batch_without_use_cache_skips_reads_but_saves(
+        self, scraper_with_mock_cache, sample_artwork_data
+    ):
+        """Test use_cache=False re-extracts cached URLs and refreshes their entries."""
+        url = "https://eventstructure.com/work/1"
+        prompt = "Extract details"
+        scraper_with_mock_cache._save_extract_cache(url, prompt, {"url": url, "title": "Stale"})
+        scraper_with_mock_cache.use_cache = False
+
+        submit = MagicMock(status_code=200)
+        submit.json.return_value = {"success": True, "id": "job123"}
+        complete = MagicMock(status_code=200, headers={})
+        complete.json.return_value = {"status": "completed", "data": [{"url": url, "title": "Fresh"}]}
+
+        with patch("requests.Session.post", return_value=submit) as mock_post, \
+             patch("requests.Session.get", return_value=complete), \
+             patch("scraper.firecrawl.time.sleep"):
+            result = scraper_with_mock_cache.agent_search(prompt=prompt, urls=[url])
+
+        mock_post.assert_called_once()
+        assert result["cached_count"] == 0
+        assert scraper_with_mock_cache._load_extract_cache(url, prompt)["title"] == "Fresh"
+
     def test_extraction_level_selects_schema(self, scraper_with_mock_cache, caplog):
         """Test that extraction_level selects correct schema."""
         import logging
@@ -402,8 +621,8 @@ class TestAgentSearch:
         for level in levels:
             caplog.clear()
 
-            with patch("requests.post") as mock_post, \
-                 patch("requests.get") as mock_get:
+            with patch("requests.Session.post") as mock_post, \
+                 patch("requests.Session.get") as mock_get:
                 # Mock successful job submission and completion with data
                 submit_response = MagicMock()
                 submit_response.status_code = 200
@@ -429,6 +648,125 @@ class TestAgentSearch:
                 assert result is not None
 
 
+
+class TestExtractWorksBatch:
+    """Test suite for chunked batch extraction."""
+
+    def test_chunks_uncached_urls_and_validates_titles(
+        self, scraper_with_mock_cache, sample_artwork_data
+    ):
+        """Test cache hits are reused and only misses are batched."""
+        scraper = scraper_with_mock_cache
+        cached_url = sample_artwork_data["url"]
+        scraper._save_cache(cached_url, sample_artwork_data)
+        urls = [cached_url] + [f"https://eventstructure.com/work-{i}" for i in range(3)]
+
+        def fake_batch(chunk):
+            return {
+                url: {"title": "Guard, I" if url.endswith("2") else url.rsplit("/", 1)[-1],
+                      "year": "2020", "type": "Video"}
+                for url in chunk
+            }
+
+        scraper._batch_scrape_with_schema = MagicMock(side_effect=fake_batch)
+
+        results = scraper.extract_works_batch(urls, batch_size=2)
+
+        assert scraper._batch_scrape_with_schema.call_count == 2
+        assert results[cached_url]["title"] == sample_artwork_data["title"]
+        assert results[urls[1]]["title"] == "work-0"
+        assert results[urls[3]] is None  # sidebar title rejected
+
+    def test_batch_results_get_title_cleanup_before_caching(self, scraper_with_mock_cache):
+        """Test batch results are cleaned like v2 extractions before they are cached."""
+        scraper = scraper_with_mock_cache
+        urls = ["https://eventstructure.com/bot", "https://eventstructure.com/exist"]
+        scraper._batch_scrape_with_schema = MagicMock(return_value={
+            urls[0]: {"title": "bot / 观察者 / 观察者", "year": "2020", "type": "Software"},
+            urls[1]: {"title": "sculpture", "year": "2019", "type": ""},
+        })
+
+        results = scraper.extract_works_batch(urls)
+
+        assert (results[urls[0]]["title"], results[urls[0]]["title_cn"]) == ("bot", "观察者")
+        assert (results[urls[1]]["title"], results[urls[1]]["type"]) == ("Exist", "Sculpture")
+        assert scraper._load_cache(urls[0])["title"] == "bot"
+        assert scraper._load_cache(urls[1])["title"] == "Exist"
+
+    def test_chunks_run_concurrently(self, scraper_with_mock_cache):
+        """Test batch jobs for separate chunks are in flight at the same time."""
+        scraper = scraper_with_mock_cache
+        scraper.max_workers = 2
+        urls = [f"https://eventstructure.com/work-{i}" for i in range(4)]
+        both_submitted = threading.Barrier(2, timeout=5)
+
+        def fake_batch(chunk):
+            both_submitted.wait()  # Raises BrokenBarrierError if chunks ran one by one
+            return {url: {"title": url.rsplit("/", 1)[-1], "year": "2020", "type": "Video"} for url in chunk}
+
+        scraper._batch_scrape_with_schema = MagicMock(side_effect=fake_batch)
+
+        results = scraper.extract_works_batch(urls, batch_size=2)
+
+        assert [results[url]["title"] for url in urls] == ["work-0", "work-1", "work-2", "work-3"]
+
+    def test_batch_scrape_maps_results_by_source_url(self, scraper_with_mock_cache):
+        """Test batch-scrape documents are matched by sourceURL, not position."""
+        scraper = scraper_with_mock_cache
+        scraper.firecrawl_key = "fc-test"
+        urls = ["https://eventstructure.com/a", "https://eventstructure.com/b"]
+
+        submit = MagicMock(status_code=200)
+        submit.json.return_value = {"success": True, "id": "job-1"}
+        status = MagicMock(status_code=200)
+        status.json.return_value = {
+            "status": "completed",
+            "data": [
+                {"json": {"title": "B"}, "metadata": {"sourceURL": urls[1] + "/"}},
+                {"json": {}, "metadata": {"sourceURL": urls[0]}},
+            ],
+        }
+
+        with patch.object(scraper.fc_session, "post", return_value=submit) as mock_post, \
+             patch.object(scraper.fc_session, "get", return_value=status), \
+             patch("scraper.firecrawl.time.sleep"):
+            results = scraper._batch_scrape_with_schema(urls)
+
+        assert mock_post.call_args.args[0].endswith("/v2/batch/scrape")
+        assert mock_post.call_args.kwargs["json"]["urls"] == urls
+        assert results[urls[0]] is None
+        assert results[urls[1]] == {"title": "B", "url": urls[1], "source": "batch_scrape_v2"}
+
+    def test_batch_scrape_retries_failed_result_pages(self, scraper_with_mock_cache):
+        """Test a failed "next" page fetch is retried instead of parsed as data."""
+        scraper = scraper_with_mock_cache
+        scraper.firecrawl_key = "fc-test"
+        urls = ["https://eventstructure.com/a", "https://eventstructure.com/b"]
+
+        submit = MagicMock(status_code=200)
+        submit.json.return_value = {"success": True, "id": "job-1"}
+        first = MagicMock(status_code=200)
+        first.json.return_value = {
+            "status": "completed",
+            "data": [{"json": {"title": "A"}, "metadata": {"sourceURL": urls[0]}}],
+            "next": "https://api.firecrawl.dev/v2/batch/scrape/job-1?skip=1",
+        }
+        busy = MagicMock(status_code=429, headers={"Retry-After": "1"})
+        busy.json.return_value = {"error": "rate limited"}
+        second = MagicMock(status_code=200)
+        second.json.return_value = {
+            "data": [{"json": {"title": "B"}, "metadata": {"sourceURL": urls[1]}}],
+        }
+
+        with patch.object(scraper.fc_session, "post", return_value=submit), \
+             patch.object(scraper.fc_session, "get", side_effect=[first, busy, second]), \
+             patch("scraper.firecrawl.time.sleep"):
+            results = scraper._batch_scrape_with_schema(urls)
+
+        assert results[urls[0]]["title"] == "A"
+        assert results[urls[1]]["title"] == "B"
+
+
 class TestDiscoverUrlsWithScroll:
     """Test suite for discover_urls_with_scroll method."""
 
@@ -443,7 +781,7 @@ class TestDiscoverUrlsWithScroll:
         with open(cache_path, "w") as f:
             json.dump(cached_urls, f)
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             result = scraper_with_mock_cache.discover_urls_with_scroll(url, scroll_mode)
 
             # Should not call API
@@ -452,12 +790,10 @@ class TestDiscoverUrlsWithScroll:
 
     def test_horizontal_scroll_mode(self, scraper_with_mock_cache):
         """Test horizontal scrolling action sequence."""
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 200
-            mock_response.json.return_value = {
-                "data": {"extract": {"urls": []}}
-            }
+            mock_response.json.return_value = {"data": {"links": []}}
             mock_post.return_value = mock_response
 
             scraper_with_mock_cache.discover_urls_with_scroll(
@@ -476,17 +812,18 @@ class TestDiscoverUrlsWithScroll:
 
     def test_saves_discovered_urls_to_cache(self, scraper_with_mock_cache, temp_cache_dir):
         """Test that discovered URLs are saved to cache."""
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {
                 "data": {
-                    "extract": {
-                        "urls": [
-                            {"url": "https://eventstructure.com/work/1"},
-                            {"url": "https://eventstructure.com/work/2"}
-                        ]
-                    }
+                    "links": [
+                        "https://eventstructure.com/work/1",
+                        "https://eventstructure.com/work/2",
+                        "https://eventstructure.com/work/1",
+                        "https://eventstructure.com/about",
+                        "https://twitter.com/aaajiao",
+                    ]
                 }
             }
             mock_post.return_value = mock_response
@@ -495,7 +832,13 @@ class TestDiscoverUrlsWithScroll:
                 "https://eventstructure.com"
             )
 
-            assert len(result) == 2
+            assert result == [
+                "https://eventstructure.com/work/1",
+                "https://eventstructure.com/work/2",
+            ]
+            payload = mock_post.call_args[1]["json"]
+            assert payload["formats"] == ["links"]
+            assert "extract" not in payload
 
             # Check cache was created
             cache_path = scraper_with_mock_cache._get_discovery_cache_path(
@@ -512,7 +855,7 @@ class TestDiscoverUrlsWithScroll:
         if os.path.exists(cache_path):
             os.remove(cache_path)
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_post.side_effect = Exception("Timeout")
 
             result = scraper_with_mock_cache.discover_urls_with_scroll(
@@ -530,7 +873,7 @@ class TestDiscoverUrlsWithMap:
 
     def test_discovers_artwork_urls(self, scraper_with_mock_cache):
         """Test Map API discovers and filters artwork URLs."""
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {
@@ -552,9 +895,28 @@ class TestDiscoverUrlsWithMap:
             assert "https://eventstructure.com/work/artwork-2" in result
             assert "https://eventstructure.com/about" not in result
 
+    def test_accepts_link_objects(self, scraper_with_mock_cache):
+        """Test v2-style {"url": ...} link objects are filtered like strings."""
+        with patch("requests.Session.post") as mock_post:
+            mock_response = MagicMock(status_code=200)
+            mock_response.json.return_value = {
+                "success": True,
+                "links": [
+                    {"url": "https://eventstructure.com/work/artwork-1", "title": "A"},
+                    {"url": "https://eventstructure.com/cv"},
+                    {"title": "no url"},
+                    "https://eventstructure.com/work/artwork-1",
+                ],
+            }
+            mock_post.return_value = mock_response
+
+            result = scraper_with_mock_cache.discover_urls_with_map()
+
+        assert result == ["https://eventstructure.com/work/artwork-1"]
+
     def test_uses_search_parameter(self, scraper_with_mock_cache):
         """Test that search parameter is passed to Map API."""
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {"success": True, "links": []}
@@ -568,7 +930,7 @@ class TestDiscoverUrlsWithMap:
 
     def test_handles_api_failure(self, scraper_with_mock_cache):
         """Test graceful handling of API failures."""
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 500
             mock_post.return_value = mock_response
@@ -590,7 +952,7 @@ class TestScrapeWithJson:
         """Test successful JSON extraction from scrape endpoint."""
         url = "https://eventstructure.com/test-work"
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {
@@ -623,7 +985,7 @@ class TestScrapeWithJson:
         """Test that null/N/A placeholder values are cleaned."""
         url = "https://eventstructure.com/test-work"
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {
@@ -651,7 +1013,7 @@ class TestScrapeWithJson:
         """Test that SPA-aware actions are included when wait_for_spa=True."""
         url = "https://eventstructure.com/test-work"
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {
@@ -671,7 +1033,7 @@ class TestScrapeWithJson:
         """Test graceful handling of API failure."""
         url = "https://eventstructure.com/test-work"
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 500
             mock_post.return_value = mock_response
@@ -689,7 +1051,7 @@ class TestScrapeWithJson:
         """Test that year normalization is applied."""
         url = "https://eventstructure.com/test-work"
 
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {
@@ -711,7 +1073,7 @@ class TestSPAAwareParameters:
 
     def test_scrape_markdown_includes_exclude_tags(self, scraper_with_mock_cache):
         """Test that scrape_markdown includes excludeTags and waitFor."""
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {
@@ -728,7 +1090,7 @@ class TestSPAAwareParameters:
 
     def test_extract_with_llm_includes_spa_params(self, scraper_with_mock_cache):
         """Test that _extract_with_llm includes SPA-aware parameters."""
-        with patch("requests.post") as mock_post:
+        with patch("requests.Session.post") as mock_post:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.json.return_value = {
@@ -749,6 +1111,25 @@ class TestSPAAwareParameters:
             assert "onlyMainContent" in payload
 
 
+    def test_extract_with_llm_splits_bilingual_title(self, scraper_with_mock_cache):
+        """Test 'English / 中文' titles are split on the first separator."""
+        with patch("requests.Session.post") as mock_post:
+            mock_response = MagicMock()
+            mock_response.status_code = 200
+            mock_response.json.return_value = {
+                "data": {
+                    "json": {"title": "Guard / 守卫", "year": "2024", "category": "Video"}
+                }
+            }
+            mock_post.return_value = mock_response
+
+            work = scraper_with_mock_cache._extract_with_llm(
+                "https://eventstructure.com/guard"
+            )
+
+        assert work["title"] == "Guard"
+        assert work["title_cn"] == "守卫"
+
 class TestDescriptionContamination:
     """Test suite for _is_description_contaminated method."""
 
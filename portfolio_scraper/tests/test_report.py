@@ -50,6 +50,57 @@ class TestSaveToJson:
         assert "测试作品" in content
         assert "\\u" not in content  # No unicode escapes
 
+    def test_interrupted_save_keeps_previous_file(self, scraper_with_mock_cache, tmp_path):
+        """Test a failed save leaves the old JSON intact and no temp file behind."""
+        output_file = tmp_path / "works.json"
+        scraper_with_mock_cache.works = [{"title": "Old"}]
+        scraper_with_mock_cache.save_to_json(str(output_file))
+
+        scraper_with_mock_cache.works = [{"title": "New"}]
+        with patch("scraper.report.os.replace", side_effect=KeyboardInterrupt):
+            with pytest.raises(KeyboardInterrupt):
+                scraper_with_mock_cache.save_to_json(str(output_file))
+
+        assert json.loads(output_file.read_text(encoding="utf-8")) == [{"title": "Old"}]
+        assert not (tmp_path / "works.json.tmp").exists()
+
+    @pytest.mark.parametrize("count", [0, 1, 3])
+    def test_streamed_output_matches_single_dump(
+        self, scraper_with_mock_cache, sample_artwork_data, tmp_path, count
+    ):
+        """Test works written one at a time give the same file as dumping the list."""
+        works = [dict(sample_artwork_data, title=f"作品 {i}", tags=[]) for i in range(count)]
+        scraper_with_mock_cache.works = works
+        output_file = tmp_path / "works.json"
+
+        scraper_with_mock_cache.save_to_json(str(output_file))
+
+        assert output_file.read_text(encoding="utf-8") == json.dumps(works, ensure_ascii=False, indent=2)
+
+    def test_failure_mid_stream_removes_temp_file(self, scraper_with_mock_cache, tmp_path):
+        """Test a work that fails to serialize leaves the old JSON and no temp file."""
+        output_file = tmp_path / "works.json"
+        scraper_with_mock_cache.works = [{"title": "Old"}]
+        scraper_with_mock_cache.save_to_json(str(output_file))
+
+        scraper_with_mock_cache.works = [{"title": "New"}, {"title": object()}]
+        with pytest.raises(TypeError):
+            scraper_with_mock_cache.save_to_json(str(output_file))
+
+        assert json.loads(output_file.read_text(encoding="utf-8")) == [{"title": "Old"}]
+        assert not (tmp_path / "works.json.tmp").exists()
+
+    def test_load_from_json_round_trips(self, scraper_with_mock_cache, sample_artwork_data, tmp_path):
+        """Test that load_from_json reads back what save_to_json wrote."""
+        scraper_with_mock_cache.works = [sample_artwork_data, {"title_cn": "测试作品"}]
+        output_file = tmp_path / "test.json"
+
+        scraper_with_mock_cache.save_to_json(str(output_file))
+
+        assert scraper_with_mock_cache.load_from_json(str(output_file)) == scraper_with_mock_cache.works
+        with pytest.raises(FileNotFoundError):
+            scraper_with_mock_cache.load_from_json(str(tmp_path / "missing.json"))
+
 
 class TestGenerateMarkdown:
     """Test suite for generate_markdown method."""
@@ -106,6 +157,32 @@ class TestGenerateMarkdown:
         assert "English Title" in content
         assert "中文标题" in content
 
+    def test_work_block_lists_fields_in_order_and_skips_empty(self, scraper_with_mock_cache, tmp_path):
+        """Test the exact per-work block: set fields in order, empty ones omitted."""
+        scraper_with_mock_cache.works = [
+            {
+                "title": "Work",
+                "url": "http://test.com/w",
+                "year": "2024",
+                "materials": "",
+                "type": "Installation",
+                "description_en": "Desc",
+            }
+        ]
+        output_file = tmp_path / "test.md"
+
+        scraper_with_mock_cache.generate_markdown(str(output_file))
+
+        content = output_file.read_text(encoding="utf-8")
+        assert content.endswith(
+            "## 2024\n\n"
+            "### [Work](http://test.com/w)\n\n"
+            "**Year**: 2024\n\n"
+            "**Type**: Installation\n\n"
+            "**Description**: Desc\n\n"
+            "---\n"
+        )
+
 
 class TestGenerateAgentReport:
     """Test suite for generate_agent_report method."""
@@ -115,7 +192,7 @@ class TestGenerateAgentReport:
         data = {"data": [{"title": "Test", "url": "http://test.com"}]}
         output_dir = tmp_path / "report_output"
         
-        with patch("requests.get"):  # Mock image download
+        with patch("requests.Session.get"):  # Mock image download
             scraper_with_mock_cache.generate_agent_report(
                 data, str(output_dir), prompt="test"
             )
@@ -136,7 +213,7 @@ class TestGenerateAgentReport:
         }
         output_dir = tmp_path / "report"
         
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 200
             mock_response.content = b"fake image data"
@@ -166,7 +243,7 @@ class TestGenerateAgentReport:
         }
         output_dir = tmp_path / "report"
         
-        with patch("requests.get"):
+        with patch("requests.Session.get"):
             report_path = scraper_with_mock_cache.generate_agent_report(
                 data, str(output_dir), prompt="test", extraction_level="full"
             )
@@ -185,7 +262,7 @@ class TestGenerateAgentReport:
         data = {"data": [{"title": "Test"}]}
         output_dir = tmp_path / "report"
         
-        with patch("requests.get"):
+        with patch("requests.Session.get"):
             scraper_with_mock_cache.generate_agent_report(
                 data, str(output_dir), prompt="test prompt"
             )
@@ -210,9 +287,85 @@ class TestGenerateAgentReport:
         }
         output_dir = tmp_path / "report"
         
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_get.side_effect = Exception("Network error")
             
             scraper_with_mock_cache.generate_agent_report(data, str(output_dir))
         
         assert "Image download failed" in caplog.text
+
+    def test_split_mode_creates_item_directories(self, scraper_with_mock_cache, tmp_path):
+        """Test split mode writes one report and data file per item plus an index."""
+        data = {"data": [{"title": "First Work"}, {"title": "Second/Work"}]}
+        output_dir = tmp_path / "report"
+
+        with patch("requests.Session.get"):
+            index_path = scraper_with_mock_cache.generate_agent_report(
+                data, str(output_dir), output_mode="split"
+            )
+
+        assert os.path.basename(index_path).startswith("index_")
+        for name in ("01_First Work", "02_Second_Work"):
+            item_dir = output_dir / name
+            assert (item_dir / "images").is_dir()
+            assert (item_dir / "report.md").exists()
+            assert (item_dir / "data.json").exists()
+
+    def test_split_index_links_match_item_directories(self, scraper_with_mock_cache, tmp_path):
+        """Test index links reuse the item directory names, including untitled items."""
+        data = {"data": [{"title": "First Work"}, {"year": "2020"}]}
+        output_dir = tmp_path / "report"
+
+        with patch("requests.Session.get"):
+            index_path = scraper_with_mock_cache.generate_agent_report(
+                data, str(output_dir), output_mode="split"
+            )
+
+        with open(index_path, encoding="utf-8") as f:
+            index = f.read()
+        assert "1. [First Work](./01_First Work/report.md)" in index
+        assert "2. [作品 2](./02_artwork_2/report.md)" in index
+        assert (output_dir / "02_artwork_2" / "report.md").exists()
+
+    def test_plans_unique_http_images_before_downloading(self, scraper_with_mock_cache, tmp_path):
+        """Test duplicate and non-http image URLs are dropped before any request."""
+        data = {
+            "data": [
+                {"title": "A", "high_res_images": ["https://example.com/a.png?w=2", "data:image/png;base64,xx"]},
+                {"title": "B", "images": ["https://example.com/a.png?w=2", "https://example.com/b"]},
+            ]
+        }
+        output_dir = tmp_path / "report"
+
+        with patch("requests.Session.get") as mock_get:
+            mock_get.return_value = MagicMock(status_code=200, content=b"img")
+            scraper_with_mock_cache.generate_agent_report(data, str(output_dir))
+
+        assert [c.args[0] for c in mock_get.call_args_list] == [
+            "https://example.com/a.png?w=2",
+            "https://example.com/b",
+        ]
+        (images_dir,) = [d for d in output_dir.iterdir() if d.is_dir()]
+        assert sorted(p.name for p in images_dir.iterdir()) == ["01.png", "02.jpg"]
+
+    def test_use_async_downloads_on_event_loop(self, scraper_with_mock_cache, tmp_path):
+        """Test use_async hands the planned images to the aiohttp downloader."""
+        data = {"data": [{"title": "A", "images": ["https://example.com/a.png", "https://example.com/b"]}]}
+        output_dir = tmp_path / "report"
+
+        async def _fake(jobs):
+            return [None if url.endswith("/b") else path for url, path in jobs]
+
+        with patch("scraper.report.aiohttp", MagicMock()), \
+             patch.object(scraper_with_mock_cache, "_download_images_async", side_effect=_fake) as mock_async, \
+             patch("requests.Session.get") as mock_get:
+            report_path = scraper_with_mock_cache.generate_agent_report(
+                data, str(output_dir), use_async=True
+            )
+
+        mock_get.assert_not_called()
+        jobs = mock_async.call_args.args[0]
+        assert [os.path.basename(path) for _, path in jobs] == ["01.png", "02.jpg"]
+        content = open(report_path, encoding="utf-8").read()
+        assert "/01.png" in content
+        assert "/02.jpg" not in content